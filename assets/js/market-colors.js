@@ -1,32 +1,15 @@
 /**
- * 시황 브리핑 테이블 색상 자동 적용
- * 상승(+): 초록색, 하락(-): 빨간색
+ * 상승/하락 색상 (클래스 없이 생성된 이전 포스트용)
+ * 새 브리핑은 PostGenerator가 .chg-up/.chg-down 클래스를 직접 붙이므로 이 스크립트를 로드하지 않는다.
+ * 표의 마지막 열만 검사하고 innerHTML은 건드리지 않는다.
  */
 document.addEventListener('DOMContentLoaded', function() {
-  // 모든 테이블 셀 검사
-  const cells = document.querySelectorAll('td');
-
-  cells.forEach(cell => {
+  document.querySelectorAll('.post-content td:last-child, .post-content td:nth-child(3)').forEach(function(cell) {
     const text = cell.textContent.trim();
-
-    // +로 시작하는 퍼센트 (상승)
-    if (/^\+\d/.test(text) || /^\+0\./.test(text)) {
-      cell.style.color = '#00b894';
-      cell.style.fontWeight = '600';
-    }
-    // -로 시작하는 퍼센트 (하락)
-    else if (/^-\d/.test(text) || /^-0\./.test(text)) {
-      cell.style.color = '#d63031';
-      cell.style.fontWeight = '600';
+    if (/^\+\d/.test(text)) {
+      cell.classList.add('chg-up');
+    } else if (/^-\d/.test(text)) {
+      cell.classList.add('chg-down');
     }
   });
-
-  // Fear & Greed 지수 색상
-  const content = document.querySelector('.post-content');
-  if (content) {
-    content.innerHTML = content.innerHTML
-      .replace(/🟢/g, '<span style="color:#00b894;font-size:1.2em;">🟢</span>')
-      .replace(/🔴/g, '<span style="color:#d63031;font-size:1.2em;">🔴</span>')
-      .replace(/🟡/g, '<span style="color:#fdcb6e;font-size:1.2em;">🟡</span>');
-  }
 });
@@ -0,0 +1,129 @@
+// 사이트 검색 - scripts/search_index.py가 만든 샤드 인덱스를 필요한 만큼만 로딩
+// 토큰화/샤드 규칙은 search_index.py와 동일하게 유지할 것
+// (색인에는 한글 글자 하나씩도 들어 있어 1글자 검색어는 긴 단어 안의 글자와도 일치)
+
+(function() {
+  const root = document.getElementById('site-search');
+  if (!root) return;
+
+  const base = root.dataset.index;
+  const input = root.querySelector('input[type="search"]');
+  const list = root.querySelector('.search-results');
+  const status = root.querySelector('.search-status');
+  const baseurl = root.dataset.baseurl || '';
+  const encoder = new TextEncoder();
+  const MAX_RESULTS = 50;
+
+  let metaPromise = null;
+  const shardPromises = {};
+
+  function fetchJson(name) {
+    return fetch(base + '/' + name).then(function(res) {
+      if (!res.ok) throw new Error(name + ' ' + res.status);
+      return res.json();
+    });
+  }
+
+  function loadMeta() {
+    if (!metaPromise) metaPromise = fetchJson('meta.json');
+    return metaPromise;
+  }
+
+  function loadShard(n) {
+    if (!shardPromises[n]) {
+      shardPromises[n] = fetchJson('shard-' + String(n).padStart(2, '0') + '.json');
+    }
+    return shardPromises[n];
+  }
+
+  function fnv1a(token) {
+    let h = 0x811c9dc5;
+    encoder.encode(token).forEach(function(byte) {
+      h = Math.imul(h ^ byte, 0x01000193) >>> 0;
+    });
+    return h;
+  }
+
+  function tokenize(text) {
+    const tokens = [];
+    (text.toLowerCase().match(/[가-힣]+|[a-z0-9]+/g) || []).forEach(function(run) {
+      if (run[0] >= '가' && run[0] <= '힣') {
+        if (run.length === 1) tokens.push(run);
+        for (let i = 0; i < run.length - 1; i++) tokens.push(run.slice(i, i + 2));
+      } else if (run.length >= 2 && !/^\d+$/.test(run)) {
+        tokens.push(run);
+      }
+    });
+    return Array.from(new Set(tokens));
+  }
+
+  function decode(deltas) {
+    let id = 0;
+    return deltas.map(function(d, i) { id = i === 0 ? d : id + d; return id; });
+  }
+
+  function render(docs, ids, query) {
+    list.innerHTML = '';
+    ids.slice(0, MAX_RESULTS).forEach(function(id) {
+      const doc = docs[id];
+      const li = document.createElement('li');
+      const meta = document.createElement('span');
+      meta.className = 'post-meta';
+      meta.textContent = doc[2];
+      const link = document.createElement('a');
+      link.className = 'post-link';
+      link.href = baseurl + doc[0];
+      link.textContent = doc[1];
+      li.appendChild(meta);
+      li.appendChild(link);
+      list.appendChild(li);
+    });
+    status.textContent = ids.length
+      ? '"' + query + '" 검색 결과 ' + ids.length + '건'
+      : '"' + query + '"에 대한 결과가 없습니다.';
+  }
+
+  function search(query) {
+    const tokens = tokenize(query);
+    if (!tokens.length) {
+      list.innerHTML = '';
+      status.textContent = '';
+      return;
+    }
+
+    loadMeta().then(function(meta) {
+      const shards = Array.from(new Set(tokens.map(function(t) { return fnv1a(t) % meta.shards; })));
+      return Promise.all(shards.map(loadShard)).then(function(loaded) {
+        const byShard = {};
+        shards.forEach(function(n, i) { byShard[n] = loaded[i]; });
+
+        // 일치한 토큰 수 내림차순, 같으면 최신순(문서 ID 오름차순)
+        const scores = new Map();
+        tokens.forEach(function(t) {
+          const postings = byShard[fnv1a(t) % meta.shards][t];
+          if (postings) decode(postings).forEach(function(id) { scores.set(id, (scores.get(id) || 0) + 1); });
+        });
+        const ids = Array.from(scores.keys()).sort(function(a, b) {
+          return (scores.get(b) - scores.get(a)) || (a - b);
+        });
+        // 모든 토큰이 일치하는 문서가 있으면 그것만 표시
+        const exact = ids.filter(function(id) { return scores.get(id) === tokens.length; });
+        render(meta.docs, exact.length ? exact : ids, query);
+      });
+    }).catch(function() {
+      status.textContent = '검색 인덱스를 불러오지 못했습니다.';
+    });
+  }
+
+  let timer = null;
+  input.addEventListener('input', function() {
+    clearTimeout(timer);
+    timer = setTimeout(function() { search(input.value.trim()); }, 150);
+  });
+
+  const initial = new URLSearchParams(window.location.search).get('q');
+  if (initial) {
+    input.value = initial;
+    search(initial);
+  }
+})();
@@ -0,0 +1 @@
+"""파이프라인 성능 벤치마크"""
@@ -0,0 +1,292 @@
+"""렌더링/요약/배치 처리 벤치마크
+
+합성 데이터(benchmarks/synthetic.py)로 핫패스를 심볼 수별로 측정하고,
+저장된 기준값(benchmarks/baseline.json)보다 느려지거나 메모리를 더 쓰면 실패한다.
+
+    post_content    PostGenerator._build_post_content (스파크라인 포함)
+    telegram        TelegramNotifier._build_full_briefing
+    summary         main.generate_simple_summary (수집 단계의 컬럼형 스냅샷 사용)
+    batch           DataFetcher._process_batch_data
+    breadth         breadth.compute_market_breadth (구성 종목 n개를 두 지수로 나눔, 1년 종가)
+    regime          regime.compute_regime (대상 카테고리 시리즈의 상관 행렬, 80거래일 히스토리)
+    anomaly         anomaly.detect_anomalies (히스토리로 초기화한 누적 통계에 하루치 반영)
+    rolling         rolling_stats.RollingStatsCache.update + indicators (80일로 채운 캐시에 하루치 반영)
+
+시간은 매 실행마다 같은 고정 작업(보정 루프)의 시간으로 나눈 값을 비교하므로,
+기준값을 만든 머신과 다른 머신에서도 대략 비교할 수 있다.
+메모리는 tracemalloc 최대 사용량(peak)이며, 시간 측정과는 따로 한 번 실행한다.
+
+사용법:
+    python benchmarks/bench.py                          # 측정 + 기준값 비교
+    python benchmarks/bench.py --sizes 50 500           # 일부 크기만
+    python benchmarks/bench.py --cases batch            # 일부 케이스만
+    python benchmarks/bench.py --update-baseline        # 기준값 갱신
+"""
+import argparse
+import itertools
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import make_batch_frame, make_history, make_market_data, make_symbols  # noqa: E402
+
+from logger import logger  # noqa: E402
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+BASELINE_VERSION = 1
+
+DEFAULT_SIZES = (50, 500, 2000, 10000)
+
+# 케이스당 추가 반복 측정 예산 (초). 한 샘플이 이보다 길면 한 번만 잰다
+TIME_BUDGET = 1.0
+MAX_REPEAT = 10
+
+# 허용 범위 (기준값 대비 증가율). 공유 CI 러너의 시간 잡음이 ±30% 안팎이라 시간은 2배까지 허용
+TIME_TOLERANCE = 1.0
+MEMORY_TOLERANCE = 0.2
+# 이보다 작은 메모리 차이는 잡음으로 본다 (KiB)
+MEMORY_SLACK_KIB = 64
+
+Runner = Callable[[], object]
+
+
+def _prepare_post_content(n: int) -> Runner:
+    from post_generator import PostGenerator
+    data = make_market_data(n)
+    generator = PostGenerator(history=make_history(data))
+    now = datetime(2026, 1, 29, 6)
+    return lambda: generator._build_post_content(data, "요약", now)
+
+
+def _prepare_telegram(n: int) -> Runner:
+    from telegram_notifier import TelegramNotifier
+    data = make_market_data(n)
+    notifier = TelegramNotifier()
+    return lambda: notifier._build_full_briefing(data, "https://example.com/post")
+
+
+def _prepare_summary(n: int) -> Runner:
+    from main import generate_simple_summary
+    from market_snapshot import MarketSnapshot
+    data = make_market_data(n)
+    # 실행 시에는 수집 단계(DataFetcher)가 만든 스냅샷을 넘긴다
+    snapshot = MarketSnapshot.from_market_data(data)
+    return lambda: generate_simple_summary(data, snapshot)
+
+
+def _prepare_batch(n: int) -> Runner:
+    from data_fetcher import DataFetcher
+    symbol_map = make_symbols(n)
+    frame = make_batch_frame(list(symbol_map))
+    return lambda: DataFetcher()._process_batch_data(frame, symbol_map)
+
+
+def _prepare_breadth(n: int) -> Runner:
+    from breadth import BreadthIndex, compute_market_breadth
+    from market_snapshot import batch_fields
+    symbols = [f"SYN{i:05d}" for i in range(n)]
+    closes = batch_fields(make_batch_frame(symbols, days=252), symbols)["Close"]
+    half = n // 2
+    indices = [BreadthIndex(key, key, tuple(part), tuple(part))
+               for key, part in (("a", symbols[:half]), ("b", symbols[half:]))]
+    return lambda: compute_market_breadth(closes, indices)
+
+
+def _prepare_regime(n: int) -> Runner:
+    from regime import compute_regime
+    history = make_history(make_market_data(n), days=80)
+    return lambda: compute_regime(history)
+
+
+def _prepare_anomaly(n: int) -> Runner:
+    from anomaly import ReturnStats, detect_anomalies
+    from market_snapshot import MarketSnapshot
+    data = make_market_data(n)
+    snapshot = MarketSnapshot.from_market_data(data)
+    stats = ReturnStats()
+    stats.seed(make_history(data, days=80), snapshot.series_keys())
+    # 매 실행이 같은 하루치 갱신이 되도록 복사본에 반영
+    return lambda: detect_anomalies(snapshot, stats.copy())
+
+
+def _prepare_rolling(n: int) -> Runner:
+    import numpy as np
+    import pandas as pd
+
+    from price_history import PriceHistory
+    from rolling_stats import RollingStatsCache
+    frame = make_history(make_market_data(n), days=80).frame
+    cache = RollingStatsCache()
+    cache.update(PriceHistory(frame))
+    last, days = frame.iloc[-1].to_numpy(), itertools.count(1)
+
+    def run():
+        # 매 실행이 다음 날 하루치가 되도록 날짜를 하루씩 넘김
+        day = next(days)
+        row = pd.DataFrame((last * (1 + 0.001 * np.sin(day + np.arange(len(last)))))[None, :], columns=frame.columns,
+                           index=pd.DatetimeIndex([frame.index[-1] + pd.Timedelta(days=day)], name="date"))
+        cache.update(PriceHistory(row))
+        return cache.indicators()
+    return run
+
+
+# 케이스 이름 → 준비 함수 (준비 시간은 측정에서 제외)
+CASES: Dict[str, Callable[[int], Runner]] = {
+    "post_content": _prepare_post_content,
+    "telegram": _prepare_telegram,
+    "summary": _prepare_summary,
+    "batch": _prepare_batch,
+    "breadth": _prepare_breadth,
+    "regime": _prepare_regime,
+    "anomaly": _prepare_anomaly,
+    "rolling": _prepare_rolling,
+}
+
+# 케이스별 최대 심볼 수 (상관 행렬은 시리즈 수의 제곱이라 10,000개는 메모리가 GB 단위)
+MAX_SIZES: Dict[str, int] = {
+    "regime": 2000,
+}
+
+
+def best_time(run: Runner, budget: float = TIME_BUDGET, max_repeat: int = MAX_REPEAT) -> float:
+    """예산 안에서 여러 번 재서 가장 빠른 1회 시간 (초)
+
+    짧은 작업은 timeit.autorange로 한 샘플이 0.2초 이상이 되도록 묶어 잡음을 줄인다.
+    """
+    timer = timeit.Timer(run)
+    number, elapsed = timer.autorange()
+    best = elapsed / number
+    repeat = min(max_repeat, int(budget / elapsed)) if elapsed > 0 else max_repeat
+    if repeat > 0:
+        best = min(best, min(timer.repeat(repeat=repeat, number=number)) / number)
+    return best
+
+
+def peak_memory_kib(run: Runner) -> float:
+    """한 번 실행하는 동안의 tracemalloc 최대 사용량 (KiB)"""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def calibrate() -> float:
+    """머신 속도 보정용 고정 작업 시간 (초)"""
+    def work():
+        rows = [f"{i * 1.01:,.2f}" for i in range(100_000)]
+        return {row: len(row) for row in rows}
+    return best_time(work, budget=2.0, max_repeat=5)
+
+
+def run_case(name: str, n: int, calibration: float, budget: float = TIME_BUDGET) -> Dict[str, float]:
+    """케이스 하나를 n개 심볼로 측정"""
+    run = CASES[name](n)
+    seconds = best_time(run, budget)
+    return {
+        "seconds": round(seconds, 6),
+        "normalized": round(seconds / calibration, 4),
+        "symbols_per_sec": round(n / seconds, 1) if seconds > 0 else None,
+        "peak_kib": round(peak_memory_kib(run), 1),
+    }
+
+
+def run_suite(cases: Iterable[str], sizes: Iterable[int]) -> Dict:
+    """전체 측정 결과 (baseline.json과 같은 형식)"""
+    calibration = calibrate()
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in cases:
+        for n in sizes:
+            if n > MAX_SIZES.get(name, n):
+                continue
+            result = run_case(name, n, calibration)
+            results.setdefault(name, {})[str(n)] = result
+            print(f"  {name:<13} n={n:<6} {result['seconds'] * 1000:10.2f} ms "
+                  f"{result['symbols_per_sec'] or 0:12,.0f} sym/s {result['peak_kib']:10,.1f} KiB")
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "calibration": round(calibration, 6),
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, time_tolerance: float = TIME_TOLERANCE,
+            memory_tolerance: float = MEMORY_TOLERANCE) -> List[str]:
+    """기준값 대비 회귀 목록 (없으면 빈 리스트)
+
+    기준값에 없는 케이스/크기는 비교하지 않는다.
+    """
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, result in by_size.items():
+            base = baseline.get("results", {}).get(name, {}).get(size)
+            if not base:
+                continue
+            time_ratio = result["normalized"] / base["normalized"] if base["normalized"] else 1.0
+            if time_ratio > 1 + time_tolerance:
+                regressions.append(f"{name} n={size}: 시간 {time_ratio:.2f}배 (허용 {1 + time_tolerance:.2f}배)")
+            extra_kib = result["peak_kib"] - base["peak_kib"]
+            if extra_kib > MEMORY_SLACK_KIB and result["peak_kib"] > base["peak_kib"] * (1 + memory_tolerance):
+                regressions.append(
+                    f"{name} n={size}: 메모리 {base['peak_kib']:,.0f} → {result['peak_kib']:,.0f} KiB"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="파이프라인 핫패스 벤치마크")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="측정할 케이스")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="심볼 수")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 기준값 갱신")
+    parser.add_argument("--output", type=Path, help="측정 결과 JSON 저장 경로")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE, help="허용 시간 증가율")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE, help="허용 메모리 증가율")
+    args = parser.parse_args(argv)
+
+    # 처리 로그가 측정 출력을 가리지 않도록
+    logger.setLevel(logging.WARNING)
+
+    current = run_suite(args.cases, args.sizes)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+
+    if args.update_baseline:
+        # 일부 케이스/크기만 측정했으면 나머지 기준값은 유지
+        merged = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        results = merged.get("results", {})
+        for name, by_size in current["results"].items():
+            results.setdefault(name, {}).update(by_size)
+        merged.update(current, results=results)
+        args.baseline.write_text(json.dumps(merged, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"기준값 없음 (비교 건너뜀): {args.baseline}")
+        return 0
+
+    regressions = compare(current, json.loads(args.baseline.read_text(encoding="utf-8")),
+                          args.time_tolerance, args.memory_tolerance)
+    for line in regressions:
+        print(f"회귀: {line}")
+    if regressions:
+        return 1
+    print("기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
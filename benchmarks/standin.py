@@ -0,0 +1,305 @@
+"""외부 provider 로컬 스탠드인 서버
+
+CoinGecko, FRED, alternative.me, Yahoo chart, Telegram Bot API를 흉내 내는
+HTTP 서버. config의 provider 주소를 이 서버로 바꾸면 네트워크 없이
+전체 파이프라인(main.py)을 실행하고 동시성/재시도를 부하 테스트할 수 있다.
+
+    /coingecko/simple/price                 CoinGecko
+    /fred/series/observations               FRED
+    /fng/                                   alternative.me Fear & Greed
+    /yahoo/v8/finance/chart/<심볼>          Yahoo chart
+    /telegram/bot<토큰>/<메서드>             Telegram Bot API
+
+응답 값은 seed와 요청 내용으로 결정되므로 같은 요청은 항상 같은 응답을 받는다.
+지연(latency, jitter), 오류율(500), provider별 초당 요청 한도(429)를 주입할 수 있다.
+
+사용법:
+    python benchmarks/standin.py --port 8765 --latency 50 --error-rate 0.05 --rate-limit 20
+    # 출력된 환경변수를 설정한 뒤 scripts/main.py 실행
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+# 경로 접두사 → provider 이름 (stats 키)
+PROVIDERS = {
+    "/coingecko/": "coingecko",
+    "/fred/": "fred",
+    "/fng/": "alternative_me",
+    "/yahoo/": "yahoo_chart",
+    "/telegram/": "telegram",
+}
+
+# 스탠드인이 공급하는 가짜 자격 증명 (config 검증을 통과하는 형식)
+FAKE_TELEGRAM_TOKEN = "123456:standin"
+FAKE_TELEGRAM_CHAT_ID = "1"
+FAKE_FRED_API_KEY = "0" * 32
+
+HISTORY_DAYS = {"5d": 5, "1mo": 22, "3mo": 64, "6mo": 126, "1y": 252}
+
+
+class RateLimiter:
+    """provider별 토큰 버킷 (초당 rate개, 최대 rate개 누적)"""
+
+    def __init__(self, rate: Optional[float]):
+        self.rate = rate
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        if not self.rate:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(key, (self.rate, now))
+            tokens = min(self.rate, tokens + (now - last) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+            return allowed
+
+
+class StandinServer:
+    """provider 스탠드인 서버 (백그라운드 스레드)
+
+    Args:
+        port: 포트 (0이면 임의의 빈 포트)
+        latency: 응답 전 고정 지연 (초)
+        jitter: 추가 지연 최댓값 (초, 균등 분포)
+        error_rate: 500 응답 확률 (0~1)
+        rate_limit: provider별 초당 요청 한도 (없으면 무제한, 넘으면 429)
+        seed: 응답 값/오류 주입 난수 seed
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit: Optional[float] = None, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self.limiter = RateLimiter(rate_limit)
+        # (provider, HTTP 상태) → 요청 수
+        self.stats: Counter = Counter()
+        self.messages = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        """이 서버를 가리키는 config 환경변수"""
+        return {
+            "COINGECKO_BASE_URL": f"{self.url}/coingecko",
+            "FRED_BASE_URL": f"{self.url}/fred",
+            "FEAR_GREED_URL": f"{self.url}/fng/",
+            "YAHOO_CHART_URL": f"{self.url}/yahoo",
+            "TELEGRAM_API_URL": f"{self.url}/telegram/bot",
+            "TELEGRAM_BOT_TOKEN": FAKE_TELEGRAM_TOKEN,
+            "TELEGRAM_CHAT_ID": FAKE_TELEGRAM_CHAT_ID,
+            "FRED_API_KEY": FAKE_FRED_API_KEY,
+        }
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # 응답 생성
+    # ------------------------------------------------------------------
+    def _values(self, key: str) -> random.Random:
+        """요청 내용별 결정적 난수 (같은 요청 → 같은 값)"""
+        return random.Random(zlib.crc32(f"{self.seed}:{key}".encode("utf-8")))
+
+    def coingecko(self, query: Dict) -> Dict:
+        result = {}
+        for coin_id in query.get("ids", [""])[0].split(","):
+            if not coin_id:
+                continue
+            rng = self._values(coin_id)
+            usd = round(rng.lognormvariate(5.0, 2.0), 4)
+            result[coin_id] = {"usd": usd, "krw": round(usd * 1430, 2), "usd_24h_change": rng.gauss(0, 3)}
+        return result
+
+    def fred(self, query: Dict) -> Dict:
+        series_id = query.get("series_id", [""])[0]
+        limit = int(query.get("limit", ["2"])[0])
+        rng = self._values(series_id)
+        value = rng.uniform(1, 300)
+        day = datetime(2026, 1, 1)
+        observations = []
+        for i in range(limit):
+            observations.append({"date": (day - timedelta(days=30 * i)).strftime("%Y-%m-%d"),
+                                 "value": f"{value:.3f}"})
+            value /= 1 + rng.gauss(0.002, 0.01)
+        return {"observations": observations}
+
+    def fear_greed(self, query: Dict) -> Dict:
+        limit = int(query.get("limit", ["1"])[0])
+        rng = self._values("fng")
+        data = []
+        for i in range(limit):
+            value = rng.randint(5, 95)
+            label = "Fear" if value < 45 else "Neutral" if value <= 55 else "Greed"
+            data.append({"value": str(value), "value_classification": label,
+                         "timestamp": str(int(datetime(2026, 1, 28).timestamp()) - 86400 * i)})
+        return {"name": "Fear and Greed Index", "data": data}
+
+    def chart(self, symbol: str, query: Dict) -> Dict:
+        days = HISTORY_DAYS.get(query.get("range", ["1mo"])[0], 22)
+        rng = self._values(symbol)
+        price = rng.lognormvariate(4.0, 1.5)
+        closes, volumes, timestamps = [], [], []
+        day = datetime(2026, 1, 28)
+        while len(closes) < days:
+            if day.weekday() < 5:
+                timestamps.append(int(day.timestamp()))
+                closes.append(round(price, 4))
+                volumes.append(int(rng.lognormvariate(14.0, 1.0)))
+                price *= 1 + rng.gauss(0, 0.01)
+            day -= timedelta(days=1)
+        return {"chart": {"result": [{
+            "meta": {"symbol": symbol, "currency": "USD", "regularMarketPrice": closes[0]},
+            "timestamp": timestamps[::-1],
+            "indicators": {"quote": [{"close": closes[::-1], "volume": volumes[::-1]}]},
+        }], "error": None}}
+
+    def telegram(self, method: str, body: Dict) -> Dict:
+        if method == "getMe":
+            return {"ok": True, "result": {"id": 123456, "is_bot": True, "first_name": "standin",
+                                           "username": "standin_bot"}}
+        if method == "sendMessage":
+            with self._lock:
+                self.messages.append(body.get("text", ""))
+                message_id = len(self.messages)
+            return {"ok": True, "result": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": int(body.get("chat_id", FAKE_TELEGRAM_CHAT_ID)), "type": "private"},
+                "text": body.get("text", ""),
+            }}
+        return {"ok": False, "error_code": 404, "description": f"Not Found: {method}"}
+
+    def respond(self, method: str, path: str, query: Dict, body: Dict) -> Tuple[int, Dict, Dict]:
+        """(상태 코드, 헤더, JSON 본문)"""
+        provider = next((name for prefix, name in PROVIDERS.items() if path.startswith(prefix)), None)
+        if provider is None:
+            return 404, {}, {"error": "unknown provider"}
+
+        delay = self.latency
+        with self._lock:
+            if self.jitter:
+                delay += self._rng.uniform(0, self.jitter)
+            fail = self.error_rate and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if not self.limiter.allow(provider):
+            status, headers, payload = 429, {"Retry-After": "1"}, {"error": "rate limited"}
+        elif fail:
+            status, headers, payload = 500, {}, {"error": "injected failure"}
+        elif provider == "coingecko":
+            status, headers, payload = 200, {}, self.coingecko(query)
+        elif provider == "fred":
+            status, headers, payload = 200, {}, self.fred(query)
+        elif provider == "alternative_me":
+            status, headers, payload = 200, {}, self.fear_greed(query)
+        elif provider == "yahoo_chart":
+            symbol = unquote(path.rsplit("/", 1)[-1])
+            status, headers, payload = 200, {}, self.chart(symbol, query)
+        else:
+            status, headers, payload = 200, {}, self.telegram(path.rsplit("/", 1)[-1], {**query, **body})
+
+        with self._lock:
+            self.stats[(provider, status)] += 1
+        return status, headers, payload
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self, body: Dict) -> None:
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                status, headers, payload = server.respond(self.command, parsed.path, query, body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle({})
+
+            def do_POST(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.headers.get("Content-Type", "").startswith("application/json"):
+                    body = json.loads(raw or b"{}")
+                else:
+                    body = {k: v[0] for k, v in parse_qs(raw.decode("utf-8")).items()}
+                self._handle(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="provider 로컬 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="고정 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 지연 최댓값 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 확률 (0~1)")
+    parser.add_argument("--rate-limit", type=float, help="provider별 초당 요청 한도")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, args.latency / 1000, args.jitter / 1000,
+                           args.error_rate, args.rate_limit, args.seed)
+    for name, value in server.env().items():
+        print(f"export {name}={value}")
+    print(f"# {server.url} 에서 대기 중 (Ctrl+C로 종료)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        for (provider, status), count in sorted(server.stats.items()):
+            print(f"# {provider} {status}: {count}")
+
+
+if __name__ == "__main__":
+    main()
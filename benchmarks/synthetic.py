@@ -0,0 +1,97 @@
+"""벤치마크용 합성 시장 데이터
+
+실제 유니버스(약 50개 심볼)를 기본으로 하고, 그 이상은 카테고리에 고르게
+합성 심볼을 추가해 n개까지 늘린다. 같은 (n, seed)면 항상 같은 데이터가 나온다.
+"""
+import sys
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from price_history import PriceHistory, series_key  # noqa: E402
+from quotes import CryptoQuote, Quote, iter_quotes  # noqa: E402
+from universe import load_universe  # noqa: E402
+
+# 합성 심볼을 늘리지 않는 카테고리 (단일 지표, 표시 그룹으로 걸러지는 표)
+FIXED_CATEGORIES = ("market_indicators", "global_indices")
+
+# yf.download(group_by="ticker") 결과의 필드
+OHLCV = ("Open", "High", "Low", "Close", "Volume")
+
+
+def make_symbols(n_symbols: int) -> Dict[str, Tuple[str, str]]:
+    """심볼 → (카테고리, 이름) (crypto 제외, 실제 유니버스 + 합성)"""
+    universe = load_universe()
+    symbol_map = dict(universe.symbol_map)
+    n_extra = n_symbols - len(symbol_map) - len(universe.crypto)
+    growable = [c for c in universe.categories if c not in FIXED_CATEGORIES]
+    for i in range(max(0, n_extra)):
+        category = growable[i % len(growable)]
+        symbol_map[f"SYN{i:05d}"] = (category, f"합성 {i:05d}")
+    return symbol_map
+
+
+def make_market_data(n_symbols: int, seed: int = 0) -> Dict:
+    """DataFetcher.fetch_all() 결과와 같은 구조의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    universe = load_universe()
+    symbol_map = make_symbols(n_symbols)
+
+    prices = rng.lognormal(4.0, 1.5, len(symbol_map))
+    changes = rng.normal(0.0, 1.5, len(symbol_map))
+    data = {"timestamp": "2026-01-29T06:00:00", "crypto": {}}
+    data.update({category: {} for category in universe.categories})
+    for (category, name), price, change in zip(symbol_map.values(), prices, changes):
+        data[category][name] = Quote(round(float(price), 2), round(float(change), 2))
+
+    for ticker in universe.crypto.values():
+        price = float(rng.lognormal(6.0, 2.0))
+        data["crypto"][ticker] = CryptoQuote(round(price, 2), round(float(rng.normal(0.0, 3.0)), 2),
+                                             round(price * 1430, 0))
+
+    data["economic_indicators"] = {
+        "daily": {},
+        "weekly": {},
+        "monthly": {
+            "CPI (YoY)": {"value": 2.9, "date": "2026-01", "unit": "% YoY"},
+            "실업률": {"value": 4.1, "date": "2026-01", "unit": "%"},
+        },
+    }
+    data["fear_greed"] = {
+        "market": {"value": 55, "classification": "탐욕"},
+        "crypto": {"value": 62, "classification": "탐욕", "change": 3},
+    }
+    data["economic_calendar"] = {
+        "upcoming_fed": [{"date": "2026-01-29", "event": "FOMC 회의", "display": "D-0", "days_until": 0}],
+        "this_week": {"economic": [{"event": "GDP 발표", "importance": "high"}], "weekly": []},
+    }
+    return data
+
+
+def make_batch_frame(symbols: List[str], days: int = 22, seed: int = 0) -> pd.DataFrame:
+    """yf.download(group_by="ticker") 결과와 같은 (심볼, 필드) MultiIndex 프레임"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2026-01-28", periods=days, name="Date")
+    closes = rng.lognormal(4.0, 1.5, len(symbols)) * np.cumprod(
+        1 + rng.normal(0, 0.01, (days, len(symbols))), axis=0
+    )
+    values = np.repeat(closes, len(OHLCV), axis=1)
+    columns = pd.MultiIndex.from_product([symbols, OHLCV], names=["Ticker", "Price"])
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def make_history(data: Mapping, days: int = 40, seed: int = 0) -> PriceHistory:
+    """data의 모든 표 항목에 대한 합성 종가 히스토리"""
+    rng = np.random.default_rng(seed)
+    keys = [
+        series_key(category, name)
+        for category, items in data.items()
+        for name, _ in iter_quotes(items)
+    ]
+    index = pd.bdate_range(end="2026-01-28", periods=days, name="date")
+    values = 100 * np.cumprod(1 + rng.normal(0, 0.01, (days, len(keys))), axis=0)
+    return PriceHistory(pd.DataFrame(values, index=index, columns=keys))
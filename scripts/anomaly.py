@@ -0,0 +1,186 @@
+"""일간 변동 이상치 탐지
+
+시리즈("카테고리/이름")마다 일간 변동률(%)의 개수/평균/편차 제곱합을 Welford 방식으로
+누적해 data/return_stats.json에 저장하고, 오늘 변동이 자기 과거 분포에서 몇 σ인지
+(z-score, 정규분포 가정 백분위)를 계산한다.
+
+- 하루 갱신은 시리즈당 O(1)이다. 전체 히스토리를 다시 훑지 않고, 수집 단계의 컬럼형
+  스냅샷(MarketSnapshot) 배열로 모든 시리즈를 한 번에 갱신한다.
+- 통계에 없는 시리즈는 가격 히스토리(price_history)로 한 번만 초기화한다.
+- 새 봉 여부는 마지막으로 반영한 (가격, 변동률)과 비교해 판단한다. 주말처럼 둘 다
+  그대로면 통계도 갱신하지 않고 이상치로 보지 않는다. 스냅샷 가격은 소수 둘째 자리로
+  반올림돼 있어 환율처럼 값이 작은 시리즈는 가격만으로는 새 봉을 놓칠 수 있다.
+- z-score는 오늘 값을 반영하기 전 분포로 계산한다.
+"""
+import json
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from market_snapshot import MarketSnapshot
+from price_history import PriceHistory
+
+DEFAULT_STATS_PATH = Path(__file__).parent / "data" / "return_stats.json"
+
+# 저장 형식 버전 (다르면 버리고 히스토리로 다시 초기화). 2: 행에 last_change 추가
+STATS_VERSION = 2
+
+# z-score를 내기 위한 최소 관측치 (이보다 적으면 분포를 믿지 않음)
+MIN_COUNT = 20
+
+
+class ReturnStats:
+    """시리즈별 일간 변동률 누적 통계 (배열 기반)
+
+    Attributes:
+        keys: 시리즈 키
+        count, mean, m2: Welford 누적값 (변동률 % 기준)
+        last, last_change: 마지막으로 반영한 가격과 변동률 (새 봉 판단용, 없으면 NaN)
+    """
+
+    # 저장 파일의 행 순서
+    COLUMNS = ("count", "mean", "m2", "last", "last_change")
+
+    def __init__(self, keys: Sequence[str] = (), values: Optional[np.ndarray] = None,
+                 path: Path = DEFAULT_STATS_PATH):
+        self.path = Path(path)
+        self.keys: List[str] = list(keys)
+        self.index: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+        values = values if values is not None else np.empty((0, len(self.COLUMNS)))
+        self.count, self.mean, self.m2, self.last, self.last_change = (
+            np.array(column, dtype=float) for column in values.T
+        )
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_STATS_PATH) -> "ReturnStats":
+        """JSON에서 로드 (없거나 버전이 다르면 빈 통계, 다음 seed()가 히스토리로 다시 채움)"""
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("version") != STATS_VERSION:
+            return cls(path=path)
+        series = raw.get("series", {})
+        values = np.array([[np.nan if v is None else v for v in row] for row in series.values()],
+                          dtype=float).reshape(-1, len(cls.COLUMNS))
+        return cls(list(series), values, path=path)
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """JSON으로 원자적 저장 (키 순서 고정, 커밋 diff가 작도록)"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        series = {
+            key: [int(self.count[i]), round(float(self.mean[i]), 8), round(float(self.m2[i]), 8),
+                  None if np.isnan(self.last[i]) else float(self.last[i]),
+                  None if np.isnan(self.last_change[i]) else float(self.last_change[i])]
+            for key, i in sorted(self.index.items())
+        }
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": STATS_VERSION, "series": series}, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def copy(self) -> "ReturnStats":
+        return ReturnStats(self.keys, np.column_stack([getattr(self, name) for name in self.COLUMNS]), self.path)
+
+    def rows(self, keys: Sequence[str]) -> np.ndarray:
+        """keys의 행 번호 (없는 키는 빈 통계로 추가)"""
+        missing = [key for key in dict.fromkeys(keys) if key not in self.index]
+        if missing:
+            self.index.update((key, len(self.keys) + i) for i, key in enumerate(missing))
+            self.keys.extend(missing)
+            self.count = np.concatenate([self.count, np.zeros(len(missing))])
+            self.mean = np.concatenate([self.mean, np.zeros(len(missing))])
+            self.m2 = np.concatenate([self.m2, np.zeros(len(missing))])
+            self.last = np.concatenate([self.last, np.full(len(missing), np.nan)])
+            self.last_change = np.concatenate([self.last_change, np.full(len(missing), np.nan)])
+        return np.array([self.index[key] for key in keys], dtype=np.intp)
+
+    def seed(self, history: PriceHistory, keys: Sequence[str]) -> int:
+        """통계가 없는 시리즈를 가격 히스토리로 초기화
+
+        시리즈마다 마지막 값은 오늘 관측으로 남겨 두므로, 초기화한 날에도 오늘 변동을 판단한다.
+        히스토리의 값은 모두 실제 봉이므로 같은 값이 이어져도(보합) 그대로 쓴다.
+
+        Returns:
+            초기화한 시리즈 수
+        """
+        todo = [key for key in keys if (key not in self.index or not self.count[self.index[key]])
+                and key in history.frame.columns]
+        if not todo:
+            return 0
+        rows = self.rows(todo)
+        for row, key in zip(rows, todo):
+            prices = history.frame[key].dropna().to_numpy()[:-1]
+            if len(prices) < 2:
+                continue
+            changes = (prices[1:] / prices[:-1] - 1) * 100
+            self.count[row] = len(changes)
+            self.mean[row] = changes.mean()
+            self.m2[row] = ((changes - changes.mean()) ** 2).sum()
+            self.last[row] = prices[-1]
+        return len(todo)
+
+    def observe(self, keys: Sequence[str], prices: np.ndarray, changes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """오늘 변동률의 z-score를 계산하고 새 봉만 통계에 반영
+
+        Args:
+            keys: 시리즈 키 (중복 없음)
+            prices, changes: 현재가와 변동률(%) (없으면 NaN)
+
+        Returns:
+            (z-score, 새 봉 여부). 새 봉이 아니거나 관측치가 MIN_COUNT보다 적으면 z는 NaN
+        """
+        rows = self.rows(keys)
+        prices = np.asarray(prices, dtype=float)
+        changes = np.asarray(changes, dtype=float)
+        last, last_change = self.last[rows], self.last_change[rows]
+        new = (~np.isnan(prices) & ~np.isnan(changes)
+               & (np.isnan(last) | (prices != last) | (changes != last_change)))
+
+        count, mean = self.count[rows], self.mean[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(self.m2[rows] / (count - 1))
+            z = np.where(new & (count >= MIN_COUNT) & (std > 0), (changes - mean) / std, np.nan)
+
+        # Welford 갱신 (새 봉만)
+        updated, x = rows[new], changes[new]
+        self.count[updated] += 1
+        delta = x - self.mean[updated]
+        self.mean[updated] += delta / self.count[updated]
+        self.m2[updated] += delta * (x - self.mean[updated])
+        self.last[updated] = prices[new]
+        self.last_change[updated] = changes[new]
+        return z, new
+
+
+def percentile(z: float) -> float:
+    """표준정규분포 누적 확률 (%)"""
+    return 50 * (1 + math.erf(z / math.sqrt(2)))
+
+
+def detect_anomalies(snapshot: MarketSnapshot, stats: ReturnStats, threshold: float = 2.0) -> List[Dict]:
+    """스냅샷의 오늘 변동을 통계에 반영하고 |z| >= threshold인 항목
+
+    Returns:
+        [{category, name, change, z, percentile}] (|z| 큰 순)
+    """
+    z, _ = stats.observe(snapshot.series_keys(), snapshot.prices, snapshot.changes)
+
+    flagged = np.flatnonzero(np.abs(np.nan_to_num(z)) >= threshold)
+    flagged = flagged[np.argsort(-np.abs(z[flagged]), kind="stable")]
+    return [{
+        "category": snapshot.category_names[snapshot.categories[i]],
+        "name": snapshot.names[i],
+        "change": round(float(snapshot.changes[i]), 2),
+        "z": round(float(z[i]), 2),
+        "percentile": round(percentile(float(z[i])), 2),
+    } for i in flagged]
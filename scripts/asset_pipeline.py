@@ -0,0 +1,187 @@
+"""보고서 이미지 에셋 파이프라인
+
+보고서 마크다운이 참조하는 로컬 이미지를 찾아 assets/images/에
+내용 해시 이름으로 복사하고 링크를 다시 쓴다.
+같은 이미지는 한 번만 저장되고, 큰 이미지는 (Pillow가 있으면) 축소/재압축한다.
+"""
+import hashlib
+import io
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from logger import logger
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_ASSETS_DIR = BASE_DIR / "assets" / "images"
+DEFAULT_URL_PREFIX = "/assets/images"
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg")
+# 축소/재압축 대상 (SVG는 벡터, GIF는 애니메이션 보존을 위해 제외)
+RASTER_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+MAX_DIMENSION = 1600          # 긴 변 최대 픽셀
+MAX_BYTES = 500 * 1024        # 이보다 크면 재압축
+JPEG_QUALITY = 85
+HASH_LENGTH = 16
+
+# ![alt](path "title") / ![alt](<path with space>)
+MARKDOWN_IMAGE_RE = re.compile(r'(!\[[^\]]*\]\(\s*)(<[^>]+>|[^)\s]+)((?:\s+"[^"]*")?\s*\))')
+# <img ... src="path" ...>
+HTML_IMAGE_RE = re.compile(r'(<img\b[^>]*?\bsrc=["\'])([^"\']+)(["\'])', re.IGNORECASE)
+
+
+def _is_local(ref: str) -> bool:
+    """로컬 상대경로 참조인지 (URL, data URI, 사이트 절대경로, Liquid 제외)"""
+    return not re.match(r'^([a-z][a-z0-9+.-]*:|//|/|#|\{\{)', ref, re.IGNORECASE)
+
+
+class AssetPipeline:
+    """로컬 이미지 참조 → 해시 이름 에셋 변환기
+
+    Args:
+        assets_dir: 에셋 저장 디렉토리
+        url_prefix: 사이트 기준 에셋 URL 경로 (relative_url 필터로 baseurl 적용)
+        max_dimension: 긴 변 최대 픽셀
+        max_bytes: 재압축 기준 크기
+    """
+
+    def __init__(self, assets_dir: Path = DEFAULT_ASSETS_DIR, url_prefix: str = DEFAULT_URL_PREFIX,
+                 max_dimension: int = MAX_DIMENSION, max_bytes: int = MAX_BYTES):
+        self.assets_dir = Path(assets_dir)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.max_dimension = max_dimension
+        self.max_bytes = max_bytes
+        # 원본 경로 → ((mtime_ns, size), 에셋 이름)
+        self._published: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, ref: str, base_dir: Path) -> Optional[Path]:
+        """참조 문자열을 로컬 이미지 경로로 변환 (대상이 아니면 None)"""
+        ref = ref.strip("<>")
+        if not _is_local(ref):
+            return None
+        path = (base_dir / unquote(ref.split("#")[0].split("?")[0])).resolve()
+        if path.suffix.lower() not in IMAGE_EXTENSIONS:
+            return None
+        return path if path.is_file() else None
+
+    def local_images(self, content: str, base_dir: Path) -> List[Path]:
+        """본문이 참조하는 로컬 이미지 경로 (등장 순서, 중복 제거)"""
+        refs = [m.group(2) for m in MARKDOWN_IMAGE_RE.finditer(content)]
+        refs += [m.group(2) for m in HTML_IMAGE_RE.finditer(content)]
+        paths = (self._resolve(ref, base_dir) for ref in refs)
+        return list(dict.fromkeys(p for p in paths if p is not None))
+
+    def optimize(self, data: bytes, suffix: str) -> Tuple[bytes, str]:
+        """큰 래스터 이미지 축소/재압축
+
+        Pillow가 없거나, 결과가 원본보다 크면 원본을 그대로 반환한다.
+
+        Returns:
+            (이미지 바이트, 확장자)
+        """
+        if not PIL_AVAILABLE or suffix not in RASTER_EXTENSIONS:
+            return data, suffix
+
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                oversized = max(img.size) > self.max_dimension
+                if not oversized and len(data) <= self.max_bytes:
+                    return data, suffix
+
+                img.load()
+                if oversized:
+                    img.thumbnail((self.max_dimension, self.max_dimension), Image.LANCZOS)
+
+                has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+                out = io.BytesIO()
+                if suffix == ".png" and has_alpha:
+                    img.save(out, format="PNG", optimize=True)
+                    new_suffix = ".png"
+                else:
+                    # 투명도 없는 스크린샷은 JPEG가 훨씬 작다
+                    img.convert("RGB").save(out, format="JPEG", quality=JPEG_QUALITY,
+                                            optimize=True, progressive=True)
+                    new_suffix = ".jpg"
+        except Exception as e:
+            logger.warning(f"이미지 최적화 실패 (원본 사용): {e}")
+            return data, suffix
+
+        optimized = out.getvalue()
+        if len(optimized) >= len(data) and not oversized:
+            return data, suffix
+        return optimized, new_suffix
+
+    def publish(self, source: Path) -> str:
+        """이미지를 에셋 디렉토리에 게시하고 에셋 파일 이름 반환
+
+        이름은 원본 내용 해시이므로 같은 이미지는 한 번만 저장되고,
+        이미 있으면 최적화도 건너뛴다.
+        """
+        stat = source.stat()
+        key = str(source)
+        with self._lock:
+            cached = self._published.get(key)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        suffix = source.suffix.lower().replace(".jpeg", ".jpg")
+
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        existing = next(iter(sorted(self.assets_dir.glob(f"{digest}.*"))), None)
+        if existing is not None:
+            name = existing.name
+        else:
+            optimized, suffix = self.optimize(data, suffix)
+            name = f"{digest}{suffix}"
+            fd, tmp_name = tempfile.mkstemp(dir=self.assets_dir, prefix=f".{name}.", suffix=".tmp")
+            try:
+                if optimized is data:
+                    os.close(fd)
+                    shutil.copyfile(source, tmp_name)
+                else:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(optimized)
+                os.replace(tmp_name, self.assets_dir / name)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            logger.info(f"이미지 게시: {source.name} → {name} ({len(data):,} → {len(optimized):,} bytes)")
+
+        with self._lock:
+            self._published[key] = ((stat.st_mtime_ns, stat.st_size), name)
+        return name
+
+    def url_for(self, name: str) -> str:
+        """에셋 이름 → 포스트에 넣을 Liquid URL"""
+        return f"{{{{ '{self.url_prefix}/{name}' | relative_url }}}}"
+
+    def rewrite(self, content: str, base_dir: Path) -> str:
+        """본문의 로컬 이미지 링크를 게시된 에셋 URL로 교체"""
+        def replace(match: re.Match) -> str:
+            path = self._resolve(match.group(2), base_dir)
+            if path is None:
+                if _is_local(match.group(2).strip("<>")):
+                    logger.warning(f"이미지를 게시할 수 없습니다 (링크 유지): {match.group(2)}")
+                return match.group(0)
+            return match.group(1) + self.url_for(self.publish(path)) + match.group(3)
+
+        content = MARKDOWN_IMAGE_RE.sub(replace, content)
+        return HTML_IMAGE_RE.sub(replace, content)
+
+
+asset_pipeline = AssetPipeline()
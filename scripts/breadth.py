@@ -0,0 +1,153 @@
+"""시장 폭 (market breadth)
+
+지수 구성 종목(수백~수천 개)의 상승/하락/보합 종목 수, 52주 신고가/신저가 종목 수,
+상승/하락 상위 N개를 계산한다. 구성 종목 목록은 config.BREADTH_FILE(YAML)로 지정한다.
+
+    indices:
+      sp500:
+        name: S&P 500
+        symbols: [AAPL, MSFT, NVDA]       # 티커 목록 (표시 이름 = 티커)
+      kospi200:
+        name: KOSPI 200
+        symbols:                          # 또는 {표시 이름: 티커}
+          삼성전자: 005930.KS
+          SK하이닉스: 000660.KS
+
+지수마다 (날짜 × 종목) 배열 연산으로 계산하고, 상승/하락 상위 종목은 전체 정렬 대신
+argpartition(market_snapshot.select_top)으로 고른다. 신고가/신저가는 받아 둔 종가
+히스토리 전체(config.BREADTH_PERIOD, 기본 1년) 기준이다.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+from market_snapshot import last_two, select_top
+
+
+class BreadthError(ValueError):
+    """시장 폭 구성 종목 파일 형식 오류"""
+    pass
+
+
+@dataclass(frozen=True)
+class BreadthIndex:
+    """시장 폭 계산 대상 지수
+
+    Attributes:
+        key: 지수 키 (파일의 indices 키)
+        name: 표시 이름
+        symbols: 구성 종목 티커
+        names: 구성 종목 표시 이름 (symbols와 같은 순서)
+    """
+
+    key: str
+    name: str
+    symbols: Tuple[str, ...]
+    names: Tuple[str, ...]
+
+
+def load_breadth_indices(path: str) -> Tuple[BreadthIndex, ...]:
+    """구성 종목 YAML 로드
+
+    Raises:
+        BreadthError: 파일이 없거나 형식 오류
+    """
+    try:
+        raw = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise BreadthError(f"시장 폭 구성 종목 파일을 찾을 수 없습니다: {path}")
+    except yaml.YAMLError as e:
+        raise BreadthError(f"시장 폭 구성 종목 YAML 파싱 실패 ({path}): {e}")
+
+    raw_indices = raw.get("indices") if isinstance(raw, dict) else None
+    if not isinstance(raw_indices, dict) or not raw_indices:
+        raise BreadthError("'indices' 항목이 비어 있거나 매핑이 아닙니다")
+
+    indices = []
+    for key, spec in raw_indices.items():
+        members = spec.get("symbols") if isinstance(spec, dict) else None
+        if isinstance(members, list):
+            members = {str(symbol): symbol for symbol in members}
+        if not isinstance(members, dict) or not members:
+            raise BreadthError(f"지수 '{key}'에 symbols 목록이 없습니다")
+        bad = [name for name, symbol in members.items() if not isinstance(symbol, str) or not symbol.strip()]
+        if bad:
+            raise BreadthError(f"지수 '{key}'의 심볼이 문자열이 아닙니다: {bad}")
+        indices.append(BreadthIndex(
+            key=str(key),
+            name=str(spec.get("name") or key),
+            symbols=tuple(members.values()),
+            names=tuple(str(name) for name in members),
+        ))
+    return tuple(indices)
+
+
+def _movers(positions: np.ndarray, index: BreadthIndex, prices: np.ndarray,
+            changes: np.ndarray) -> List[Dict]:
+    return [{
+        "name": index.names[i],
+        "symbol": index.symbols[i],
+        "price": round(float(prices[i]), 2),
+        "change": round(float(changes[i]), 2),
+    } for i in positions]
+
+
+def compute_index_breadth(values: np.ndarray, index: BreadthIndex, top_n: int) -> Dict:
+    """한 지수의 시장 폭
+
+    Args:
+        values: (날짜 × 구성 종목) 종가 배열, 열 순서는 index.symbols (없는 값은 NaN)
+        index: 대상 지수
+        top_n: 상승/하락 상위 종목 수
+
+    Returns:
+        count(가격이 있는 종목 수), advancers, decliners, unchanged, new_highs, new_lows,
+        gainers/losers (상승/하락 종목 중 상위 top_n개, [{name, symbol, price, change}])
+    """
+    valid = ~np.isnan(values)
+    observations = valid.sum(axis=0)
+    current, previous = last_two(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = np.where((observations >= 2) & (previous != 0), (current - previous) / previous * 100, np.nan)
+
+    # 기간 내 최고/최저가와 같으면 신고가/신저가 (관측치 2개 이상)
+    high = np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf)
+    low = np.where(valid, values, np.inf).min(axis=0, initial=np.inf)
+    ranged = observations >= 2
+
+    return {
+        "key": index.key,
+        "name": index.name,
+        "count": int((observations >= 1).sum()),
+        "advancers": int((changes > 0).sum()),
+        "decliners": int((changes < 0).sum()),
+        "unchanged": int((changes == 0).sum()),
+        "new_highs": int((ranged & (current >= high)).sum()),
+        "new_lows": int((ranged & (current <= low)).sum()),
+        "gainers": _movers(select_top(np.where(changes > 0, changes, np.nan), top_n), index, current, changes),
+        "losers": _movers(select_top(np.where(changes < 0, changes, np.nan), top_n, largest=False),
+                          index, current, changes),
+    }
+
+
+def compute_market_breadth(closes, indices: Sequence[BreadthIndex], top_n: int = 5) -> Dict:
+    """지수별 시장 폭 (market_data["breadth"] 형태)
+
+    Args:
+        closes: (날짜 × 티커) 종가 프레임 (여러 지수 종목을 한 번에 받은 것)
+        indices: 대상 지수
+        top_n: 상승/하락 상위 종목 수
+
+    Returns:
+        {"indices": [지수별 결과, ...]} (구성 종목 가격이 하나도 없는 지수는 제외)
+    """
+    results = []
+    for index in indices:
+        values = closes.reindex(columns=list(index.symbols)).to_numpy(dtype=float)
+        result = compute_index_breadth(values, index, top_n)
+        if result["count"]:
+            results.append(result)
+    return {"indices": results}
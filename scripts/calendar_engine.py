@@ -0,0 +1,271 @@
+"""경제 캘린더 규칙 엔진
+
+반복 규칙(매월 첫째 금요일, 매주 목요일 등)과 명시적 발표일 테이블을
+날짜순 인덱스로 한 번만 전개하고, 기간 조회는 bisect로 처리한다.
+"""
+import calendar
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from calendar_store import CalendarData, load_calendar_data
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    """전개된 단일 캘린더 이벤트"""
+
+    date: date
+    event: str
+    importance: str
+    kind: str
+    note: str = ""
+    frequency: str = ""
+
+    def to_dict(self) -> Dict:
+        """기존 캘린더 딕셔너리 형식으로 변환"""
+        result = {
+            "date": self.date.isoformat(),
+            "event": self.event,
+            "importance": self.importance,
+        }
+        if self.note:
+            result["note"] = self.note
+        if self.frequency:
+            result["frequency"] = self.frequency
+        return result
+
+
+def _months(start: date, end: date) -> Iterator[Tuple[int, int]]:
+    """start~end 구간의 (연, 월) 순회"""
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> Optional[date]:
+    """해당 월의 n번째 요일 (n=-1이면 마지막)"""
+    days_in_month = calendar.monthrange(year, month)[1]
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        day = 1 + offset + (n - 1) * 7
+        return date(year, month, day) if day <= days_in_month else None
+    last = date(year, month, days_in_month)
+    offset = (last.weekday() - weekday) % 7
+    day = days_in_month - offset + (n + 1) * 7
+    return date(year, month, day) if day >= 1 else None
+
+
+def nth_business_day(year: int, month: int, n: int) -> date:
+    """해당 월의 n번째 영업일 (주말만 제외)"""
+    current = date(year, month, 1)
+    count = 0
+    while True:
+        if current.weekday() < SAT:
+            count += 1
+            if count == n:
+                return current
+        current += timedelta(days=1)
+
+
+class Rule(ABC):
+    """반복 규칙 기본 클래스 (dates()를 구현하지 않은 규칙은 만들 수 없음)"""
+
+    kind = "economic"
+
+    def __init__(self, event: str, importance: str = "medium", kind: str = None,
+                 note: str = "", frequency: str = ""):
+        self.event = event
+        self.importance = importance
+        self.kind = kind or self.kind
+        self.note = note
+        self.frequency = frequency
+
+    @abstractmethod
+    def dates(self, start: date, end: date) -> Iterable[date]:
+        """start~end 구간의 후보 날짜 (구간 밖 날짜는 expand에서 걸러짐)"""
+
+    def expand(self, start: date, end: date) -> Iterator[CalendarEvent]:
+        """start~end (양끝 포함) 구간의 이벤트 전개"""
+        for d in self.dates(start, end):
+            if start <= d <= end:
+                yield CalendarEvent(d, self.event, self.importance, self.kind, self.note, self.frequency)
+
+
+class ExplicitDates(Rule):
+    """명시적 발표일 테이블 (FOMC, CPI 등)"""
+
+    def __init__(self, event: str, dates: Sequence, **kwargs):
+        super().__init__(event, **kwargs)
+        self._dates = tuple(sorted(d if isinstance(d, date) else date.fromisoformat(d) for d in dates))
+
+    @property
+    def covered_months(self) -> frozenset:
+        """테이블이 포함하는 (연, 월) 집합"""
+        return frozenset((d.year, d.month) for d in self._dates)
+
+    def dates(self, start: date, end: date) -> Iterable[date]:
+        lo = bisect_left(self._dates, start)
+        hi = bisect_right(self._dates, end)
+        return self._dates[lo:hi]
+
+
+class MonthlyRule(Rule):
+    """월간 규칙 공통 (명시적 테이블이 있는 달은 건너뜀)"""
+
+    def __init__(self, event: str, skip_months: Iterable[Tuple[int, int]] = (), **kwargs):
+        super().__init__(event, **kwargs)
+        self.skip_months = frozenset(skip_months)
+
+    @abstractmethod
+    def date_in_month(self, year: int, month: int) -> Optional[date]:
+        """해당 월의 발표일 (없으면 None)"""
+
+    def dates(self, start: date, end: date) -> Iterable[date]:
+        for year, month in _months(start, end):
+            if (year, month) in self.skip_months:
+                continue
+            d = self.date_in_month(year, month)
+            if d is not None:
+                yield d
+
+
+class MonthlyNthWeekday(MonthlyRule):
+    """매월 n번째 요일 (예: 첫째 금요일 고용보고서)"""
+
+    def __init__(self, event: str, weekday: int, n: int, **kwargs):
+        super().__init__(event, **kwargs)
+        self.weekday = weekday
+        self.n = n
+
+    def date_in_month(self, year: int, month: int) -> Optional[date]:
+        return nth_weekday(year, month, self.weekday, self.n)
+
+
+class MonthlyBusinessDay(MonthlyRule):
+    """매월 n번째 영업일 (예: ISM 제조업 PMI = 첫 영업일)"""
+
+    def __init__(self, event: str, n: int, months: Iterable[int] = None, **kwargs):
+        super().__init__(event, **kwargs)
+        self.n = n
+        self.months = frozenset(months) if months else None
+
+    def date_in_month(self, year: int, month: int) -> Optional[date]:
+        if self.months and month not in self.months:
+            return None
+        return nth_business_day(year, month, self.n)
+
+
+class Weekly(Rule):
+    """매주 특정 요일 (예: 목요일 신규 실업수당 청구)"""
+
+    kind = "weekly"
+
+    def __init__(self, event: str, weekday: int, **kwargs):
+        super().__init__(event, **kwargs)
+        self.weekday = weekday
+
+    def dates(self, start: date, end: date) -> Iterable[date]:
+        current = start + timedelta(days=(self.weekday - start.weekday()) % 7)
+        while current <= end:
+            yield current
+            current += timedelta(days=7)
+
+
+class CalendarEngine:
+    """규칙을 날짜순 인덱스로 전개한 캘린더
+
+    전개는 생성 시 한 번만 수행하고, 조회는 bisect로 O(log n + k).
+    """
+
+    def __init__(self, rules: Iterable[Rule], start: date, end: date):
+        self.start = start
+        self.end = end
+        events = sorted(
+            (e for rule in rules for e in rule.expand(start, end)),
+            key=lambda e: (e.date, e.kind, e.event),
+        )
+        self._events: Tuple[CalendarEvent, ...] = tuple(events)
+        self._ordinals: Tuple[int, ...] = tuple(e.date.toordinal() for e in events)
+
+        # kind별 인덱스 (필터 조회도 bisect 한 번으로)
+        by_kind: Dict[str, List[CalendarEvent]] = {}
+        for e in events:
+            by_kind.setdefault(e.kind, []).append(e)
+        self._by_kind = {
+            kind: (tuple(evts), tuple(e.date.toordinal() for e in evts))
+            for kind, evts in by_kind.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def between(self, start: date, end: date, kind: str = None) -> List[CalendarEvent]:
+        """start~end (양끝 포함) 이벤트 목록"""
+        if kind is None:
+            events, ordinals = self._events, self._ordinals
+        else:
+            events, ordinals = self._by_kind.get(kind, ((), ()))
+        lo = bisect_left(ordinals, start.toordinal())
+        hi = bisect_right(ordinals, end.toordinal())
+        return list(events[lo:hi])
+
+    def upcoming(self, today: date, days: int, kind: str = None) -> List[CalendarEvent]:
+        """오늘부터 days일 이내 이벤트"""
+        return self.between(today, today + timedelta(days=days), kind)
+
+
+def default_rules(data: CalendarData) -> List[Rule]:
+    """기본 미국 경제 캘린더 규칙
+
+    data의 명시 일정(FOMC, CPI, NFP, 실적)을 우선하고,
+    명시 일정이 없는 달의 CPI/NFP는 규칙 기반 예상일로 채운다.
+    """
+    rules: List[Rule] = [
+        ExplicitDates(event, dates, importance=importance, kind=kind)
+        for (kind, event, importance), dates in data.groups().items()
+    ]
+    cpi, nfp = "CPI (소비자물가지수)", "비농업 고용 (NFP)"
+    rules += [
+        MonthlyNthWeekday(cpi, WED, 2, importance="high",
+                          skip_months=data.covered_months(cpi), note="예상 발표일"),
+        MonthlyNthWeekday(nfp, FRI, 1, importance="high",
+                          skip_months=data.covered_months(nfp)),
+        MonthlyBusinessDay("ISM 제조업 PMI", 1, importance="high"),
+        MonthlyBusinessDay("ISM 서비스업 PMI", 3, importance="high"),
+        MonthlyBusinessDay("소매판매", 11, importance="medium", note="예상 발표일"),
+        MonthlyBusinessDay("주택착공건수", 13, importance="medium", note="예상 발표일"),
+        MonthlyNthWeekday("PCE 물가지수", FRI, -1, importance="high", note="예상 발표일"),
+        MonthlyNthWeekday("GDP (분기별)", THU, -1, importance="high", note="예상 발표일"),
+        Weekly("신규 실업수당 청구건수", THU, frequency="매주 목요일"),
+    ]
+    return rules
+
+
+# (start_year, end_year, data.version) → 엔진
+_engine_cache: Dict[Tuple[int, int, str], CalendarEngine] = {}
+_ENGINE_CACHE_SIZE = 8
+
+
+def build_engine(start_year: int, end_year: int, data: CalendarData = None) -> CalendarEngine:
+    """start_year~end_year 전체를 전개한 기본 엔진
+
+    연도 범위와 캘린더 데이터 버전이 같으면 캐시된 엔진을 재사용한다.
+    """
+    data = data or load_calendar_data()
+    key = (start_year, end_year, data.version)
+    engine = _engine_cache.get(key)
+    if engine is None:
+        if len(_engine_cache) >= _ENGINE_CACHE_SIZE:
+            _engine_cache.clear()
+        engine = CalendarEngine(default_rules(data), date(start_year, 1, 1), date(end_year, 12, 31))
+        _engine_cache[key] = engine
+    return engine
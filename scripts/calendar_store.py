@@ -0,0 +1,201 @@
+"""경제 캘린더 데이터 저장소
+
+data/calendar.csv(기본 데이터)와 data/calendar.d/*.csv(drop-in)를 읽어
+날짜순 이벤트 테이블로 만든다. 파싱 결과는 파일별로 바이너리 캐시에 저장하고,
+mtime/크기가 바뀐 파일만 다시 파싱한다.
+"""
+import csv
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from logger import logger
+from metrics import metrics
+
+DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_CALENDAR_PATH = DATA_DIR / "calendar.csv"
+DEFAULT_DROPIN_DIR = DATA_DIR / "calendar.d"
+DEFAULT_CACHE_PATH = DATA_DIR / ".calendar.cache"
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 무시
+CACHE_FORMAT = 1
+
+VALID_KINDS = ("fomc", "economic", "earnings")
+CANCEL = "cancel"
+
+# (date, kind, event, importance)
+Row = Tuple[date, str, str, str]
+SourceStat = Tuple[int, int]
+
+
+class CalendarDataError(ValueError):
+    """캘린더 데이터 형식 오류"""
+    pass
+
+
+@dataclass(frozen=True)
+class CalendarData:
+    """병합된 캘린더 데이터 (불변)
+
+    Attributes:
+        rows: (date, kind, event, importance) 날짜순 튜플
+        version: 소스 파일 상태 해시 (엔진 캐시 키)
+    """
+
+    rows: Tuple[Row, ...]
+    version: str
+
+    def by_kind(self, kind: str) -> Tuple[Row, ...]:
+        return tuple(r for r in self.rows if r[1] == kind)
+
+    def groups(self) -> Dict[Tuple[str, str, str], Tuple[date, ...]]:
+        """(kind, event, importance) → 날짜 튜플"""
+        grouped: Dict[Tuple[str, str, str], List[date]] = {}
+        for d, kind, event, importance in self.rows:
+            grouped.setdefault((kind, event, importance), []).append(d)
+        return {key: tuple(dates) for key, dates in grouped.items()}
+
+    def covered_months(self, event: str) -> FrozenSet[Tuple[int, int]]:
+        """해당 이벤트의 명시 일정이 있는 (연, 월) 집합"""
+        return frozenset((r[0].year, r[0].month) for r in self.rows if r[2] == event)
+
+
+def parse_calendar_file(path: Path) -> Tuple[Row, ...]:
+    """캘린더 CSV 파일 파싱 (# 주석, 빈 줄 무시)
+
+    Raises:
+        CalendarDataError: 날짜/kind 형식 오류
+    """
+    rows = []
+    with open(path, encoding="utf-8", newline="") as f:
+        lines = (line for line in f if line.strip() and not line.lstrip().startswith("#"))
+        for lineno, record in enumerate(csv.reader(lines), 1):
+            if len(record) != 4:
+                raise CalendarDataError(f"{path.name}: 열이 4개가 아닙니다: {record}")
+            raw_date, kind, event, importance = (field.strip() for field in record)
+            try:
+                event_date = date.fromisoformat(raw_date)
+            except ValueError:
+                raise CalendarDataError(f"{path.name}: 잘못된 날짜 {raw_date!r}")
+            if kind not in VALID_KINDS:
+                raise CalendarDataError(f"{path.name}: 알 수 없는 kind {kind!r}")
+            rows.append((event_date, kind, event, importance))
+    return tuple(rows)
+
+
+def merge_rows(sources: Iterable[Tuple[Row, ...]]) -> Tuple[Row, ...]:
+    """소스 순서대로 병합 (뒤의 소스가 같은 (date, kind, event)를 덮어씀)"""
+    merged: Dict[Tuple[date, str, str], str] = {}
+    for rows in sources:
+        for d, kind, event, importance in rows:
+            merged[(d, kind, event)] = importance
+    return tuple(sorted(
+        (d, kind, event, importance)
+        for (d, kind, event), importance in merged.items()
+        if importance != CANCEL
+    ))
+
+
+class CalendarStore:
+    """캘린더 소스 파일 + 바이너리 캐시 관리"""
+
+    def __init__(self, base_path: Path = DEFAULT_CALENDAR_PATH,
+                 dropin_dir: Path = DEFAULT_DROPIN_DIR,
+                 cache_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.base_path = Path(base_path)
+        self.dropin_dir = Path(dropin_dir)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._data: Optional[CalendarData] = None
+        self._stats: Dict[str, SourceStat] = {}
+        self._lock = threading.Lock()
+
+    def _source_paths(self) -> List[Path]:
+        """병합 순서대로 정렬된 소스 경로 (기본 → drop-in 이름순)"""
+        paths = [self.base_path] if self.base_path.exists() else []
+        if self.dropin_dir.is_dir():
+            paths.extend(sorted(self.dropin_dir.glob("*.csv")))
+        return paths
+
+    def _stat_sources(self) -> Dict[str, SourceStat]:
+        stats = {}
+        for path in self._source_paths():
+            st = path.stat()
+            stats[str(path)] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def _read_cache(self) -> Dict:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "rb") as f:
+                cache = pickle.load(f)
+            if cache.get("format") == CACHE_FORMAT:
+                return cache
+        except Exception as e:
+            logger.warning(f"캘린더 캐시 읽기 실패 (무시): {e}")
+        return {}
+
+    def _write_cache(self, entries: Dict[str, Tuple[SourceStat, Tuple[Row, ...]]]) -> None:
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"format": CACHE_FORMAT, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"캘린더 캐시 저장 실패 (무시): {e}")
+
+    def load(self) -> CalendarData:
+        """병합된 캘린더 데이터 반환
+
+        프로세스 내에서는 소스 상태가 같으면 그대로 재사용하고,
+        바이너리 캐시가 있으면 변경된 소스만 다시 파싱한다.
+        """
+        with self._lock:
+            stats = self._stat_sources()
+            if self._data is not None and stats == self._stats:
+                metrics.inc("cache_requests_total", cache="calendar", result="hit")
+                return self._data
+
+            cached_entries = self._read_cache().get("entries", {})
+            entries = {}
+            reparsed = 0
+            for path, stat in stats.items():
+                cached = cached_entries.get(path)
+                if cached and cached[0] == stat:
+                    entries[path] = cached
+                else:
+                    entries[path] = (stat, parse_calendar_file(Path(path)))
+                    reparsed += 1
+
+            metrics.inc("cache_requests_total", cache="calendar",
+                        result="miss" if reparsed else "hit")
+            if reparsed or set(cached_entries) != set(entries):
+                logger.info(f"캘린더 데이터 갱신: {reparsed}/{len(entries)}개 소스 파싱")
+                self._write_cache(entries)
+
+            version = hashlib.sha1(repr(sorted(stats.items())).encode()).hexdigest()[:12]
+            self._data = CalendarData(
+                rows=merge_rows(entries[path][1] for path in stats),
+                version=version,
+            )
+            self._stats = stats
+            return self._data
+
+
+_default_store: Optional[CalendarStore] = None
+
+
+def load_calendar_data() -> CalendarData:
+    """기본 저장소의 캘린더 데이터 (프로세스 내 싱글턴)"""
+    global _default_store
+    if _default_store is None:
+        _default_store = CalendarStore()
+    return _default_store.load()
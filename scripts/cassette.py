@@ -0,0 +1,309 @@
+"""HTTP/yfinance 녹화·재생 (cassette)
+
+실제 실행의 모든 requests 응답과 yfinance 결과 프레임을 파일 하나에 녹화해 두고,
+재생 모드에서는 네트워크 없이 그 응답을 돌려준다. 네트워크 편차 없이
+DataFetcher.fetch_all 이후의 파싱/렌더링 비용만 반복 측정할 때 쓴다.
+
+요청은 (메서드, URL, 쿼리) 기준으로 찾으며 API 키 파라미터는 키와 파일에서 모두 제외한다.
+같은 요청이 여러 번 녹화되면 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복한다.
+
+사용법:
+    CASSETTE_MODE=record python main.py       # 실제 실행을 녹화
+    CASSETTE_MODE=replay python main.py       # 녹화로 재생
+    python cassette.py record                 # 데이터 수집만 녹화
+    python cassette.py replay --repeat 20     # 데이터 수집 재생 20회 시간 측정
+"""
+import argparse
+import base64
+import gzip
+import json
+import statistics
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import config
+from logger import logger
+
+CASSETTE_VERSION = 1
+RECORD, REPLAY = "record", "replay"
+
+# 녹화 파일과 조회 키에서 제외할 쿼리 파라미터 (자격 증명)
+SECRET_PARAMS = frozenset({"api_key", "apikey", "token", "key"})
+
+# 보존할 응답 헤더
+KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+# 패치 전에 없던 속성 표시 (해제 시 삭제)
+_MISSING = object()
+
+
+class CassetteMiss(requests.ConnectionError):
+    """재생 모드에서 녹화에 없는 요청 (네트워크 오류처럼 처리된다)"""
+    pass
+
+
+def request_key(method: str, url: str, params: Any = None, data: Any = None) -> str:
+    """요청 조회 키 (쿼리 정렬, 자격 증명 제외)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if isinstance(params, dict):
+        query += [(str(k), str(v)) for k, v in params.items() if v is not None]
+    elif params:
+        query += [(str(k), str(v)) for k, v in params]
+    query = sorted((k, v) for k, v in query if k.lower() not in SECRET_PARAMS)
+    key = f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))}"
+    if data:
+        key += f" {data if isinstance(data, str) else json.dumps(data, sort_keys=True, default=str)}"
+    return key
+
+
+def frame_to_json(frame) -> Dict:
+    """DataFrame → JSON 호환 dict (MultiIndex 컬럼, 날짜 인덱스 보존)"""
+    columns = [list(c) if isinstance(c, tuple) else c for c in frame.columns]
+    return {
+        "index": [ts.isoformat() for ts in frame.index],
+        "columns": columns,
+        "multi": frame.columns.nlevels > 1,
+        "names": list(frame.columns.names),
+        "data": [[None if v != v else v for v in row] for row in frame.to_numpy(dtype=float).tolist()],
+    }
+
+
+def frame_from_json(payload: Dict):
+    """frame_to_json의 역변환"""
+    import pandas as pd
+
+    if payload["multi"]:
+        columns = pd.MultiIndex.from_tuples([tuple(c) for c in payload["columns"]], names=payload["names"])
+    else:
+        columns = pd.Index(payload["columns"], name=payload["names"][0])
+    index = pd.DatetimeIndex(pd.to_datetime(payload["index"]), name="Date")
+    return pd.DataFrame(payload["data"], index=index, columns=columns, dtype=float)
+
+
+class _ReplayTicker:
+    """재생 모드의 yf.Ticker 대역"""
+
+    def __init__(self, cassette: "Cassette", symbol: str):
+        self._cassette = cassette
+        self.ticker = symbol
+
+    def history(self, period: str = "1mo", **kwargs):
+        return self._cassette._frame("history", self.ticker, period)
+
+
+class _ReplayYFinance:
+    """재생 모드의 yfinance 모듈 대역 (yfinance 미설치 환경에서도 재생 가능)"""
+
+    def __init__(self, cassette: "Cassette"):
+        self._cassette = cassette
+
+    def download(self, tickers: str, period: str = "1mo", **kwargs):
+        return self._cassette._frame("download", tickers, period)
+
+    def Ticker(self, symbol: str) -> _ReplayTicker:
+        return _ReplayTicker(self._cassette, symbol)
+
+
+class Cassette:
+    """녹화/재생 컨텍스트
+
+    with 블록 안에서 requests.Session.request와 data_fetcher의 yfinance 호출을 가로챈다.
+    녹화 모드는 블록이 끝날 때 파일로 저장한다.
+
+    Args:
+        path: 녹화 파일 (.gz로 끝나면 gzip 압축)
+        mode: "record" 또는 "replay"
+    """
+
+    def __init__(self, path: Path, mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"알 수 없는 cassette 모드: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.http: Dict[str, List[Dict]] = {}
+        self.frames: Dict[str, List[Dict]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._restore: List[Tuple[Any, str, Any]] = []
+        if mode == REPLAY:
+            self.load()
+
+    # ------------------------------------------------------------------
+    # 파일
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"지원하지 않는 cassette 버전: {payload.get('version')}")
+        for entry in payload["http"]:
+            self.http.setdefault(entry["key"], []).append(entry)
+        for entry in payload["frames"]:
+            self.frames.setdefault(entry["key"], []).append(entry)
+
+    def save(self) -> Path:
+        payload = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "http": [entry for entries in self.http.values() for entry in entries],
+            "frames": [entry for entries in self.frames.values() for entry in entries],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
+        logger.info(f"cassette 저장: {self.path} (HTTP {len(payload['http'])}개, 프레임 {len(payload['frames'])}개)")
+        return self.path
+
+    # ------------------------------------------------------------------
+    # 녹화/재생
+    # ------------------------------------------------------------------
+    def _next(self, store: Dict[str, List[Dict]], key: str) -> Dict:
+        """key의 다음 녹화 항목 (다 쓰면 마지막 항목 반복)"""
+        entries = store.get(key)
+        if not entries:
+            raise CassetteMiss(f"cassette에 없는 요청: {key}")
+        with self._lock:
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+        return entries[min(index, len(entries) - 1)]
+
+    def _append(self, store: Dict[str, List[Dict]], key: str, entry: Dict) -> None:
+        with self._lock:
+            store.setdefault(key, []).append(entry)
+
+    def _request(self, original, session, method, url, params=None, data=None, json_body=None, **kwargs):
+        key = request_key(method, url, params, data if data is not None else json_body)
+        if self.mode == REPLAY:
+            entry = self._next(self.http, key)
+            response = requests.Response()
+            response.status_code = entry["status"]
+            response._content = base64.b64decode(entry["body"])
+            response.headers = CaseInsensitiveDict(entry["headers"])
+            response.url = key.split(" ", 2)[1]
+            response.reason = "OK" if entry["status"] < 400 else "Replayed Error"
+            response.encoding = "utf-8"
+            return response
+
+        response = original(session, method, url, params=params, data=data, json=json_body, **kwargs)
+        self._append(self.http, key, {
+            "key": key,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+            "body": base64.b64encode(response.content).decode("ascii"),
+        })
+        return response
+
+    def _frame(self, kind: str, symbols: str, period: str):
+        return frame_from_json(self._next(self.frames, f"{kind} {symbols} {period}")["frame"])
+
+    def _record_frame(self, kind: str, symbols: str, period: str, frame) -> None:
+        if frame is not None:
+            key = f"{kind} {symbols} {period}"
+            self._append(self.frames, key, {"key": key, "frame": frame_to_json(frame)})
+
+    # ------------------------------------------------------------------
+    # 패치 설치/해제
+    # ------------------------------------------------------------------
+    def _patch(self, target: Any, name: str, value: Any) -> None:
+        self._restore.append((target, name, getattr(target, name, _MISSING)))
+        setattr(target, name, value)
+
+    def __enter__(self) -> "Cassette":
+        import data_fetcher
+
+        cassette = self
+        original_request = requests.Session.request
+
+        def request(session, method, url, params=None, data=None, headers=None, cookies=None, files=None,
+                    auth=None, timeout=None, allow_redirects=True, proxies=None, hooks=None, stream=None,
+                    verify=None, cert=None, json=None):
+            return cassette._request(original_request, session, method, url, params=params, data=data,
+                                     json_body=json, headers=headers, cookies=cookies, files=files, auth=auth,
+                                     timeout=timeout, allow_redirects=allow_redirects, proxies=proxies,
+                                     hooks=hooks, stream=stream, verify=verify, cert=cert)
+
+        self._cursor.clear()
+        self._patch(requests.Session, "request", request)
+
+        if self.mode == REPLAY:
+            self._patch(data_fetcher, "yf", _ReplayYFinance(self))
+            self._patch(data_fetcher, "YFINANCE_AVAILABLE", True)
+        elif data_fetcher.YFINANCE_AVAILABLE:
+            yf = data_fetcher.yf
+            original_download = yf.download
+            original_history = yf.Ticker.history
+
+            def download(tickers, *args, period="1mo", **kwargs):
+                frame = original_download(tickers, *args, period=period, **kwargs)
+                cassette._record_frame("download", tickers, period, frame)
+                return frame
+
+            def history(ticker, *args, period="1mo", **kwargs):
+                frame = original_history(ticker, *args, period=period, **kwargs)
+                cassette._record_frame("history", ticker.ticker, period, frame)
+                return frame
+
+            self._patch(yf, "download", download)
+            self._patch(yf.Ticker, "history", history)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        while self._restore:
+            target, name, value = self._restore.pop()
+            if value is _MISSING:
+                delattr(target, name)
+            else:
+                setattr(target, name, value)
+        if self.mode == RECORD:
+            self.save()
+
+
+def cassette_from_config():
+    """config.CASSETTE_MODE가 설정돼 있으면 Cassette, 아니면 아무것도 안 하는 컨텍스트"""
+    if not config.CASSETTE_MODE:
+        return nullcontext()
+    logger.info(f"cassette {config.CASSETTE_MODE} 모드: {config.CASSETTE_PATH}")
+    return Cassette(Path(config.CASSETTE_PATH), config.CASSETTE_MODE)
+
+
+def main() -> int:
+    from data_fetcher import DataFetcher
+
+    parser = argparse.ArgumentParser(description="데이터 수집 녹화/재생")
+    parser.add_argument("mode", choices=(RECORD, REPLAY))
+    parser.add_argument("--path", type=Path, default=Path(config.CASSETTE_PATH), help="cassette 파일")
+    parser.add_argument("--repeat", type=int, default=10, help="재생 반복 횟수")
+    args = parser.parse_args()
+
+    if args.mode == RECORD:
+        with Cassette(args.path, RECORD):
+            DataFetcher().fetch_all()
+        return 0
+
+    cassette = Cassette(args.path, REPLAY)
+    timings = []
+    for _ in range(args.repeat):
+        with cassette:
+            start = time.perf_counter()
+            DataFetcher().fetch_all()
+            timings.append(time.perf_counter() - start)
+    print(f"fetch_all 재생 {len(timings)}회: 최소 {min(timings) * 1000:.1f} ms, "
+          f"중앙값 {statistics.median(timings) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,9 +1,13 @@
 """설정 관리 모듈"""
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, FrozenSet, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
+from universe import Universe, UniverseError, load_universe
+
 load_dotenv()
 
 
@@ -12,6 +16,17 @@ class ConfigError(Exception):
     pass
 
 
+# 검증 대상 API 키 (환경변수 이름 = Config 속성 이름)
+CREDENTIAL_KEYS = ("GEMINI_API_KEY", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID", "FRED_API_KEY")
+
+# provider → 활성화에 필요한 키
+CAPABILITY_REQUIREMENTS = {
+    "gemini": ("GEMINI_API_KEY",),
+    "telegram": ("TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"),
+    "fred": ("FRED_API_KEY",),
+}
+
+
 @dataclass
 class Config:
     """애플리케이션 설정"""
@@ -35,6 +50,24 @@ class Config:
     RETRY_BACKOFF: float = 2.0  # 재시도 지수 백오프 배수
     RATE_LIMIT_DELAY: float = 0.5  # API 호출 간 대기 시간 (초)
 
+    # === provider 주소 (로컬 스탠드인 서버 등으로 바꿀 때 환경변수로 지정) ===
+    COINGECKO_BASE_URL: str = field(default_factory=lambda: os.getenv(
+        "COINGECKO_BASE_URL", "https://api.coingecko.com/api/v3"
+    ))
+    FRED_BASE_URL: str = field(default_factory=lambda: os.getenv("FRED_BASE_URL", "https://api.stlouisfed.org/fred"))
+    FEAR_GREED_URL: str = field(default_factory=lambda: os.getenv("FEAR_GREED_URL", "https://api.alternative.me/fng/"))
+    # 지정하면 yfinance 대신 Yahoo chart API(/v8/finance/chart/<심볼>)를 직접 호출
+    YAHOO_CHART_URL: str = field(default_factory=lambda: os.getenv("YAHOO_CHART_URL", ""))
+    YAHOO_CHART_WORKERS: int = 8  # chart API 동시 요청 수
+    TELEGRAM_API_URL: str = field(default_factory=lambda: os.getenv("TELEGRAM_API_URL", "https://api.telegram.org/bot"))
+
+    # === 녹화/재생 (cassette.py) ===
+    # "record": 실제 응답을 녹화, "replay": 녹화로 재생 (네트워크 없음), 빈 값: 사용 안 함
+    CASSETTE_MODE: str = field(default_factory=lambda: os.getenv("CASSETTE_MODE", ""))
+    CASSETTE_PATH: str = field(default_factory=lambda: os.getenv(
+        "CASSETTE_PATH", str(Path(__file__).parent / "data" / "cassette.json.gz")
+    ))
+
     # === 텔레그램 설정 ===
     TELEGRAM_MESSAGE_DELAY: float = 0.5  # 메시지 간 대기 시간 (초)
     TELEGRAM_MAX_MESSAGE_LENGTH: int = 4000  # 메시지 최대 길이
@@ -42,6 +75,17 @@ class Config:
     # === 사이트 설정 ===
     SITE_URL: str = field(default_factory=lambda: os.getenv("SITE_URL", "https://pollmap.github.io/Auto-diary"))
     SITE_AUTHOR: str = field(default_factory=lambda: os.getenv("SITE_AUTHOR", "이찬희"))
+    # 브리핑 표 렌더링: "markdown"(kramdown 표) 또는 "data"(_data/briefings JSON + include)
+    BRIEFING_TABLES: str = field(default_factory=lambda: os.getenv("BRIEFING_TABLES", "markdown"))
+
+    # === 메트릭 설정 ===
+    METRICS_DIR: str = field(default_factory=lambda: os.getenv(
+        "METRICS_DIR", str(Path(__file__).parent.parent / "metrics")
+    ))
+    # main.py --profile 결과 디렉토리
+    PROFILE_DIR: str = field(default_factory=lambda: os.getenv(
+        "PROFILE_DIR", str(Path(__file__).parent.parent / "profiles")
+    ))
 
     # === 데이터 수집 대상 ===
     CRYPTO_IDS: List[str] = field(default_factory=list)
@@ -55,80 +99,70 @@ class Config:
     BONDS: Dict[str, str] = field(default_factory=dict)
     MAG7_STOCKS: Dict[str, str] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """데이터 수집 대상 초기화"""
-        self.CRYPTO_IDS = ["bitcoin", "ethereum", "ripple", "solana", "cardano", "dogecoin", "chainlink"]
-
-        self.US_INDICES = {
-            "S&P 500": "^GSPC",
-            "NASDAQ": "^IXIC",
-            "다우존스": "^DJI",
-            "러셀 2000": "^RUT"
-        }
-
-        self.MARKET_INDICATORS = {
-            "VIX (공포지수)": "^VIX"
-        }
+    # === 시장 폭 (breadth.py) ===
+    # 지수 구성 종목 YAML (비워 두면 시장 폭 섹션 생략)
+    BREADTH_FILE: str = field(default_factory=lambda: os.getenv("BREADTH_FILE", ""))
+    BREADTH_PERIOD: str = "1y"  # 구성 종목 종가 기간 (신고가/신저가 기준)
+    BREADTH_TOP_N: int = 5  # 상승/하락 상위 종목 수
 
-        self.BONDS = {
-            "미국 10년물": "^TNX",
-            "미국 2년물": "^IRX"
-        }
+    # === 이상 변동 (anomaly.py) ===
+    ANOMALY_Z_THRESHOLD: float = 2.0  # 과거 일간 변동 분포 대비 |z|가 이 값 이상이면 이상 변동
+    ANOMALY_SUMMARY_LIMIT: int = 3  # 요약/텔레그램에 보여 줄 최대 항목 수
 
-        self.MAG7_STOCKS = {
-            "애플": "AAPL",
-            "마이크로소프트": "MSFT",
-            "엔비디아": "NVDA",
-            "아마존": "AMZN",
-            "알파벳": "GOOGL",
-            "메타": "META",
-            "테슬라": "TSLA"
-        }
+    # === 보고서 업로드 (upload_manifest.py) ===
+    # 매니페스트 원본 키의 기준 디렉토리 (비워 두면 홈 디렉토리)
+    REPORT_SOURCE_ROOT: str = field(default_factory=lambda: os.getenv("REPORT_SOURCE_ROOT", ""))
 
-        self.US_SECTOR_ETFS = {
-            "기술 (XLK)": "XLK",
-            "금융 (XLF)": "XLF",
-            "에너지 (XLE)": "XLE",
-            "헬스케어 (XLV)": "XLV",
-            "경기소비재 (XLY)": "XLY",
-            "필수소비재 (XLP)": "XLP",
-            "산업재 (XLI)": "XLI",
-            "소재 (XLB)": "XLB",
-            "유틸리티 (XLU)": "XLU",
-            "부동산 (XLRE)": "XLRE",
-            "커뮤니케이션 (XLC)": "XLC"
-        }
-
-        self.GLOBAL_INDICES = {
-            "KOSPI": "^KS11",
-            "KOSDAQ": "^KQ11",
-            "니케이225": "^N225",
-            "항셍": "^HSI",
-            "상해종합": "000001.SS",
-            "DAX": "^GDAXI",
-            "FTSE 100": "^FTSE"
-        }
+    # === 심볼 유니버스 ===
+    UNIVERSE_FILE: str = field(default_factory=lambda: os.getenv("UNIVERSE_FILE", ""))
+    universe: Optional[Universe] = field(default=None, repr=False)
 
-        self.CURRENCIES = {
-            "USD/KRW": "KRW=X",
-            "USD/JPY": "JPY=X",
-            "EUR/USD": "EURUSD=X",
-            "USD/CNY": "CNY=X"
-        }
+    # 검증 결과 캐시: (키 값 튜플, 검증 결과, capability 집합)
+    _validation_cache: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
 
-        self.COMMODITIES = {
-            "WTI 원유": "CL=F",
-            "금": "GC=F",
-            "은": "SI=F",
-            "구리": "HG=F",
-            "천연가스": "NG=F"
+    def __post_init__(self):
+        """데이터 수집 대상 초기화 (universe.yml에서 로드)"""
+        try:
+            self.universe = load_universe(self.UNIVERSE_FILE or None)
+        except UniverseError as e:
+            raise ConfigError(str(e)) from e
+
+        self.CRYPTO_IDS = list(self.universe.crypto)
+        for category, config_key in self.universe.config_keys.items():
+            setattr(self, config_key, dict(self.universe.symbols[category]))
+
+    def _check_keys(self) -> Dict[str, bool]:
+        """API 키 형식 검사 (캐시 없이 매번 계산)"""
+        return {
+            "GEMINI_API_KEY": bool(self.GEMINI_API_KEY and len(self.GEMINI_API_KEY) > 10),
+            "TELEGRAM_BOT_TOKEN": bool(self.TELEGRAM_BOT_TOKEN and ":" in self.TELEGRAM_BOT_TOKEN),
+            "TELEGRAM_CHAT_ID": bool(self.TELEGRAM_CHAT_ID and self.TELEGRAM_CHAT_ID.lstrip("-").isdigit()),
+            "FRED_API_KEY": bool(self.FRED_API_KEY and len(self.FRED_API_KEY) >= 32),
         }
 
-        self.AGRICULTURE = {
-            "옥수수": "ZC=F",
-            "대두": "ZS=F",
-            "소맥": "ZW=F"
-        }
+    def _validated(self) -> Tuple[Mapping[str, bool], FrozenSet[str]]:
+        """검증 결과와 capability 집합 (키 값이 바뀔 때만 재계산)"""
+        key_values = tuple(getattr(self, name) for name in CREDENTIAL_KEYS)
+        cache = self._validation_cache
+        if cache is None or cache[0] != key_values:
+            results = self._check_keys()
+            capabilities = frozenset(
+                provider for provider, required in CAPABILITY_REQUIREMENTS.items()
+                if all(results[name] for name in required)
+            )
+            cache = (key_values, MappingProxyType(results), capabilities)
+            self._validation_cache = cache
+        return cache[1], cache[2]
+
+    @property
+    def capabilities(self) -> FrozenSet[str]:
+        """활성화 가능한 provider 집합 (예: {"telegram", "fred"})"""
+        return self._validated()[1]
+
+    def refresh_from_env(self) -> None:
+        """환경변수에서 API 키를 다시 읽음 (값이 바뀌면 검증 캐시 무효화)"""
+        for name in CREDENTIAL_KEYS:
+            setattr(self, name, os.getenv(name, ""))
 
     def validate_required_keys(self) -> Dict[str, bool]:
         """필수 API 키 검증
@@ -136,33 +170,28 @@ class Config:
         Returns:
             각 API 키의 유효성 여부를 담은 딕셔너리
         """
-        return {
-            "GEMINI_API_KEY": bool(self.GEMINI_API_KEY and len(self.GEMINI_API_KEY) > 10),
-            "TELEGRAM_BOT_TOKEN": bool(self.TELEGRAM_BOT_TOKEN and ":" in self.TELEGRAM_BOT_TOKEN),
-            "TELEGRAM_CHAT_ID": bool(self.TELEGRAM_CHAT_ID and self.TELEGRAM_CHAT_ID.lstrip("-").isdigit()),
-            "FRED_API_KEY": bool(self.FRED_API_KEY and len(self.FRED_API_KEY) >= 32),
-        }
+        return dict(self._validated()[0])
 
     def validate_telegram(self) -> bool:
         """텔레그램 설정 검증"""
-        keys = self.validate_required_keys()
-        return keys["TELEGRAM_BOT_TOKEN"] and keys["TELEGRAM_CHAT_ID"]
+        return "telegram" in self.capabilities
 
     def validate_fred(self) -> bool:
         """FRED API 설정 검증"""
-        return self.validate_required_keys()["FRED_API_KEY"]
+        return "fred" in self.capabilities
 
     def validate_gemini(self) -> bool:
         """Gemini API 설정 검증"""
-        return self.validate_required_keys()["GEMINI_API_KEY"]
+        return "gemini" in self.capabilities
 
     def get_validation_summary(self) -> str:
         """API 키 검증 결과 요약 문자열 반환"""
-        keys = self.validate_required_keys()
+        keys, capabilities = self._validated()
         lines = ["=== API 키 검증 결과 ==="]
         for name, valid in keys.items():
             status = "✅ 유효" if valid else "❌ 없음/무효"
             lines.append(f"  {name}: {status}")
+        lines.append(f"  활성 provider: {', '.join(sorted(capabilities)) or '없음'}")
         return "\n".join(lines)
 
 
@@ -1,10 +1,17 @@
 """데이터 수집 모듈 - yfinance 안정화 버전"""
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote
 import requests
+from breadth import load_breadth_indices
 from config import config
 from logger import logger, LogContext
+from metrics import metrics
+from price_history import series_key
+from market_snapshot import MarketSnapshot, batch_fields
+from quotes import CryptoQuote, Quote, get_quote
 from retry import retry_on_exception
 
 try:
@@ -37,20 +44,24 @@ class DataFetcher:
     """금융 데이터 수집 클래스"""
 
     COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
+    # 종가 다운로드 기간 (스파크라인용 히스토리도 함께 채움)
+    HISTORY_PERIOD = "1mo"
 
     def __init__(self):
+        self.universe = config.universe
+        # "카테고리/이름" → 종가 시계열 (price_history에 병합)
+        self.closes = {}
+        # 배치 다운로드 프레임에서 바로 만든 컬럼형 스냅샷 (개별 다운로드 fallback이면 None)
+        self.batch_snapshot = None
+        # 수집 결과 전체의 컬럼형 스냅샷 (fetch_all 이후)
+        self.snapshot = None
+        # 시장 폭 대상 지수와 구성 종목 (날짜 × 티커) 종가 (BREADTH_FILE이 있을 때)
+        self.breadth_indices = ()
+        self.breadth_closes = None
         self.data = {
             "timestamp": datetime.now().isoformat(),
             "crypto": {},
-            "us_indices": {},
-            "market_indicators": {},
-            "bonds": {},
-            "mag7": {},
-            "us_sectors": {},
-            "global_indices": {},
-            "currencies": {},
-            "commodities": {},
-            "agriculture": {},
+            **{category: {} for category in self.universe.categories},
             "economic_indicators": {},
             "fear_greed": {},
             "economic_calendar": {}
@@ -74,6 +85,11 @@ class DataFetcher:
             # 경제 캘린더
             self._fetch_economic_calendar()
 
+            # 시장 폭 구성 종목
+            self._fetch_breadth_history()
+
+            self.snapshot = self.build_snapshot()
+
             # 결과 요약
             filled = sum(1 for k, v in self.data.items()
                          if isinstance(v, dict) and v and k != "timestamp")
@@ -81,42 +97,41 @@ class DataFetcher:
 
         return self.data
 
+    def build_snapshot(self) -> MarketSnapshot:
+        """수집 결과의 컬럼형 스냅샷 (암호화폐 + 배치 프레임 스냅샷, 없으면 dict에서)"""
+        if self.batch_snapshot is None:
+            return MarketSnapshot.from_market_data(self.data)
+        crypto = MarketSnapshot.from_market_data(self.data, ["crypto"])
+        return MarketSnapshot.concat([crypto, self.batch_snapshot])
+
     # ==========================================================
     # yfinance 배치 다운로드 (핵심 수정!)
     # ==========================================================
     def _fetch_all_yfinance(self) -> None:
         """yfinance로 모든 데이터를 배치 다운로드"""
+        # 심볼 목록과 역매핑은 유니버스 로드 시 한 번만 컴파일됨
+        all_symbols = self.universe.all_symbols
+        symbol_map = self.universe.symbol_map
+
+        # chart API 주소가 지정되면 (로컬 스탠드인 서버 등) yfinance 없이 직접 호출
+        if config.YAHOO_CHART_URL:
+            logger.info(f"Yahoo chart API 다운로드: {len(all_symbols)}개 심볼 ({config.YAHOO_CHART_URL})")
+            try:
+                self._process_batch_data(self._chart_download(list(all_symbols)), symbol_map)
+            except Exception as e:
+                logger.error(f"chart API 다운로드 실패: {e}")
+            return
+
         if not YFINANCE_AVAILABLE:
             logger.error("yfinance를 사용할 수 없습니다")
             return
 
-        # 모든 심볼 수집
-        all_categories = {
-            "us_indices": config.US_INDICES,
-            "market_indicators": config.MARKET_INDICATORS,
-            "bonds": config.BONDS,
-            "mag7": config.MAG7_STOCKS,
-            "us_sectors": config.US_SECTOR_ETFS,
-            "global_indices": config.GLOBAL_INDICES,
-            "currencies": config.CURRENCIES,
-            "commodities": config.COMMODITIES,
-            "agriculture": config.AGRICULTURE,
-        }
-
-        # 심볼 → (카테고리, 이름) 역매핑
-        symbol_map = {}
-        all_symbols = []
-        for category, tickers in all_categories.items():
-            for name, symbol in tickers.items():
-                symbol_map[symbol] = (category, name)
-                all_symbols.append(symbol)
-
         logger.info(f"yfinance 배치 다운로드: {len(all_symbols)}개 심볼")
 
         # 방법 1: yf.download 배치 (한 번에 다운로드)
         try:
-            batch_data = self._batch_download(all_symbols)
-            if batch_data:
+            batch_data = self._batch_download(list(all_symbols))
+            if batch_data is not None:
                 self._process_batch_data(batch_data, symbol_map)
                 return
         except Exception as e:
@@ -124,25 +139,72 @@ class DataFetcher:
 
         # 방법 2: 개별 다운로드 (fallback)
         logger.info("개별 다운로드로 전환...")
-        for category, tickers in all_categories.items():
-            self._fetch_category_individual(tickers, category)
+        for category in self.universe.categories:
+            self._fetch_category_individual(self.universe.symbols[category], category)
+
+    def _download_history(self, symbols: List[str], period: str):
+        """종가 히스토리 배치 다운로드 (chart API 주소가 있으면 chart API, 아니면 yfinance)"""
+        if config.YAHOO_CHART_URL:
+            return self._chart_download(symbols, period)
+        if not YFINANCE_AVAILABLE:
+            raise RuntimeError("yfinance를 사용할 수 없습니다")
+        return self._batch_download(symbols, period)
+
+    @retry_on_exception(max_retries=3, delay=1.0, exceptions=(requests.RequestException,))
+    def _fetch_chart(self, symbol: str, period: Optional[str] = None):
+        """Yahoo chart API로 한 심볼의 일별 종가/거래량 조회 (재시도 적용)"""
+        import pandas as pd
+
+        url = f"{config.YAHOO_CHART_URL}/v8/finance/chart/{quote(symbol, safe='')}"
+        params = {"range": period or self.HISTORY_PERIOD, "interval": "1d"}
+        with metrics.track_request("yahoo_chart"):
+            response = requests.get(url, params=params, timeout=config.REQUEST_TIMEOUT)
+            response.raise_for_status()
+
+        result = response.json()["chart"]["result"][0]
+        quote_data = result["indicators"]["quote"][0]
+        columns = {"Close": quote_data["close"]}
+        if "volume" in quote_data:
+            columns["Volume"] = quote_data["volume"]
+        return pd.DataFrame(columns, index=pd.to_datetime(result["timestamp"], unit="s"), dtype=float)
+
+    def _chart_download(self, symbols: List[str], period: Optional[str] = None):
+        """chart API 동시 호출 결과를 yf.download(group_by="ticker") 형태로 합침"""
+        import pandas as pd
+
+        def fetch(symbol: str):
+            try:
+                return symbol, self._fetch_chart(symbol, period)
+            except Exception as e:
+                logger.warning(f"  chart 조회 실패: {symbol}: {e}")
+                return symbol, None
+
+        with ThreadPoolExecutor(max_workers=config.YAHOO_CHART_WORKERS) as pool:
+            frames = {symbol: frame for symbol, frame in pool.map(fetch, symbols) if frame is not None}
+
+        if not frames:
+            raise ValueError("chart API가 빈 결과를 반환했습니다")
+        if len(symbols) == 1:
+            return next(iter(frames.values()))
+        return pd.concat(frames, axis=1)
 
     @retry_on_exception(max_retries=3, delay=2.0, exceptions=(Exception,))
-    def _batch_download(self, symbols: List[str]) -> dict:
+    def _batch_download(self, symbols: List[str], period: Optional[str] = None) -> dict:
         """yf.download으로 배치 다운로드 (재시도 적용)"""
         import pandas as pd
 
         symbols_str = " ".join(symbols)
         logger.info(f"yf.download 호출: {len(symbols)}개 심볼")
 
-        df = yf.download(
-            symbols_str,
-            period="5d",
-            group_by="ticker",
-            auto_adjust=True,
-            threads=True,
-            progress=False
-        )
+        with metrics.track_request("yfinance"):
+            df = yf.download(
+                symbols_str,
+                period=period or self.HISTORY_PERIOD,
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False
+            )
 
         if df is None or df.empty:
             raise ValueError("yf.download이 빈 결과를 반환했습니다")
@@ -150,68 +212,68 @@ class DataFetcher:
         logger.info(f"yf.download 성공: {df.shape}")
         return df
 
-    def _process_batch_data(self, df, symbol_map: dict) -> None:
-        """배치 다운로드 결과 처리"""
-        import pandas as pd
+    def _process_batch_data(self, df, symbol_map: Mapping[str, Tuple[str, str]]) -> None:
+        """배치 다운로드 결과 처리 (전 종목을 한 번에 배열 연산으로)"""
+        fields = batch_fields(df, list(symbol_map))
+        closes = fields["Close"]
 
-        success_count = 0
-        fail_count = 0
+        snapshot = MarketSnapshot.from_closes(closes, symbol_map, fields.get("Volume"))
+        for i, (symbol, category, name) in enumerate(zip(snapshot.symbols, snapshot.categories, snapshot.names)):
+            category = snapshot.category_names[category]
+            self.data[category][name] = snapshot.quote(i)
+            self.closes[series_key(category, name)] = closes[symbol].dropna()
+        self.batch_snapshot = snapshot
 
         for symbol, (category, name) in symbol_map.items():
-            try:
-                # 단일 심볼이면 컬럼 구조가 다름
-                if len(symbol_map) == 1:
-                    ticker_df = df
-                else:
-                    if symbol not in df.columns.get_level_values(0):
-                        logger.warning(f"  심볼 없음: {symbol} ({name})")
-                        fail_count += 1
-                        continue
-                    ticker_df = df[symbol]
-
-                # Close 데이터가 있는 행만 필터링
-                close_data = ticker_df['Close'].dropna()
-
-                if len(close_data) >= 1:
-                    current = float(close_data.iloc[-1])
-                    prev = float(close_data.iloc[-2]) if len(close_data) >= 2 else current
-                    change = ((current - prev) / prev) * 100 if prev != 0 else 0
-
-                    self.data[category][name] = {
-                        "price": round(current, 2),
-                        "change": round(change, 2)
-                    }
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-            except Exception as e:
-                logger.warning(f"  처리 실패: {symbol} ({name}): {e}")
-                fail_count += 1
+            if symbol not in closes.columns:
+                logger.warning(f"  심볼 없음: {symbol} ({name})")
 
+        success_count = len(snapshot)
+        fail_count = len(symbol_map) - success_count
         logger.info(f"배치 처리 결과: 성공 {success_count}, 실패 {fail_count}")
+        metrics.inc("symbols_total", success_count, provider="yfinance", status="ok")
+        metrics.inc("symbols_total", fail_count, provider="yfinance", status="error")
 
     def _fetch_category_individual(self, tickers: Dict[str, str], category: str) -> None:
         """개별 종목 다운로드 (fallback)"""
         for name, symbol in tickers.items():
             try:
                 ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d")
+                with metrics.track_request("yfinance"):
+                    hist = ticker.history(period=self.HISTORY_PERIOD)
 
                 if len(hist) >= 1:
+                    self.closes[series_key(category, name)] = hist['Close'].dropna()
                     current = hist['Close'].iloc[-1]
                     prev = hist['Close'].iloc[-2] if len(hist) >= 2 else current
                     change = ((current - prev) / prev) * 100 if prev != 0 else 0
 
-                    self.data[category][name] = {
-                        "price": round(float(current), 2),
-                        "change": round(float(change), 2)
-                    }
+                    self.data[category][name] = Quote(round(float(current), 2), round(float(change), 2))
+                    metrics.inc("symbols_total", provider="yfinance", status="ok")
+                else:
+                    metrics.inc("symbols_total", provider="yfinance", status="error")
 
                 time.sleep(config.RATE_LIMIT_DELAY)
 
             except Exception as e:
                 logger.warning(f"개별 수집 실패 {name} ({symbol}): {e}")
+                metrics.inc("symbols_total", provider="yfinance", status="error")
+
+    def _fetch_breadth_history(self) -> None:
+        """시장 폭 구성 종목 종가 히스토리 수집 (BREADTH_FILE이 있을 때만)"""
+        if not config.BREADTH_FILE:
+            return
+
+        try:
+            with LogContext("시장 폭 구성 종목 수집"):
+                indices = load_breadth_indices(config.BREADTH_FILE)
+                symbols = list(dict.fromkeys(s for index in indices for s in index.symbols))
+                logger.info(f"시장 폭 구성 종목 다운로드: {len(indices)}개 지수, {len(symbols)}개 심볼")
+                frame = self._download_history(symbols, config.BREADTH_PERIOD)
+                self.breadth_closes = batch_fields(frame, symbols)["Close"]
+                self.breadth_indices = indices
+        except Exception as e:
+            logger.error(f"시장 폭 구성 종목 수집 오류: {e}")
 
     # ==========================================================
     # CoinGecko (암호화폐)
@@ -219,14 +281,15 @@ class DataFetcher:
     @retry_on_exception(max_retries=3, delay=1.0, exceptions=(requests.RequestException,))
     def _fetch_coingecko(self, ids: str) -> dict:
         """CoinGecko API 호출 (재시도 적용)"""
-        url = f"{self.COINGECKO_BASE_URL}/simple/price"
+        url = f"{config.COINGECKO_BASE_URL or self.COINGECKO_BASE_URL}/simple/price"
         params = {
             "ids": ids,
             "vs_currencies": "usd,krw",
             "include_24hr_change": "true"
         }
-        response = requests.get(url, params=params, timeout=config.REQUEST_TIMEOUT)
-        response.raise_for_status()
+        with metrics.track_request("coingecko"):
+            response = requests.get(url, params=params, timeout=config.REQUEST_TIMEOUT)
+            response.raise_for_status()
         return response.json()
 
     def fetch_crypto(self) -> None:
@@ -236,23 +299,14 @@ class DataFetcher:
                 ids = ",".join(config.CRYPTO_IDS)
                 raw_data = self._fetch_coingecko(ids)
 
-                name_map = {
-                    "bitcoin": "BTC",
-                    "ethereum": "ETH",
-                    "ripple": "XRP",
-                    "solana": "SOL",
-                    "cardano": "ADA",
-                    "dogecoin": "DOGE",
-                    "chainlink": "LINK"
-                }
-
-                for coin_id, coin_name in name_map.items():
+                for coin_id, coin_name in self.universe.crypto.items():
                     if coin_id in raw_data:
-                        self.data["crypto"][coin_name] = {
-                            "price_usd": raw_data[coin_id].get("usd"),
-                            "price_krw": raw_data[coin_id].get("krw"),
-                            "change_24h": raw_data[coin_id].get("usd_24h_change")
-                        }
+                        coin = raw_data[coin_id]
+                        self.data["crypto"][coin_name] = CryptoQuote(
+                            coin.get("usd"), coin.get("usd_24h_change"), coin.get("krw"))
+                        metrics.inc("symbols_total", provider="coingecko", status="ok")
+                    else:
+                        metrics.inc("symbols_total", provider="coingecko", status="error")
                 logger.info(f"암호화폐 {len(self.data['crypto'])}개 수집")
         except Exception as e:
             logger.error(f"암호화폐 수집 오류: {e}")
@@ -265,7 +319,7 @@ class DataFetcher:
         if not FRED_AVAILABLE:
             logger.info("FRED fetcher를 사용할 수 없습니다")
             return
-        if not config.validate_fred():
+        if "fred" not in config.capabilities:
             logger.warning("FRED API 키가 없어 경제지표 수집 건너뜀")
             return
 
@@ -288,8 +342,8 @@ class DataFetcher:
         try:
             with LogContext("Fear & Greed 지수 수집"):
                 fetcher = FearGreedFetcher()
-                vix = self.data.get("market_indicators", {}).get("VIX (공포지수)", {}).get("price")
-                sp500_change = self.data.get("us_indices", {}).get("S&P 500", {}).get("change")
+                vix = get_quote(self.data, "market_indicators", "VIX (공포지수)").price
+                sp500_change = get_quote(self.data, "us_indices", "S&P 500").change
                 self.data["fear_greed"] = fetcher.fetch_all(vix, sp500_change)
         except Exception as e:
             logger.error(f"Fear & Greed 수집 오류: {e}")
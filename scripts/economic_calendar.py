@@ -1,8 +1,8 @@
 """경제 캘린더 수집 모듈"""
-import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import json
+from datetime import date, datetime
+from typing import Dict, List
+
+from calendar_engine import CalendarEngine, build_engine
 
 
 class EconomicCalendarFetcher:
@@ -24,146 +24,54 @@ class EconomicCalendarFetcher:
         self.finnhub_key = finnhub_key
         self.ecos_key = ecos_key
 
-    def get_upcoming_fed_events(self) -> List[Dict]:
-        """주요 연준 이벤트 일정 (하드코딩 + 동적)"""
-        # 2025년 FOMC 일정 (공개 정보)
-        fomc_dates_2025 = [
-            {"date": "2025-01-29", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-03-19", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-05-07", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-06-18", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-07-30", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-09-17", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-11-05", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2025-12-17", "event": "FOMC 금리결정", "importance": "high"},
-        ]
-
-        # 2026년 FOMC 일정
-        fomc_dates_2026 = [
-            {"date": "2026-01-28", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-03-18", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-05-06", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-06-17", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-07-29", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-09-16", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-11-04", "event": "FOMC 금리결정", "importance": "high"},
-            {"date": "2026-12-16", "event": "FOMC 금리결정", "importance": "high"},
-        ]
-
-        all_fomc = fomc_dates_2025 + fomc_dates_2026
-
-        # 오늘 기준 앞으로 30일 이내 이벤트만 필터링
-        today = datetime.now().date()
-        end_date = today + timedelta(days=30)
+    def _engine(self, today: date) -> CalendarEngine:
+        """전년~내년 범위로 전개된 캘린더 엔진 (연도별 캐시)"""
+        return build_engine(today.year - 1, today.year + 1)
 
-        upcoming = []
-        for event in all_fomc:
-            event_date = datetime.strptime(event["date"], "%Y-%m-%d").date()
-            if today <= event_date <= end_date:
-                days_until = (event_date - today).days
-                upcoming.append({
-                    **event,
-                    "days_until": days_until,
-                    "display": f"D-{days_until}" if days_until > 0 else "오늘"
-                })
+    def _today(self) -> date:
+        """기준일 (오늘)"""
+        return datetime.now().date()
 
+    def get_upcoming_fed_events(self) -> List[Dict]:
+        """주요 연준 이벤트 일정 (앞으로 30일 이내)"""
+        today = self._today()
+        upcoming = []
+        for event in self._engine(today).upcoming(today, 30, kind="fomc"):
+            days_until = (event.date - today).days
+            upcoming.append({
+                **event.to_dict(),
+                "days_until": days_until,
+                "display": f"D-{days_until}" if days_until > 0 else "오늘"
+            })
         return upcoming
 
     def get_key_us_economic_events(self) -> List[Dict]:
-        """주요 미국 경제지표 발표 일정"""
-        # 일반적인 발표 주기 기반 예상 일정
-        today = datetime.now()
-        current_month = today.month
-        current_year = today.year
-
-        # 매월 발표되는 주요 지표들의 일반적인 발표일
-        monthly_events = [
-            {"day_range": (1, 7), "event": "ISM 제조업 PMI", "importance": "high"},
-            {"day_range": (3, 7), "event": "ISM 서비스업 PMI", "importance": "high"},
-            {"day_range": (1, 7), "event": "비농업 고용 (NFP)", "importance": "high"},
-            {"day_range": (10, 14), "event": "CPI (소비자물가지수)", "importance": "high"},
-            {"day_range": (14, 18), "event": "소매판매", "importance": "medium"},
-            {"day_range": (17, 22), "event": "주택착공건수", "importance": "medium"},
-            {"day_range": (25, 30), "event": "PCE 물가지수", "importance": "high"},
-            {"day_range": (25, 30), "event": "GDP (분기별)", "importance": "high"},
-        ]
-
-        events = []
-        today_day = today.day
-
-        for evt in monthly_events:
-            # 이번 달 발표 예상
-            if today_day <= evt["day_range"][1]:
-                est_day = (evt["day_range"][0] + evt["day_range"][1]) // 2
-                events.append({
-                    "date": f"{current_year}-{current_month:02d}-{est_day:02d}",
-                    "event": evt["event"],
-                    "importance": evt["importance"],
-                    "note": "예상 발표일"
-                })
-
-        return events
+        """주요 미국 경제지표 발표 일정 (앞으로 30일 이내)"""
+        today = self._today()
+        return [e.to_dict() for e in self._engine(today).upcoming(today, 30, kind="economic")]
 
     def get_weekly_indicators_schedule(self) -> List[Dict]:
-        """주간 경제지표 일정"""
-        # 매주 목요일: 신규 실업수당 청구건수
-        today = datetime.now()
-        thursday = today + timedelta(days=(3 - today.weekday()) % 7)
-
-        return [
-            {
-                "date": thursday.strftime("%Y-%m-%d"),
-                "event": "신규 실업수당 청구건수",
-                "importance": "medium",
-                "frequency": "매주 목요일"
-            }
-        ]
+        """주간 경제지표 일정 (다음 발표일)"""
+        today = self._today()
+        return [e.to_dict() for e in self._engine(today).upcoming(today, 6, kind="weekly")]
 
     def get_earnings_highlights(self) -> List[Dict]:
-        """주요 기업 실적 발표 일정 (수동 업데이트 필요)"""
-        # 실적 시즌에 중요한 기업들 - 분기마다 업데이트 필요
-        # Q4 2024 / Q1 2025 실적 시즌 예시
-        earnings_calendar = [
-            # 이 부분은 실제로는 API나 스크래핑으로 가져와야 함
-            # 예시 데이터
-        ]
-
-        today = datetime.now().date()
-        end_date = today + timedelta(days=14)
-
-        upcoming = []
-        for event in earnings_calendar:
-            event_date = datetime.strptime(event["date"], "%Y-%m-%d").date()
-            if today <= event_date <= end_date:
-                upcoming.append(event)
-
-        return upcoming
+        """주요 기업 실적 발표 일정 (캘린더 데이터 기준 14일 이내)"""
+        today = self._today()
+        return [e.to_dict() for e in self._engine(today).upcoming(today, 14, kind="earnings")]
 
     def get_this_week_highlights(self) -> Dict:
-        """이번 주 주요 이벤트 요약"""
-        fed_events = self.get_upcoming_fed_events()
-        us_events = self.get_key_us_economic_events()
-        weekly = self.get_weekly_indicators_schedule()
-
-        # 이번 주만 필터링 (7일 이내)
-        today = datetime.now().date()
-        week_end = today + timedelta(days=7)
-
-        def filter_this_week(events):
-            result = []
-            for e in events:
-                try:
-                    event_date = datetime.strptime(e["date"], "%Y-%m-%d").date()
-                    if today <= event_date <= week_end:
-                        result.append(e)
-                except:
-                    pass
-            return result
+        """이번 주 주요 이벤트 요약 (7일 이내)"""
+        today = self._today()
+        engine = self._engine(today)
+
+        def this_week(kind: str) -> List[Dict]:
+            return [e.to_dict() for e in engine.upcoming(today, 7, kind=kind)]
 
         return {
-            "fed": filter_this_week(fed_events),
-            "economic": filter_this_week(us_events),
-            "weekly": filter_this_week(weekly),
+            "fed": this_week("fomc"),
+            "economic": this_week("economic"),
+            "weekly": this_week("weekly"),
             "earnings": self.get_earnings_highlights()
         }
 
@@ -2,23 +2,29 @@
 import requests
 from typing import Dict, Optional
 from datetime import datetime
+from config import config
+from metrics import metrics
 
 
 class FearGreedFetcher:
     """CNN Fear & Greed Index 및 Crypto Fear & Greed 수집"""
 
-    # Alternative.me Crypto Fear & Greed API (무료)
+    # Alternative.me Crypto Fear & Greed API (무료, config.FEAR_GREED_URL로 변경 가능)
     CRYPTO_FG_URL = "https://api.alternative.me/fng/"
 
     # CNN Fear & Greed는 공식 API가 없어서 대안 사용
     # rapid api나 스크래핑 대신 계산된 값 사용
 
+    def __init__(self):
+        self.crypto_fg_url = config.FEAR_GREED_URL or self.CRYPTO_FG_URL
+
     def fetch_crypto_fear_greed(self) -> Optional[Dict]:
         """암호화폐 Fear & Greed Index 수집"""
         try:
             params = {"limit": 2, "format": "json"}
-            response = requests.get(self.CRYPTO_FG_URL, params=params, timeout=10)
-            response.raise_for_status()
+            with metrics.track_request("alternative_me"):
+                response = requests.get(self.crypto_fg_url, params=params, timeout=10)
+                response.raise_for_status()
 
             data = response.json()
             fg_data = data.get("data", [])
@@ -3,6 +3,7 @@ import requests
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from config import config
+from metrics import metrics
 
 
 class FREDFetcher:
@@ -62,6 +63,7 @@ class FREDFetcher:
 
     def __init__(self):
         self.api_key = config.FRED_API_KEY
+        self.base_url = config.FRED_BASE_URL or self.BASE_URL
 
     def _fetch_series(self, series_id: str, limit: int = 2) -> Optional[Dict]:
         """FRED 시리즈 데이터 조회"""
@@ -69,7 +71,7 @@ class FREDFetcher:
             return None
 
         try:
-            url = f"{self.BASE_URL}/series/observations"
+            url = f"{self.base_url}/series/observations"
             params = {
                 "series_id": series_id,
                 "api_key": self.api_key,
@@ -78,8 +80,9 @@ class FREDFetcher:
                 "limit": limit
             }
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with metrics.track_request("fred"):
+                response = requests.get(url, params=params, timeout=10)
+                response.raise_for_status()
 
             data = response.json()
             observations = data.get("observations", [])
@@ -113,7 +116,7 @@ class FREDFetcher:
             return None
 
         try:
-            url = f"{self.BASE_URL}/series/observations"
+            url = f"{self.base_url}/series/observations"
             # 13개월치 데이터 가져오기 (현재 + 12개월 전)
             params = {
                 "series_id": series_id,
@@ -123,8 +126,9 @@ class FREDFetcher:
                 "limit": 13
             }
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with metrics.track_request("fred"):
+                response = requests.get(url, params=params, timeout=10)
+                response.raise_for_status()
 
             data = response.json()
             observations = data.get("observations", [])
@@ -3,6 +3,18 @@ import os
 from google import genai
 from google.genai import types
 from config import config
+from quotes import iter_quotes
+
+# 프롬프트 데이터 섹션 (카테고리, 제목)
+PROMPT_SECTIONS = (
+    ("us_indices", "미국 증시"),
+    ("us_sectors", "미국 섹터 ETF"),
+    ("global_indices", "글로벌 지수"),
+    ("crypto", "암호화폐"),
+    ("currencies", "환율"),
+    ("commodities", "원자재"),
+    ("agriculture", "농산물"),
+)
 
 
 class GeminiClient:
@@ -51,49 +63,12 @@ class GeminiClient:
     def _format_data_for_prompt(self, data: dict) -> str:
         """데이터를 프롬프트용 텍스트로 변환"""
         lines = []
-
-        # 미국 지수
-        lines.append("### 미국 증시")
-        for name, info in data.get("us_indices", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
-
-        # 섹터 ETF
-        lines.append("\n### 미국 섹터 ETF")
-        for name, info in data.get("us_sectors", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
-
-        # 글로벌 지수
-        lines.append("\n### 글로벌 지수")
-        for name, info in data.get("global_indices", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
-
-        # 암호화폐
-        lines.append("\n### 암호화폐")
-        for name, info in data.get("crypto", {}).items():
-            if info.get("price_usd"):
-                change = info.get('change_24h', 0) or 0
-                lines.append(f"- {name}: ${info['price_usd']:,.2f} ({change:+.2f}%)")
-
-        # 환율
-        lines.append("\n### 환율")
-        for name, info in data.get("currencies", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
-
-        # 원자재
-        lines.append("\n### 원자재")
-        for name, info in data.get("commodities", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
-
-        # 농산물
-        lines.append("\n### 농산물")
-        for name, info in data.get("agriculture", {}).items():
-            if info.get("price"):
-                lines.append(f"- {name}: {info['price']:,.2f} ({info['change']:+.2f}%)")
+        for category, title in PROMPT_SECTIONS:
+            lines.append(f"\n### {title}" if lines else f"### {title}")
+            unit = "$" if category == "crypto" else ""
+            for name, quote in iter_quotes(data.get(category)):
+                if quote.price:
+                    lines.append(f"- {name}: {unit}{quote.price:,.2f} ({quote.change or 0:+.2f}%)")
 
         return "\n".join(lines)
 
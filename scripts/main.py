@@ -1,23 +1,49 @@
-"""메인 실행 스크립트"""
+"""메인 실행 스크립트
+
+사용법:
+    python main.py                  # 브리핑 생성
+    python main.py --profile        # 단계별 프로파일 저장 (PROFILE_DIR/<실행 시각>/)
+"""
+import argparse
 import sys
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
+from anomaly import ReturnStats, detect_anomalies
+from breadth import compute_market_breadth
+from cassette import cassette_from_config
 from config import config
 from logger import logger, LogContext
+from market_snapshot import MarketSnapshot
+from metrics import metrics
 from data_fetcher import DataFetcher
-from post_generator import PostGenerator
+from post_generator import DATA_TEMPLATE, PostGenerator
+from post_index import PostIndex
+from price_history import PriceHistory
+from profiler import StageProfiler
+from quotes import get_quote
+from regime import compute_regime
+from rolling_stats import RollingStatsCache
+from search_index import build_search_index
+from snapshot_api import publish_snapshot
 from telegram_notifier import TelegramNotifier
 
 
-def generate_simple_summary(data: dict) -> str:
-    """데이터 기반 간단 요약 생성 (AI 없이)"""
+def generate_simple_summary(data: dict, snapshot: Optional[MarketSnapshot] = None) -> str:
+    """데이터 기반 간단 요약 생성 (AI 없이)
+
+    Args:
+        snapshot: data의 컬럼형 스냅샷 (없으면 data에서 필요한 카테고리만 생성)
+    """
+    if snapshot is None:
+        snapshot = MarketSnapshot.from_market_data(data, ["mag7"])
     lines = []
 
     # VIX 상태
-    vix = data.get("market_indicators", {}).get("VIX (공포지수)", {})
-    if vix.get("price"):
-        vix_val = vix["price"]
+    vix_val = get_quote(data, "market_indicators", "VIX (공포지수)").price
+    if vix_val:
         if vix_val < 15:
             lines.append(f"VIX {vix_val:.1f}로 시장은 낙관적 분위기다.")
         elif vix_val < 20:
@@ -28,14 +54,10 @@ def generate_simple_summary(data: dict) -> str:
             lines.append(f"VIX {vix_val:.1f}로 공포 구간에 진입했다.")
 
     # 미국 증시 요약
-    us = data.get("us_indices", {})
-    if us:
-        sp500 = us.get("S&P 500", {})
-        nasdaq = us.get("NASDAQ", {})
-        dow = us.get("다우존스", {})
-        sp_chg = sp500.get("change")
-        nas_chg = nasdaq.get("change")
-        dow_chg = dow.get("change")
+    if data.get("us_indices"):
+        sp_chg = get_quote(data, "us_indices", "S&P 500").change
+        nas_chg = get_quote(data, "us_indices", "NASDAQ").change
+        dow_chg = get_quote(data, "us_indices", "다우존스").change
 
         if sp_chg is not None:
             # 상승/하락/혼조 판단: 모든 지수 고려
@@ -53,37 +75,34 @@ def generate_simple_summary(data: dict) -> str:
             lines.append(f"미국 증시는 S&P 500 {sp_chg:+.2f}%, 나스닥 {nas_chg or 0:+.2f}%, 다우 {dow_chg or 0:+.2f}%로 {direction} 마감.")
 
     # 빅테크 요약
-    mag7 = data.get("mag7", {})
-    if mag7:
-        valid_items = [(k, v) for k, v in mag7.items() if v.get('change') is not None]
-        if valid_items:
-            best = max(valid_items, key=lambda x: x[1]['change'])
-            worst = min(valid_items, key=lambda x: x[1]['change'])
-            lines.append(f"빅테크 중 {best[0]}({best[1]['change']:+.2f}%) 강세, {worst[0]}({worst[1]['change']:+.2f}%) 약세.")
+    best = snapshot.top_movers(1, "mag7")
+    if len(best):
+        best, worst = best[0], snapshot.top_movers(1, "mag7", ascending=True)[0]
+        lines.append(f"빅테크 중 {snapshot.names[best]}({snapshot.changes[best]:+.2f}%) 강세, "
+                     f"{snapshot.names[worst]}({snapshot.changes[worst]:+.2f}%) 약세.")
+
+    # 통계적 이상 변동 (과거 일간 변동 분포 대비)
+    anomalies = data.get("anomalies", [])[:config.ANOMALY_SUMMARY_LIMIT]
+    if anomalies:
+        moves = ", ".join(f"{a['name']} {a['change']:+.2f}%({a['z']:+.1f}σ)" for a in anomalies)
+        lines.append(f"이례적 변동: {moves}.")
 
     # 암호화폐 요약
-    crypto = data.get("crypto", {})
-    if crypto:
-        btc = crypto.get("BTC", {})
-        eth = crypto.get("ETH", {})
-        if btc.get("price_usd") and btc.get("change_24h") is not None:
-            direction = "상승" if btc["change_24h"] > 0 else "하락"
-            lines.append(f"BTC ${btc['price_usd']:,.0f}({btc['change_24h']:+.2f}%), ETH ${eth.get('price_usd', 0):,.0f}({eth.get('change_24h', 0):+.2f}%).")
+    btc = get_quote(data, "crypto", "BTC")
+    eth = get_quote(data, "crypto", "ETH")
+    if btc.price and btc.change is not None:
+        lines.append(f"BTC ${btc.price:,.0f}({btc.change:+.2f}%), ETH ${eth.price or 0:,.0f}({eth.change or 0:+.2f}%).")
 
     # 환율 요약
-    currencies = data.get("currencies", {})
-    if currencies:
-        usdkrw = currencies.get("USD/KRW", {})
-        if usdkrw.get("price"):
-            lines.append(f"원/달러 {usdkrw['price']:,.0f}원({usdkrw.get('change', 0):+.2f}%).")
+    usdkrw = get_quote(data, "currencies", "USD/KRW")
+    if usdkrw.price:
+        lines.append(f"원/달러 {usdkrw.price:,.0f}원({usdkrw.change or 0:+.2f}%).")
 
     # 원자재 요약
-    commodities = data.get("commodities", {})
-    if commodities:
-        gold = commodities.get("금", {})
-        oil = commodities.get("WTI 원유", {})
-        if gold.get("price") and oil.get("price"):
-            lines.append(f"금 ${gold['price']:,.0f}, WTI ${oil['price']:.2f}.")
+    gold = get_quote(data, "commodities", "금")
+    oil = get_quote(data, "commodities", "WTI 원유")
+    if gold.price and oil.price:
+        lines.append(f"금 ${gold.price:,.0f}, WTI ${oil.price:.2f}.")
 
     # Fear & Greed 요약
     fear_greed = data.get("fear_greed", {})
@@ -102,44 +121,194 @@ def generate_simple_summary(data: dict) -> str:
     return " ".join(lines) if lines else "오늘의 시황 데이터를 확인하세요."
 
 
-def main():
-    """시황 브리핑 자동 생성 메인 함수"""
-    with LogContext("시황 브리핑 생성"):
-        # API 키 검증 결과 출력
-        logger.info(config.get_validation_summary())
-
-        # 1. 데이터 수집
-        logger.info("1. 데이터 수집 시작...")
-        fetcher = DataFetcher()
-        market_data = fetcher.fetch_all()
-        logger.info(f"   데이터 수집 완료: {len(market_data)} 카테고리")
-
-        # 2. 간단 요약 생성 (AI 없이)
-        logger.info("2. 요약 생성 중...")
-        summary = generate_simple_summary(market_data)
-        logger.info(f"   요약 생성 완료: {len(summary)}자")
-
-        # 3. 포스트 생성
-        logger.info("3. 마크다운 포스트 생성 중...")
-        generator = PostGenerator()
-        post_path = generator.generate_briefing_post(market_data, summary)
-        logger.info(f"   포스트 생성: {post_path}")
-
-        # 4. 텔레그램 알림
-        logger.info("4. 텔레그램 알림 발송 중...")
-        date_str = datetime.now().strftime("%Y/%m/%d")
-        post_url = f"{config.SITE_URL}/market/briefing/{date_str}/daily-market-briefing"
-
-        notifier = TelegramNotifier()
-        result = notifier.send_sync(market_data, post_url)
-        if result:
-            logger.info("   알림 발송 완료")
-        else:
-            logger.warning("   알림 발송 실패 또는 건너뜀")
+def export_metrics(run_id: str) -> None:
+    """실행 메트릭을 Prometheus textfile + JSON으로 저장"""
+    try:
+        prom_path, json_path = metrics.export(Path(config.METRICS_DIR), run_id)
+        logger.info(f"메트릭 저장: {prom_path}, {json_path}")
+    except Exception as e:
+        logger.warning(f"메트릭 저장 실패: {e}")
+
+
+def update_price_history(fetcher: DataFetcher, market_data: dict) -> PriceHistory:
+    """수집한 종가/현재가를 가격 히스토리에 누적 (실패해도 브리핑은 계속)"""
+    history = PriceHistory()
+    try:
+        history = PriceHistory.load()
+        history.merge_closes(fetcher.closes)
+        history.record(market_data, skip=[key for key, closes in fetcher.closes.items() if len(closes)])
+        history.save()
+        logger.info(f"   가격 히스토리: {len(history)}일 × {len(history.keys)}개 항목")
+    except Exception as e:
+        logger.warning(f"가격 히스토리 갱신 실패: {e}")
+    return history
+
+
+def update_market_breadth(fetcher: DataFetcher, market_data: dict) -> None:
+    """구성 종목 종가로 시장 폭을 계산해 market_data["breadth"]에 저장 (실패해도 브리핑은 계속)"""
+    if fetcher.breadth_closes is None:
+        return
+    try:
+        breadth = compute_market_breadth(fetcher.breadth_closes, fetcher.breadth_indices, config.BREADTH_TOP_N)
+        market_data["breadth"] = {"period": config.BREADTH_PERIOD, **breadth}
+        for index in breadth["indices"]:
+            logger.info(f"   시장 폭 {index['name']}: 상승 {index['advancers']}, 하락 {index['decliners']}, "
+                        f"신고가 {index['new_highs']}, 신저가 {index['new_lows']}")
+    except Exception as e:
+        logger.warning(f"시장 폭 계산 실패: {e}")
+
+
+def update_regime(history: PriceHistory, market_data: dict) -> None:
+    """가격 히스토리로 자산 간 상관/국면 패널을 계산해 market_data["regime"]에 저장 (실패해도 브리핑은 계속)"""
+    try:
+        regime = compute_regime(history)
+        if not regime:
+            logger.info("   상관/국면: 히스토리 부족으로 건너뜀")
+            return
+        market_data["regime"] = regime
+        logger.info(f"   상관/국면: {len(regime['keys'])}개 시리즈, {regime['regime']['label']}")
+    except Exception as e:
+        logger.warning(f"상관/국면 계산 실패: {e}")
+
+
+def update_trend(history: PriceHistory, market_data: dict) -> None:
+    """새 봉만 이동 통계 캐시에 반영하고 파생 지표를 market_data["trend"]에 저장 (실패해도 브리핑은 계속)"""
+    try:
+        cache = RollingStatsCache.load()
+        added = cache.update(history)
+        cache.save()
+        market_data["trend"] = cache.indicators()
+        logger.info(f"   추세 지표: 새 봉 {added}개 반영 ({len(cache)}개 시리즈)")
+    except Exception as e:
+        logger.warning(f"추세 지표 갱신 실패: {e}")
+
+
+def update_anomalies(snapshot: Optional[MarketSnapshot], history: PriceHistory, market_data: dict) -> None:
+    """오늘 변동을 시리즈별 누적 통계와 비교해 market_data["anomalies"]에 저장 (실패해도 브리핑은 계속)"""
+    if snapshot is None:
+        return
+    try:
+        stats = ReturnStats.load()
+        seeded = stats.seed(history, snapshot.series_keys())
+        market_data["anomalies"] = detect_anomalies(snapshot, stats, config.ANOMALY_Z_THRESHOLD)
+        stats.save()
+        logger.info(f"   이상 변동: {len(market_data['anomalies'])}개 (통계 {len(stats)}개 시리즈, 신규 {seeded}개)")
+    except Exception as e:
+        logger.warning(f"이상 변동 계산 실패: {e}")
+
+
+def reconcile_post_index() -> None:
+    """손/git으로 추가, 수정, 삭제된 포스트를 아카이브 인덱스에 반영 (실패해도 브리핑은 계속)"""
+    try:
+        PostIndex().reconcile()
+    except Exception as e:
+        logger.warning(f"포스트 인덱스 점검 실패: {e}")
+
+
+def update_search_index() -> None:
+    """사이트 검색 인덱스 갱신 (실패해도 브리핑은 계속)"""
+    try:
+        build_search_index()
+    except Exception as e:
+        logger.warning(f"검색 인덱스 갱신 실패: {e}")
+
+
+def update_snapshot_api(market_data: dict) -> None:
+    """정적 JSON API(api/v1) 갱신 (실패해도 브리핑은 계속)"""
+    try:
+        publish_snapshot(market_data)
+    except Exception as e:
+        logger.warning(f"정적 API 갱신 실패: {e}")
+
+
+def stage(name: str, profiler: Optional[StageProfiler] = None) -> ExitStack:
+    """단계 시간 기록 (profiler가 있으면 단계 프로파일도 저장)"""
+    stack = ExitStack()
+    stack.enter_context(metrics.timer("stage_seconds", stage=name))
+    if profiler is not None:
+        stack.enter_context(profiler.stage(name))
+    return stack
+
+
+def main(profile_dir: Optional[Path] = None):
+    """시황 브리핑 자동 생성 메인 함수
+
+    Args:
+        profile_dir: 지정하면 단계별 프로파일(.prof, .folded, 메모리 보고서)을 저장
+    """
+    run_id = datetime.now().strftime("%Y-%m-%d")
+    profiler = StageProfiler(profile_dir) if profile_dir else None
+    try:
+        with LogContext("시황 브리핑 생성"):
+            # API 키 검증 결과 출력
+            logger.info(config.get_validation_summary())
+
+            # 1. 데이터 수집
+            logger.info("1. 데이터 수집 시작...")
+            with stage("fetch", profiler), cassette_from_config():
+                fetcher = DataFetcher()
+                market_data = fetcher.fetch_all()
+            logger.info(f"   데이터 수집 완료: {len(market_data)} 카테고리")
+            history = update_price_history(fetcher, market_data)
+            with stage("breadth", profiler):
+                update_market_breadth(fetcher, market_data)
+            with stage("regime", profiler):
+                update_regime(history, market_data)
+            with stage("trend", profiler):
+                update_trend(history, market_data)
+            with stage("anomaly", profiler):
+                update_anomalies(fetcher.snapshot, history, market_data)
+
+            # 2. 간단 요약 생성 (AI 없이)
+            logger.info("2. 요약 생성 중...")
+            with stage("summary", profiler):
+                summary = generate_simple_summary(market_data, fetcher.snapshot)
+            logger.info(f"   요약 생성 완료: {len(summary)}자")
+
+            # 3. 포스트 생성
+            logger.info("3. 마크다운 포스트 생성 중...")
+            with stage("post", profiler):
+                template = DATA_TEMPLATE if config.BRIEFING_TABLES == "data" else None
+                generator = PostGenerator(template_path=template, history=history, post_index=PostIndex())
+                post_path = generator.generate_briefing_post(market_data, summary)
+            logger.info(f"   포스트 생성: {post_path}")
+
+            with stage("post_index", profiler):
+                reconcile_post_index()
+            with stage("search_index", profiler):
+                update_search_index()
+            with stage("snapshot_api", profiler):
+                update_snapshot_api(market_data)
+
+            # 4. 텔레그램 알림
+            logger.info("4. 텔레그램 알림 발송 중...")
+            date_str = datetime.now().strftime("%Y/%m/%d")
+            post_url = f"{config.SITE_URL}/market/briefing/{date_str}/daily-market-briefing"
+
+            with stage("telegram", profiler):
+                notifier = TelegramNotifier()
+                result = notifier.send_sync(market_data, post_url)
+            if result:
+                logger.info("   알림 발송 완료")
+            else:
+                logger.warning("   알림 발송 실패 또는 건너뜀")
+    finally:
+        # 실패한 실행도 메트릭은 남긴다
+        export_metrics(run_id)
+        if profiler is not None:
+            profiler.close()
+            logger.info(f"프로파일 저장 위치: {profile_dir}")
 
     logger.info("시황 브리핑 생성 완료!")
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="시황 브리핑 자동 생성")
+    parser.add_argument("--profile", action="store_true", help="단계별 프로파일 저장")
+    parser.add_argument("--profile-dir", type=Path, default=Path(config.PROFILE_DIR),
+                        help="프로파일 저장 디렉토리 (실행 시각별 하위 디렉토리 생성)")
+    args = parser.parse_args()
+
+    profile_dir = args.profile_dir / datetime.now().strftime("%Y%m%d-%H%M%S") if args.profile else None
+    sys.exit(main(profile_dir))
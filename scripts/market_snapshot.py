@@ -0,0 +1,206 @@
+"""컬럼형 시세 스냅샷
+
+심볼이 수천 개일 때 정렬/필터/순위 계산을 파이썬 루프 대신 배열 연산으로 하기 위한
+market_data의 병렬 표현. 종목마다 한 행이고, 열은 NumPy 배열이다.
+
+    symbols     티커 (object)
+    names       표시 이름 (object)
+    categories  카테고리 코드 (category_names의 위치)
+    prices      현재가 (float64, 없으면 NaN)
+    changes     전일 대비 변동률 % (float64, 없으면 NaN)
+    volumes     거래량 (float64, 없으면 NaN)
+
+행은 카테고리 순으로 정렬돼 있어 카테고리별 행은 연속 구간(slice)이고, 카테고리 안의
+순서는 원래 순서를 따른다. DataFetcher가 배치 다운로드 프레임에서 바로 만들고
+(fetcher.snapshot), dict만 있을 때는 MarketSnapshot.from_market_data로 만든다.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from price_history import series_key
+from quotes import CryptoQuote, Quote, iter_quotes
+
+# 가격 표가 아닌 market_data 최상위 키
+NON_QUOTE_KEYS = ("timestamp", "economic_indicators", "fear_greed", "economic_calendar", "breadth",
+                  "regime", "anomalies", "trend")
+
+
+def batch_fields(df, symbols: Sequence[str]) -> Dict[str, Any]:
+    """yf.download(group_by="ticker") 프레임 → 필드별 (날짜 × 티커) 프레임
+
+    심볼이 하나면 yfinance가 티커 레벨 없이 돌려주므로 맞춰 준다.
+    """
+    import pandas as pd
+
+    if df.columns.nlevels == 1:
+        df = pd.concat({symbols[0]: df}, axis=1)
+    return {field: df.xs(field, axis=1, level=1) for field in df.columns.get_level_values(1).unique()}
+
+
+def last_two(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(날짜 × 종목) 배열에서 종목별 마지막 값과 그 직전 값 (NaN 건너뜀, 없으면 NaN)"""
+    rows, cols = values.shape
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    positions = np.arange(rows)[:, None]
+    order = np.where(valid, positions, -1)
+    last = order.max(axis=0)
+    prev = np.where(order < last, order, -1).max(axis=0)
+    take = np.arange(cols)
+    current = np.where(count >= 1, values[np.maximum(last, 0), take], np.nan)
+    previous = np.where(count >= 2, values[np.maximum(prev, 0), take], current)
+    return current, previous
+
+
+def select_top(values: np.ndarray, n: int, largest: bool = True) -> np.ndarray:
+    """값 상위(largest=False면 하위) n개 위치 (NaN 제외, 동률은 앞선 위치가 먼저)
+
+    전체를 정렬하지 않고 argpartition으로 n번째 값을 찾은 뒤 후보 n개만 정렬한다.
+    """
+    keys = values if not largest else -values
+    candidates = np.flatnonzero(~np.isnan(keys))
+    if n <= 0 or not len(candidates):
+        return candidates[:0]
+    if n < len(candidates):
+        kth = keys[candidates[np.argpartition(keys[candidates], n - 1)[n - 1]]]
+        better = candidates[keys[candidates] < kth]
+        ties = candidates[keys[candidates] == kth][:n - len(better)]
+        candidates = np.concatenate([better, ties])
+    return candidates[np.argsort(keys[candidates], kind="stable")]
+
+
+class MarketSnapshot:
+    """컬럼형 시세 스냅샷 (모듈 docstring 참고)"""
+
+    def __init__(self, symbols: Sequence[str], names: Sequence[str], categories: Sequence[str],
+                 prices: Iterable[float], changes: Iterable[float], volumes: Optional[Iterable[float]] = None):
+        category_names = tuple(dict.fromkeys(categories))
+        lookup = {name: i for i, name in enumerate(category_names)}
+        codes = np.array([lookup[c] for c in categories], dtype=np.int16)
+        order = np.argsort(codes, kind="stable")
+
+        self.category_names: Tuple[str, ...] = category_names
+        self.categories = codes[order]
+        self.symbols = np.array(symbols, dtype=object)[order]
+        self.names = np.array(names, dtype=object)[order]
+        self.prices = np.asarray(prices, dtype=float)[order]
+        self.changes = np.asarray(changes, dtype=float)[order]
+        self.volumes = (np.asarray(volumes, dtype=float)[order] if volumes is not None
+                        else np.full(len(order), np.nan))
+        bounds = np.searchsorted(self.categories, np.arange(len(category_names) + 1))
+        # 카테고리 → 행 구간
+        self.index: Dict[str, slice] = {
+            name: slice(int(bounds[i]), int(bounds[i + 1])) for i, name in enumerate(category_names)
+        }
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_closes(cls, closes, symbol_map: Mapping[str, Tuple[str, str]],
+                    volumes=None) -> "MarketSnapshot":
+        """(날짜 × 티커) 종가 프레임에서 생성 (값이 하나도 없는 티커는 제외)
+
+        변동률은 마지막 두 종가로 계산하고, 표시와 같게 소수 둘째 자리로 반올림한다.
+        """
+        tickers = [symbol for symbol in symbol_map if symbol in closes.columns]
+        current, previous = last_two(closes[tickers].to_numpy(dtype=float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.where(previous != 0, (current - previous) / previous * 100, 0.0)
+        keep = ~np.isnan(current)
+
+        volume = None
+        if volumes is not None:
+            volume, _ = last_two(volumes.reindex(columns=tickers).to_numpy(dtype=float))
+            volume = volume[keep]
+
+        tickers = [symbol for symbol, ok in zip(tickers, keep) if ok]
+        return cls(
+            tickers,
+            [symbol_map[symbol][1] for symbol in tickers],
+            [symbol_map[symbol][0] for symbol in tickers],
+            [round(float(v), 2) for v in current[keep]],
+            [round(float(v), 2) for v in change[keep]],
+            volume,
+        )
+
+    @classmethod
+    def from_market_data(cls, data: Mapping, categories: Optional[Iterable[str]] = None,
+                         tickers: Optional[Mapping[str, Mapping[str, str]]] = None) -> "MarketSnapshot":
+        """market_data(dict)에서 생성
+
+        Args:
+            categories: 포함할 카테고리 (없으면 가격 표 전부)
+            tickers: 카테고리 → 이름 → 티커 (없으면 유니버스, 모르는 이름은 이름 그대로)
+        """
+        if tickers is None:
+            from universe import load_universe
+            tickers = load_universe().symbols
+        wanted = [k for k in data if k not in NON_QUOTE_KEYS] if categories is None else list(categories)
+        rows = [(tickers.get(category, {}).get(name, name), name, category, quote)
+                for category in wanted for name, quote in iter_quotes(data.get(category))]
+        return cls(
+            [row[0] for row in rows],
+            [row[1] for row in rows],
+            [row[2] for row in rows],
+            [np.nan if row[3].price is None else row[3].price for row in rows],
+            [np.nan if row[3].change is None else row[3].change for row in rows],
+        )
+
+    @classmethod
+    def concat(cls, snapshots: Sequence["MarketSnapshot"]) -> "MarketSnapshot":
+        """여러 스냅샷을 순서대로 합침"""
+        return cls(
+            [s for snap in snapshots for s in snap.symbols],
+            [n for snap in snapshots for n in snap.names],
+            [snap.category_names[c] for snap in snapshots for c in snap.categories],
+            np.concatenate([snap.prices for snap in snapshots]) if snapshots else [],
+            np.concatenate([snap.changes for snap in snapshots]) if snapshots else [],
+            np.concatenate([snap.volumes for snap in snapshots]) if snapshots else [],
+        )
+
+    def rows(self, category: Optional[str] = None) -> slice:
+        """카테고리의 행 구간 (없으면 전체, 모르는 카테고리는 빈 구간)"""
+        if category is None:
+            return slice(0, len(self))
+        return self.index.get(category, slice(0, 0))
+
+    def series_keys(self) -> List[str]:
+        """행별 가격 히스토리 키 ("카테고리/이름")"""
+        return [series_key(self.category_names[code], name) for code, name in zip(self.categories, self.names)]
+
+    def quote(self, i: int) -> Quote:
+        """i번째 행의 Quote (crypto 행도 원화 가격은 없음)"""
+        price, change = self.prices[i], self.changes[i]
+        quote_cls = CryptoQuote if self.category_names[self.categories[i]] == "crypto" else Quote
+        return quote_cls(None if np.isnan(price) else float(price), None if np.isnan(change) else float(change))
+
+    def top_movers(self, n: int, category: Optional[str] = None, ascending: bool = False) -> np.ndarray:
+        """변동률 상위(ascending이면 하위) n개 행 번호
+
+        변동률이 없는 행은 제외하고, 같은 값이면 원래 순서가 앞선 행이 먼저다.
+        """
+        rows = self.rows(category)
+        return rows.start + select_top(self.changes[rows], n, largest=not ascending)
+
+    def category_stats(self) -> Dict[str, Dict[str, float]]:
+        """카테고리별 종목 수, 상승/하락/보합 수, 평균 변동률 (변동률 있는 종목 기준)"""
+        size = len(self.category_names)
+        valid = ~np.isnan(self.changes)
+        codes = self.categories[valid]
+        changes = self.changes[valid]
+        count = np.bincount(codes, minlength=size)
+        up = np.bincount(codes, weights=changes > 0, minlength=size)
+        down = np.bincount(codes, weights=changes < 0, minlength=size)
+        total = np.bincount(codes, weights=changes, minlength=size)
+        return {
+            name: {
+                "count": int(count[i]),
+                "advancers": int(up[i]),
+                "decliners": int(down[i]),
+                "unchanged": int(count[i] - up[i] - down[i]),
+                "mean_change": float(total[i] / count[i]) if count[i] else float("nan"),
+            }
+            for i, name in enumerate(self.category_names)
+        }
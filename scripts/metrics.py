@@ -0,0 +1,229 @@
+"""실행 메트릭 수집 모듈
+
+프로세스 내 카운터/히스토그램 레지스트리.
+실행 종료 시 Prometheus textfile 형식과 JSON으로 내보낸다.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+# 메트릭 이름 접두사 (Prometheus 네임스페이스)
+NAMESPACE = "autodiary"
+
+# 지연시간 히스토그램 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 메트릭 설명 (Prometheus HELP 라인)
+METRIC_HELP = {
+    "provider_requests_total": "외부 API 요청 수 (provider, status별)",
+    "provider_request_seconds": "외부 API 요청 지연시간 (초)",
+    "retry_attempts_total": "재시도 횟수 (함수별)",
+    "retry_exhausted_total": "재시도 소진 후 최종 실패 횟수 (함수별)",
+    "symbols_total": "심볼 수집 결과 (provider, status별)",
+    "cache_requests_total": "캐시 조회 결과 (cache, result별)",
+    "stage_seconds": "파이프라인 단계별 소요시간 (초)",
+    "telegram_messages_total": "텔레그램 메시지 발송 결과 (status별)",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    """라벨 딕셔너리를 정렬된 튜플 키로 변환"""
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    """Prometheus 라벨 문자열 생성"""
+    pairs = key + extra
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+def _escape_label(value: str) -> str:
+    """라벨 값 이스케이프 (역슬래시, 따옴표, 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """le 버킷별 누적 카운트"""
+        total = 0
+        result = []
+        for c in self.counts:
+            total += c
+            result.append(total)
+        return result
+
+    def to_dict(self) -> Dict:
+        return {
+            "buckets": {str(b): c for b, c in zip(self.buckets, self.cumulative())},
+            "sum": round(self.sum, 6),
+            "count": self.count,
+        }
+
+
+class MetricsRegistry:
+    """카운터/히스토그램 레지스트리"""
+
+    def __init__(self, namespace: str = NAMESPACE):
+        self.namespace = namespace
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """카운터 증가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """히스토그램에 관측값 기록"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram()
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """블록 실행 시간을 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @contextmanager
+    def track_request(self, provider: str) -> Iterator[None]:
+        """외부 API 요청의 지연시간과 성공/실패를 기록"""
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.observe("provider_request_seconds", time.perf_counter() - start, provider=provider)
+            self.inc("provider_requests_total", provider=provider, status=status)
+
+    def get_counter(self, name: str, **labels) -> float:
+        """카운터 현재값 조회 (없으면 0)"""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def get_histogram(self, name: str, **labels):
+        """히스토그램 조회 (없으면 None)"""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def reset(self) -> None:
+        """모든 메트릭 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict:
+        """JSON 직렬화 가능한 메트릭 스냅샷"""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [{"labels": dict(key), **hist.to_dict()} for key, hist in series.items()]
+                for name, series in self._histograms.items()
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Prometheus textfile 형식 문자열 생성"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                full = f"{self.namespace}_{name}"
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {full} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {full} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{full}{_format_labels(key)} {value:g}")
+
+            for name in sorted(self._histograms):
+                full = f"{self.namespace}_{name}"
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {full} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {full} histogram")
+                for key, hist in sorted(self._histograms[name].items()):
+                    for bound, count in zip(hist.buckets, hist.cumulative()):
+                        lines.append(f"{full}_bucket{_format_labels(key, (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{full}_bucket{_format_labels(key, (('le', '+Inf'),))} {hist.count}")
+                    lines.append(f"{full}_sum{_format_labels(key)} {hist.sum:.6f}")
+                    lines.append(f"{full}_count{_format_labels(key)} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> Path:
+        """Prometheus textfile 저장 (node_exporter textfile collector 호환)"""
+        return _write_atomic(Path(path), self.to_prometheus())
+
+    def write_json(self, path: Path, **meta) -> Path:
+        """JSON 스냅샷 저장"""
+        payload = {**meta, **self.snapshot()}
+        return _write_atomic(Path(path), json.dumps(payload, ensure_ascii=False, indent=2))
+
+    def export(self, out_dir: Path, run_id: str) -> Tuple[Path, Path]:
+        """실행 종료 시 textfile + 실행별 JSON 저장
+
+        Args:
+            out_dir: 출력 디렉토리
+            run_id: 실행 식별자 (JSON 파일명에 사용)
+
+        Returns:
+            (Prometheus 파일 경로, JSON 파일 경로)
+        """
+        out_dir = Path(out_dir)
+        prom_path = self.write_prometheus(out_dir / f"{self.namespace}.prom")
+        json_path = self.write_json(out_dir / f"metrics-{run_id}.json", run_id=run_id)
+        return prom_path, json_path
+
+
+def _write_atomic(path: Path, text: str) -> Path:
+    """임시 파일에 쓴 뒤 교체 (수집기가 반쯤 쓰인 파일을 읽지 않도록)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+# 기본 레지스트리 인스턴스
+metrics = MetricsRegistry()
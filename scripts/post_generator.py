@@ -1,156 +1,381 @@
-"""Jekyll 포스트 생성 모듈"""
+"""Jekyll 포스트 생성 모듈
+
+브리핑 레이아웃은 templates/briefing.md에 있고, ${이름} 자리표시자를 한 번만
+분해(컴파일)해 캐시한 뒤 write 콜백 하나로 스트리밍 렌더링한다.
+"""
+import io
+import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from string import Template
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from post_index import PostIndex
+from price_history import PriceHistory, load_price_history, series_key
+from quotes import get_quote, iter_quotes
+from sparkline import render_sparklines
+from universe import load_universe
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+DEFAULT_TEMPLATE = TEMPLATE_DIR / "briefing.md"
+# 표를 _data/briefings/*.json에서 Liquid include로 렌더링하는 레이아웃
+DATA_TEMPLATE = TEMPLATE_DIR / "briefing-data.md"
+
+BRIEFING_DATA_VERSION = 1
+
+# 템플릿 표 필드 → (data 카테고리, 표시 그룹, 헤더)
+TABLE_SPECS = {
+    "bonds": ("bonds", None, ['채권', '금리(%)', '변동']),
+    "us_indices": ("us_indices", None, ['지수', '종가', '변동']),
+    "mag7": ("mag7", None, ['종목', '주가($)', '변동']),
+    "us_sectors": ("us_sectors", None, ['섹터', '종가', '변동']),
+    "asia_indices": ("global_indices", "아시아", ['지수', '종가', '변동']),
+    "europe_indices": ("global_indices", "유럽", ['지수', '종가', '변동']),
+    "currencies": ("currencies", None, ['통화쌍', '환율', '변동']),
+    "commodities": ("commodities", None, ['품목', '가격', '변동']),
+    "agriculture": ("agriculture", None, ['품목', '가격', '변동']),
+}
+CRYPTO_HEADERS = ['코인', '가격 (USD)', '가격 (KRW)', '24h 변동']
+
+# 스파크라인 열 (히스토리가 있는 표에만 추가)
+SPARK_HEADER = '30일'
+SPARK_POINTS = 30
+
+# 추세 표 대상 카테고리 (이동 통계 캐시의 파생 지표)
+TREND_CATEGORIES = ('us_indices', 'global_indices')
+
+WEEKDAYS_KR = ('월', '화', '수', '목', '금', '토', '일')
+
+Writer = Callable[[str], Any]
+
+
+def change_class(change: Optional[float], precision: int = 2) -> str:
+    """변동값 → CSS 클래스 (표시 자릿수로 반올림해 +0.00%는 보합)"""
+    if change is None:
+        return "chg-flat"
+    rounded = round(change, precision)
+    return "chg-up" if rounded > 0 else "chg-down" if rounded < 0 else "chg-flat"
+
+
+def format_change(change: Optional[float], suffix: str = "%") -> str:
+    """변동값을 색상 클래스가 붙은 span으로 (없으면 '-')
+
+    market-colors.js가 페이지마다 td를 훑던 작업을 생성 시점으로 옮긴 것.
+    """
+    if change is None:
+        return "-"
+    return f'<span class="{change_class(change)}">{change:+.2f}{suffix}</span>'
+
+
+def signal(emoji: str) -> str:
+    """신호 이모지 (🟢🟡🔴 등) 강조 span"""
+    return f'<span class="signal">{emoji}</span>'
+
+
+class TemplateError(ValueError):
+    """브리핑 템플릿 형식 오류"""
+    pass
+
+
+class CompiledTemplate:
+    """${이름} 자리표시자를 미리 (리터럴, 필드) 조각으로 분해한 템플릿
+
+    문법은 string.Template과 같다 ($$는 $ 그대로).
+    render 시 필드 값이 호출 가능하면 write를 넘겨 직접 쓰게 한다.
+    """
+
+    def __init__(self, text: str):
+        ops = []
+        literal = []
+        pos = 0
+        for match in Template.pattern.finditer(text):
+            literal.append(text[pos:match.start()])
+            pos = match.end()
+            if match.group("escaped") is not None:
+                literal.append("$")
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                line = text.count("\n", 0, match.start()) + 1
+                raise TemplateError(f"잘못된 자리표시자 ({line}행)")
+            ops.append(("".join(literal), name))
+            literal = []
+        literal.append(text[pos:])
+        ops.append(("".join(literal), None))
+
+        self.ops: Tuple[Tuple[str, Optional[str]], ...] = tuple(ops)
+        self.fields = frozenset(name for _, name in ops if name)
+
+    def render(self, write: Writer, context: Mapping[str, Any]) -> None:
+        """context로 렌더링해 write에 순서대로 출력
+
+        Raises:
+            TemplateError: context에 없는 필드
+        """
+        missing = self.fields - context.keys()
+        if missing:
+            raise TemplateError(f"템플릿 필드 값 없음: {sorted(missing)}")
+        for literal, name in self.ops:
+            if literal:
+                write(literal)
+            if name is not None:
+                value = context[name]
+                if callable(value):
+                    value(write)
+                else:
+                    write(str(value))
+
+
+# 경로 → (mtime_ns, CompiledTemplate)
+_template_cache: Dict[str, Tuple[int, CompiledTemplate]] = {}
+_template_lock = threading.Lock()
+
+
+def load_template(path: Path = DEFAULT_TEMPLATE) -> CompiledTemplate:
+    """템플릿 로드 (파일 mtime이 바뀌지 않았으면 캐시 반환)"""
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime_ns
+    key = str(path)
+    with _template_lock:
+        cached = _template_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        template = CompiledTemplate(path.read_text(encoding="utf-8"))
+        _template_cache[key] = (mtime, template)
+        return template
+
+
+def _capture(render: Callable[..., None], *args) -> str:
+    """write 기반 렌더러의 출력을 문자열로"""
+    buf = io.StringIO()
+    render(buf.write, *args)
+    return buf.getvalue()
 
 
 class PostGenerator:
-    """마크다운 포스트 생성기"""
-
-    def __init__(self, posts_dir: str = "../_posts/market"):
+    """마크다운 포스트 생성기
+
+    포스트와 함께 같은 날짜의 구조화 데이터를 _data/briefings/YYYY-MM-DD.json에 저장한다.
+
+    Args:
+        posts_dir: 포스트 저장 디렉토리 (scripts/ 기준)
+        template_path: 브리핑 템플릿 (없으면 templates/briefing.md,
+            DATA_TEMPLATE이면 표를 JSON 데이터에서 렌더링)
+        data_dir: 브리핑 JSON 저장 디렉토리 (scripts/ 기준). 없으면 사이트 루트의
+            _data/briefings (posts_dir이 _posts 하위가 아니면 posts_dir/_data/briefings)
+        history: 스파크라인용 종가 히스토리 (없으면 data/price_history.csv)
+        post_index: 포스트를 쓴 뒤 갱신할 아카이브/카테고리/태그 인덱스 (없으면 갱신 안 함)
+    """
+
+    def __init__(self, posts_dir: str = "../_posts/market", template_path: Optional[Path] = None,
+                 data_dir: Optional[str] = None, history: Optional[PriceHistory] = None,
+                 post_index: Optional[PostIndex] = None):
         self.posts_dir = Path(__file__).parent / posts_dir
         self.posts_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_briefing_post(self, data: Dict, summary: str) -> str:
-        """시황 브리핑 포스트 생성"""
-        now = datetime.now()
+        self.template_path = Path(template_path) if template_path else DEFAULT_TEMPLATE
+        if data_dir:
+            self.data_dir = Path(__file__).parent / data_dir
+        else:
+            site_root = self.posts_dir.parent.parent if self.posts_dir.parent.name == "_posts" else self.posts_dir
+            self.data_dir = site_root / "_data" / "briefings"
+        self.history = history
+        self.post_index = post_index
+
+    def generate_briefing_post(self, data: Dict, summary: str, now: Optional[datetime] = None) -> str:
+        """시황 브리핑 포스트 생성 (now를 주면 해당 날짜로, 백필용)"""
+        now = now or datetime.now()
         date_str = now.strftime("%Y-%m-%d")
         filename = f"{date_str}-daily-market-briefing.md"
 
-        content = self._build_post_content(data, summary, now)
+        # 데이터 파일과 포스트가 같은 스파크라인을 쓰므로 한 번만 생성
+        sparks = self._sparklines(data)
+
+        # 포스트가 참조하므로 데이터 파일을 먼저 저장
+        self.write_briefing_data(data, summary, now, sparks)
 
         filepath = self.posts_dir / filename
-        filepath.write_text(content, encoding="utf-8")
+        tmp_path = filepath.with_name(f".{filename}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            self.render(f.write, data, summary, now, sparks)
+        os.replace(tmp_path, filepath)
 
+        if self.post_index is not None:
+            self.post_index.update([filepath])
         return str(filepath)
 
+    def write_briefing_data(self, data: Dict, summary: str, now: datetime,
+                            sparks: Optional[Mapping[str, str]] = None) -> Path:
+        """브리핑 구조화 데이터를 _data/briefings/YYYY-MM-DD.json으로 저장"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        path = self.data_dir / f"{now.strftime('%Y-%m-%d')}.json"
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.build_briefing_data(data, summary, now, sparks), f,
+                      ensure_ascii=False, indent=2, default=str)
+            f.write("\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def build_briefing_data(self, data: Dict, summary: str, now: datetime,
+                            sparks: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """브리핑 구조화 데이터
+
+        tables의 각 행은 원본 숫자와 함께 표시 문자열(display)과 변동 클래스(class)를 가져
+        Liquid에서 가공 없이 바로 출력할 수 있다. sparks가 없으면 여기서 생성한다.
+        """
+        if sparks is None:
+            sparks = self._sparklines(data)
+        tables = {key: self._table_data(data, key, sparks) for key in TABLE_SPECS}
+
+        crypto_rows = []
+        for name, quote in iter_quotes(data.get('crypto')):
+            price_usd, price_krw, change = quote.price, quote.price_krw, quote.change
+            if price_usd is None:
+                continue
+            crypto_rows.append({
+                "name": name,
+                "price_usd": price_usd,
+                "price_krw": price_krw,
+                "change": change,
+                "display": [f"${price_usd:,.2f}", f"₩{price_krw:,.0f}" if price_krw else "-",
+                            f"{change:+.2f}%" if change is not None else "-"],
+                "class": change_class(change) if change is not None else "",
+                "spark": sparks.get(series_key('crypto', name), ""),
+            })
+        tables["crypto"] = {"headers": CRYPTO_HEADERS, "rows": crypto_rows,
+                            "spark": any(row["spark"] for row in crypto_rows)}
+
+        return {
+            "version": BRIEFING_DATA_VERSION,
+            "date": now.strftime('%Y-%m-%d'),
+            "generated_at": now.strftime('%Y-%m-%dT%H:%M:%S+09:00'),
+            "summary": summary,
+            "tables": tables,
+            "market_indicators": {name: dict(quote) for name, quote in iter_quotes(data.get('market_indicators'))},
+            "fear_greed": data.get('fear_greed', {}),
+            "economic_indicators": data.get('economic_indicators', {}),
+            "economic_calendar": data.get('economic_calendar', {}),
+            "breadth": data.get('breadth', {}),
+            "regime": data.get('regime', {}),
+            "anomalies": data.get('anomalies', []),
+            "trend": data.get('trend', {}),
+        }
+
+    def _sparklines(self, data: Dict) -> Dict[str, str]:
+        """표에 나오는 모든 항목의 스파크라인을 한 번에 생성
+
+        Returns:
+            "카테고리/이름" → 인라인 SVG (히스토리가 부족한 항목은 제외)
+        """
+        history = self.history if self.history is not None else load_price_history()
+        if not len(history):
+            return {}
+        keys = [series_key(TABLE_SPECS[key][0], name) for key in TABLE_SPECS for name in self._table_rows(data, key)]
+        keys += [series_key('crypto', name) for name in data.get('crypto', {})]
+        keys, matrix = history.matrix(dict.fromkeys(keys), SPARK_POINTS)
+        return {key: svg for key, svg in zip(keys, render_sparklines(matrix)) if svg}
+
+    def _table_rows(self, data: Dict, key: str) -> Dict:
+        """TABLE_SPECS 필드의 원본 행 (표시 그룹 필터 적용)"""
+        category, group_name, _ = TABLE_SPECS[key]
+        rows = data.get(category, {})
+        if group_name:
+            keys = load_universe().group(category, group_name)
+            rows = {k: v for k, v in rows.items() if k in keys}
+        return rows
+
+    def _table_data(self, data: Dict, key: str, sparks: Mapping[str, str]) -> Dict[str, Any]:
+        category = TABLE_SPECS[key][0]
+        rows = []
+        for name, quote in iter_quotes(self._table_rows(data, key)):
+            price, change = quote.price, quote.change
+            if price is None:
+                continue
+            rows.append({
+                "name": name,
+                "price": price,
+                "change": change,
+                "display": [f"{price:,.2f}", f"{change:+.2f}%" if change is not None else "-"],
+                "class": change_class(change) if change is not None else "",
+                "spark": sparks.get(series_key(category, name), ""),
+            })
+        return {"headers": TABLE_SPECS[key][2], "rows": rows, "spark": any(row["spark"] for row in rows)}
+
+    def render(self, write: Writer, data: Dict, summary: str, now: datetime,
+               sparks: Optional[Mapping[str, str]] = None) -> None:
+        """브리핑을 write로 스트리밍 렌더링 (sparks가 없으면 여기서 생성)"""
+        load_template(self.template_path).render(write, self._template_context(data, summary, now, sparks))
+
     def _build_post_content(self, data: Dict, summary: str, now: datetime) -> str:
         """포스트 내용 구성"""
+        return _capture(self.render, data, summary, now)
 
-        # 요일 한글 변환
-        weekdays = ['월', '화', '수', '목', '금', '토', '일']
-        weekday_kr = weekdays[now.weekday()]
-
-        front_matter = f"""---
-layout: post
-title: "3분 시황 브리핑 - {now.strftime('%Y년 %m월 %d일')}"
-date: {now.strftime('%Y-%m-%d %H:%M:%S')} +0900
-categories: [market, briefing]
-tags: [시황, 증시, 암호화폐, 원자재]
-author: 이찬희
----
-
-"""
-
+    def _template_context(self, data: Dict, summary: str, now: datetime,
+                          sparks: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """템플릿 필드 값 (표/섹션은 write를 받는 렌더러)"""
         # VIX 값 가져오기
-        vix_data = data.get('market_indicators', {}).get('VIX (공포지수)', {})
-        vix_value = vix_data.get('price', '-')
-        vix_change = vix_data.get('change', 0)
+        vix = get_quote(data, 'market_indicators', 'VIX (공포지수)')
+        vix_value = vix.price if vix.price is not None else '-'
+        vix_change = vix.change if vix.price is not None else 0
         vix_status = "안정" if vix_value != '-' and vix_value < 20 else "주의" if vix_value != '-' and vix_value < 30 else "공포"
 
-        body = f"""
-> {now.strftime('%Y년 %m월 %d일')} ({weekday_kr}) 오전 6:00 기준
-
----
-
-## 📋 오늘의 핵심
-
-{summary}
-
----
-
-## 📊 시장 심리 지표
-
-| 지표 | 값 | 변동 | 상태 |
-|------|-----|------|------|
-| VIX (공포지수) | {vix_value} | {vix_change:+.2f}% | {vix_status} |
-
-{self._format_fear_greed(data.get('fear_greed', {}))}
-
-### 채권 금리
-{self._format_table(data.get('bonds', {}), ['채권', '금리(%)', '변동'])}
-
-{self._format_economic_indicators(data.get('economic_indicators', {}))}
-
----
-
-## 🇺🇸 미국 증시
-
-### 주요 지수
-{self._format_table(data.get('us_indices', {}), ['지수', '종가', '변동'])}
-
-### 빅테크 (MAG7)
-{self._format_table(data.get('mag7', {}), ['종목', '주가($)', '변동'])}
-
-### 섹터 ETF
-{self._format_table(data.get('us_sectors', {}), ['섹터', '종가', '변동'])}
-
----
-
-## 🌏 글로벌 증시
-
-### 아시아
-{self._format_filtered_table(data.get('global_indices', {}), ['KOSPI', 'KOSDAQ', '니케이225', '항셍', '상해종합'], ['지수', '종가', '변동'])}
-
-### 유럽
-{self._format_filtered_table(data.get('global_indices', {}), ['DAX', 'FTSE 100'], ['지수', '종가', '변동'])}
-
----
-
-## 🪙 암호화폐
-
-{self._format_crypto_table(data.get('crypto', {}))}
-
----
-
-## 💱 외환
-
-{self._format_table(data.get('currencies', {}), ['통화쌍', '환율', '변동'])}
-
----
-
-## 🛢️ 원자재
-
-### 에너지 & 금속
-{self._format_table(data.get('commodities', {}), ['품목', '가격', '변동'])}
-
-### 농산물
-{self._format_table(data.get('agriculture', {}), ['품목', '가격', '변동'])}
-
----
-
-## 📅 경제 캘린더
-
-{self._format_economic_calendar(data.get('economic_calendar', {}))}
-
----
-
-*{now.strftime('%Y.%m.%d')} | 찬희의 투자노트*
-"""
-
-        return front_matter + body
+        if sparks is None:
+            sparks = self._sparklines(data)
+
+        def table(key: str) -> Writer:
+            category, _, headers = TABLE_SPECS[key]
+            return lambda w: self._write_table(w, self._table_rows(data, key), headers, sparks, category)
+
+        context = {
+            "date_long": now.strftime('%Y년 %m월 %d일'),
+            "date_short": now.strftime('%Y.%m.%d'),
+            "timestamp": now.strftime('%Y-%m-%d %H:%M:%S'),
+            "data_key": now.strftime('%Y-%m-%d'),
+            "weekday": WEEKDAYS_KR[now.weekday()],
+            "summary": summary,
+            "vix_value": vix_value,
+            "vix_change": format_change(vix_change),
+            "vix_status": vix_status,
+            "fear_greed": lambda w: self._write_fear_greed(w, data.get('fear_greed', {})),
+            "economic_indicators": lambda w: self._write_economic_indicators(w, data.get('economic_indicators', {})),
+            "regime": lambda w: self._write_regime(w, data.get('regime', {})),
+            "crypto": lambda w: self._write_crypto_table(w, data.get('crypto', {}), sparks),
+            "market_breadth": lambda w: self._write_market_breadth(w, data.get('breadth', {})),
+            "trend": lambda w: self._write_trend(w, data),
+            "economic_calendar": lambda w: self._write_economic_calendar(w, data.get('economic_calendar', {})),
+        }
+        context.update((key, table(key)) for key in TABLE_SPECS)
+        return context
 
     def _format_table(self, data: Dict, headers: list) -> str:
         """일반 테이블 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_table, data, headers)
+
+    def _write_table(self, write: Writer, data: Dict, headers: list,
+                     sparks: Optional[Mapping[str, str]] = None, category: str = "") -> None:
         if not data:
-            return "\n_데이터 없음_\n"
+            write("\n_데이터 없음_\n")
+            return
+
+        # 스파크라인이 하나라도 있으면 추이 열 추가
+        sparks = sparks or {}
+        row_sparks = {name: sparks.get(series_key(category, name), "") for name in data}
+        with_spark = any(row_sparks.values())
 
-        # kramdown은 테이블 앞뒤에 빈 줄이 필요함
-        lines = [
-            "",  # 테이블 앞 빈 줄 (중요!)
-            f"| {headers[0]} | {headers[1]} | {headers[2]} |",
-            "|:------|------:|------:|"  # 정렬: 첫 열 왼쪽, 나머지 오른쪽
-        ]
+        # kramdown은 테이블 앞뒤에 빈 줄이 필요함 (중요!)
+        # 정렬: 첫 열 왼쪽, 나머지 오른쪽
+        write(f"\n| {headers[0]} | {headers[1]} | {headers[2]} |")
+        write(f" {SPARK_HEADER} |\n|:------|------:|------:|:------:|" if with_spark else "\n|:------|------:|------:|")
 
-        for name, info in data.items():
-            price = info.get('price')
-            change = info.get('change')
-            if price is not None:
-                change_str = f"{change:+.2f}%" if change is not None else "-"
-                lines.append(f"| {name} | {price:,.2f} | {change_str} |")
+        for name, quote in iter_quotes(data):
+            if quote.price is not None:
+                write(f"\n| {name} | {quote.price:,.2f} | {format_change(quote.change)} |")
+                if with_spark:
+                    write(f" {row_sparks[name]} |")
 
-        lines.append("")  # 테이블 뒤 빈 줄
-        return "\n".join(lines)
+        write("\n")  # 테이블 뒤 빈 줄
 
     def _format_filtered_table(self, data: Dict, keys: list, headers: list) -> str:
         """특정 키만 필터링하여 테이블 생성"""
@@ -159,144 +384,225 @@ author: 이찬희
 
     def _format_crypto_table(self, data: Dict) -> str:
         """암호화폐 테이블 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_crypto_table, data)
+
+    def _write_crypto_table(self, write: Writer, data: Dict, sparks: Optional[Mapping[str, str]] = None) -> None:
         if not data:
-            return "\n_데이터 없음_\n"
-
-        lines = [
-            "",  # 테이블 앞 빈 줄
-            "| 코인 | 가격 (USD) | 가격 (KRW) | 24h 변동 |",
-            "|:------|------:|------:|------:|"
-        ]
-
-        for name, info in data.items():
-            price_usd = info.get('price_usd')
-            price_krw = info.get('price_krw')
-            change = info.get('change_24h')
-            if price_usd is not None:
-                change_str = f"{change:+.2f}%" if change is not None else "-"
-                krw_str = f"₩{price_krw:,.0f}" if price_krw else "-"
-                lines.append(f"| {name} | ${price_usd:,.2f} | {krw_str} | {change_str} |")
-
-        lines.append("")  # 테이블 뒤 빈 줄
-        return "\n".join(lines)
+            write("\n_데이터 없음_\n")
+            return
+
+        sparks = sparks or {}
+        row_sparks = {name: sparks.get(series_key('crypto', name), "") for name in data}
+        with_spark = any(row_sparks.values())
+
+        write("\n| 코인 | 가격 (USD) | 가격 (KRW) | 24h 변동 |")
+        write(f" {SPARK_HEADER} |\n|:------|------:|------:|------:|:------:|" if with_spark
+              else "\n|:------|------:|------:|------:|")
+
+        for name, quote in iter_quotes(data):
+            if quote.price is not None:
+                krw_str = f"₩{quote.price_krw:,.0f}" if quote.price_krw else "-"
+                write(f"\n| {name} | ${quote.price:,.2f} | {krw_str} | {format_change(quote.change)} |")
+                if with_spark:
+                    write(f" {row_sparks[name]} |")
+
+        write("\n")
+
+    def _format_market_breadth(self, data: Dict) -> str:
+        """시장 폭 섹션 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_market_breadth, data)
+
+    def _write_market_breadth(self, write: Writer, data: Dict) -> None:
+        # 데이터가 없으면 섹션 자체를 생략 (앞 표와의 빈 줄은 여기서 씀)
+        indices = data.get("indices") if data else None
+        if not indices:
+            return
+
+        write("\n### 📊 시장 폭\n\n| 지수 | 종목 수 | 상승 | 하락 | 보합 | 신고가 | 신저가 |"
+              "\n|:------|------:|------:|------:|------:|------:|------:|")
+        for index in indices:
+            write(f"\n| {index['name']} | {index['count']:,} | {index['advancers']:,} | {index['decliners']:,} "
+                  f"| {index['unchanged']:,} | {index['new_highs']:,} | {index['new_lows']:,} |")
+        write("\n")
+        if data.get("period"):
+            write(f"\n_(신고가/신저가: 최근 {data['period']} 종가 기준)_\n")
+
+        for index in indices:
+            for key, label in (("gainers", "상승 상위"), ("losers", "하락 상위")):
+                if index.get(key):
+                    movers = ", ".join(f"{m['name']} {format_change(m['change'])}" for m in index[key])
+                    write(f"\n- **{index['name']} {label}**: {movers}")
+        write("\n")
 
     def _format_fear_greed(self, data: Dict) -> str:
         """Fear & Greed Index 포맷팅"""
-        lines = []
+        return _capture(self._write_fear_greed, data)
+
+    def _write_fear_greed(self, write: Writer, data: Dict) -> None:
+        # 블록 사이에만 빈 줄
+        sep = ""
 
         # 시장 심리 (VIX 기반)
         market = data.get("market")
         if market:
             value = market.get("value", 0)
-            emoji = "🟢" if value >= 55 else "🟡" if value >= 45 else "🔴"
-            lines.append(f"### 시장 심리 지수")
-            lines.append(f"{emoji} **{value}/100** - {market.get('classification', '-')}")
+            emoji = signal("🟢" if value >= 55 else "🟡" if value >= 45 else "🔴")
+            write(f"### 시장 심리 지수\n{emoji} **{value}/100** - {market.get('classification', '-')}")
             if market.get("based_on"):
-                lines.append(f"_(기준: {market['based_on']})_")
-            lines.append("")
+                write(f"\n_(기준: {market['based_on']})_")
+            write("\n")
+            sep = "\n"
 
         # 암호화폐 Fear & Greed
         crypto = data.get("crypto")
         if crypto:
             value = crypto.get("value", 0)
-            emoji = "🟢" if value >= 55 else "🟡" if value >= 45 else "🔴"
+            emoji = signal("🟢" if value >= 55 else "🟡" if value >= 45 else "🔴")
             change = crypto.get("change")
-            change_str = f" ({change:+d})" if change is not None else ""
-            lines.append(f"### 암호화폐 Fear & Greed")
-            lines.append(f"{emoji} **{value}/100** - {crypto.get('classification', '-')}{change_str}")
-            lines.append("")
-
-        return "\n".join(lines) if lines else ""
+            change_str = f' (<span class="{change_class(change)}">{change:+d}</span>)' if change is not None else ""
+            write(f"{sep}### 암호화폐 Fear & Greed\n"
+                  f"{emoji} **{value}/100** - {crypto.get('classification', '-')}{change_str}\n")
 
     def _format_economic_indicators(self, data: Dict) -> str:
         """경제지표 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_economic_indicators, data)
+
+    def _write_economic_indicators(self, write: Writer, data: Dict) -> None:
         if not data:
-            return ""
+            return
 
-        lines = ["### 📈 주요 경제지표", ""]
+        write("### 📈 주요 경제지표\n")
 
-        # 일간 지표
+        # 일간 지표 (테이블 앞 빈 줄)
         daily = data.get("daily", {})
         if daily:
-            lines.append("**금리 동향**")
-            lines.append("")  # 테이블 앞 빈 줄
-            lines.append("| 지표 | 값 | 변동 | 기준일 |")
-            lines.append("|:------|------:|------:|:--------|")
+            write("\n**금리 동향**\n\n| 지표 | 값 | 변동 | 기준일 |\n|:------|------:|------:|:--------|")
             for name, info in daily.items():
                 if info and info.get("value") is not None:
-                    change_str = f"{info['change']:+.2f}%" if info.get('change') is not None else "-"
-                    lines.append(f"| {name} | {info['value']:.2f}% | {change_str} | {info.get('date', '-')} |")
-            lines.append("")
+                    change_str = format_change(info.get('change'))
+                    write(f"\n| {name} | {info['value']:.2f}% | {change_str} | {info.get('date', '-')} |")
+            write("\n")
 
         # 주간 지표
         weekly = data.get("weekly", {})
         if weekly:
-            lines.append("**고용 동향**")
-            lines.append("")  # 테이블 앞 빈 줄
-            lines.append("| 지표 | 값 | 변동 | 기준일 |")
-            lines.append("|:------|------:|------:|:--------|")
+            write("\n**고용 동향**\n\n| 지표 | 값 | 변동 | 기준일 |\n|:------|------:|------:|:--------|")
             for name, info in weekly.items():
                 if info and info.get("value") is not None:
                     val = info['value']
-                    change_str = f"{info['change']:+.2f}%" if info.get('change') is not None else "-"
-                    lines.append(f"| {name} | {val:,.0f} | {change_str} | {info.get('date', '-')} |")
-            lines.append("")
+                    change_str = format_change(info.get('change'))
+                    write(f"\n| {name} | {val:,.0f} | {change_str} | {info.get('date', '-')} |")
+            write("\n")
 
         # 월간 주요 지표
         monthly = data.get("monthly", {})
         if monthly:
-            lines.append("**주요 경제지표 (최신)**")
-            lines.append("")  # 테이블 앞 빈 줄
-            lines.append("| 지표 | 값 | 기준일 |")
-            lines.append("|:------|------:|:--------|")
+            write("\n**주요 경제지표 (최신)**\n\n| 지표 | 값 | 기준일 |\n|:------|------:|:--------|")
             for name, info in monthly.items():
                 if info and info.get("value") is not None:
                     val = info['value']
                     # YoY 지표는 %로 표시
                     if info.get("unit") == "% YoY" or "YoY" in name:
-                        val_str = f"{val:+.2f}%"
+                        val_str = format_change(val)
                     elif "실업률" in name or "금리" in name:
                         val_str = f"{val:.2f}%"
                     elif abs(val) >= 1000:
                         val_str = f"{val:,.0f}"
                     else:
                         val_str = f"{val:.2f}"
-                    lines.append(f"| {name} | {val_str} | {info.get('date', '-')} |")
-            lines.append("")
-
-        return "\n".join(lines)
+                    write(f"\n| {name} | {val_str} | {info.get('date', '-')} |")
+            write("\n")
+
+    def _format_regime(self, data: Dict) -> str:
+        """자산 간 상관/국면 패널 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_regime, data)
+
+    def _write_regime(self, write: Writer, data: Dict) -> None:
+        # 데이터가 없으면 섹션 자체를 생략 (앞 섹션과의 빈 줄은 여기서 씀)
+        if not data or not data.get("assets"):
+            return
+
+        regime = data.get("regime", {})
+        window = data.get("window", "-")
+        write("\n### 🔗 자산 간 상관 · 국면\n")
+        if regime.get("score") is not None:
+            label = regime["label"]
+            emoji = signal("🟢" if label == "위험 선호" else "🔴" if label == "위험 회피" else "🟡")
+            write(f"\n{emoji} **{label}** (점수 {regime['score']:+.2f}, 최근 {window}거래일)\n")
+
+        anchor = data.get("anchor", "S&P 500")
+        write(f"\n| 자산 | {window}일 수익률 | 변동성 (연율) | {anchor} 상관 | 상관 변화 |"
+              "\n|:------|------:|------:|------:|------:|")
+        for asset in data["assets"]:
+            volatility = f"{asset['volatility']:.1f}%" if asset.get("volatility") is not None else "-"
+            correlation = f"{asset['correlation']:+.2f}" if asset.get("correlation") is not None else "-"
+            write(f"\n| {asset['name']} | {format_change(asset.get('return'))} | {volatility} | {correlation} "
+                  f"| {format_change(asset.get('correlation_change'), suffix='')} |")
+        write("\n")
+
+    def _format_trend(self, data: Dict) -> str:
+        """지수 추세 표 포맷팅 (kramdown 호환)"""
+        return _capture(self._write_trend, data)
+
+    def _write_trend(self, write: Writer, data: Dict) -> None:
+        # 표에 나오는 지수 중 캐시에 지표가 있는 것만, 없으면 섹션 자체를 생략
+        trend = data.get("trend") or {}
+        rows = []
+        for category in TREND_CATEGORIES:
+            for name in data.get(category) or {}:
+                stats = trend.get(series_key(category, name))
+                if stats and stats.get("price"):
+                    rows.append((name, stats))
+        if not rows:
+            return
+
+        def distance(level: Optional[float], price: float) -> str:
+            return format_change((price / level - 1) * 100) if level else "-"
+
+        write("\n### 📐 지수 추세\n\n| 지수 | 20일선 대비 | 60일선 대비 | 52주 고점 대비 | 52주 저점 대비 | 변동성 (20일) |"
+              "\n|:------|------:|------:|------:|------:|------:|")
+        for name, stats in rows:
+            price = stats["price"]
+            volatility = f"{stats['volatility']:.1f}%" if stats.get("volatility") is not None else "-"
+            write(f"\n| {name} | {distance(stats.get('ma_short'), price)} | {distance(stats.get('ma_long'), price)} "
+                  f"| {distance(stats.get('high'), price)} | {distance(stats.get('low'), price)} | {volatility} |")
+        write("\n\n_(종가 기준, 변동성은 연율. 기록이 52주보다 짧으면 고점/저점은 기록 기간 기준)_\n")
 
     def _format_economic_calendar(self, data: Dict) -> str:
         """경제 캘린더 포맷팅"""
+        return _capture(self._write_economic_calendar, data)
+
+    def _write_economic_calendar(self, write: Writer, data: Dict) -> None:
         if not data:
-            return "_캘린더 데이터 없음_"
+            write("_캘린더 데이터 없음_")
+            return
 
-        lines = []
+        sep = ""
 
         # 다가오는 FOMC 일정
         fed_events = data.get("upcoming_fed", [])
         if fed_events:
-            lines.append("### 🏛️ 연준 일정")
+            write("### 🏛️ 연준 일정")
             for event in fed_events[:3]:  # 최대 3개
-                emoji = "🔴" if event.get("importance") == "high" else "🟡"
-                lines.append(f"- {emoji} **{event['display']}** {event['event']} ({event['date']})")
-            lines.append("")
+                emoji = signal("🔴" if event.get("importance") == "high" else "🟡")
+                write(f"\n- {emoji} **{event['display']}** {event['event']} ({event['date']})")
+            write("\n")
+            sep = "\n"
 
         # 이번 주 주요 이벤트
         this_week = data.get("this_week", {})
         week_events = this_week.get("economic", []) + this_week.get("weekly", [])
         if week_events:
-            lines.append("### 📆 이번 주 주요 지표 발표")
+            write(f"{sep}### 📆 이번 주 주요 지표 발표")
             for event in week_events[:5]:  # 최대 5개
                 importance = event.get("importance", "medium")
-                emoji = "🔴" if importance == "high" else "🟡" if importance == "medium" else "⚪"
-                lines.append(f"- {emoji} {event['event']} ({event.get('date', '예정')})")
-            lines.append("")
-
-        if not lines:
-            lines.append("_이번 주 주요 이벤트 없음_")
+                emoji = signal("🔴" if importance == "high" else "🟡" if importance == "medium" else "⚪")
+                write(f"\n- {emoji} {event['event']} ({event.get('date', '예정')})")
+            write("\n")
+            sep = "\n"
 
-        return "\n".join(lines)
+        if not sep:
+            write("_이번 주 주요 이벤트 없음_")
 
 
 if __name__ == "__main__":
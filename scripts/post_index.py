@@ -0,0 +1,247 @@
+"""아카이브/카테고리/태그 인덱스 빌더
+
+Jekyll이 빌드 때마다 site.posts 전체를 순회/그룹핑하지 않도록,
+목록 페이지가 쓰는 데이터를 _data/ 아래에 미리 만들어 둔다.
+
+    _data/archive_summary.json       연도/카테고리/태그별 개수 (최신 연도 먼저)
+    _data/archive/<연도>.json         연도별 포스트 목록
+    _data/categories/<카테고리>.json   카테고리별 포스트 목록
+    _data/tags/<태그 id>.json         태그별 포스트 목록
+
+포스트별 메타는 scripts/data/post_index.json에 기록해 두고, 포스트가 새로 쓰이거나
+바뀌면 그 포스트가 속한(또는 속했던) 목록 파일만 다시 쓴다. 손이나 git으로 추가/수정/삭제한
+포스트는 매일 실행의 reconcile()이 파일 내용 해시를 비교해 찾아 반영한다.
+
+사용법:
+    python post_index.py          # 전체 재생성
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from logger import logger
+from search_index import POSTS_DIR, parse_post
+
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "_data"
+DEFAULT_STATE_PATH = Path(__file__).parent / "data" / "post_index.json"
+
+INDEX_VERSION = 1
+
+# 목록 종류 → _data 하위 디렉토리
+ARCHIVE, CATEGORIES, TAGS = "archive", "categories", "tags"
+BUCKET_KINDS = (ARCHIVE, CATEGORIES, TAGS)
+
+Bucket = Tuple[str, str]
+
+
+def tag_id(tag: str) -> str:
+    """태그 → 파일명 (한글/영문/숫자 유지, 나머지는 하이픈)"""
+    return re.sub(r"[^\w-]+", "-", tag.strip().lower()).strip("-") or "untagged"
+
+
+def _buckets(entry: Dict) -> Set[Bucket]:
+    """포스트가 속한 목록들"""
+    buckets = {(ARCHIVE, entry["date"][:4])}
+    buckets.update((CATEGORIES, c) for c in entry["categories"])
+    buckets.update((TAGS, tag_id(t)) for t in entry["tags"])
+    return buckets
+
+
+def _sort_key(entry: Dict) -> Tuple[str, str]:
+    return entry["date"], entry["url"]
+
+
+def _write_if_changed(path: Path, payload) -> bool:
+    """내용이 바뀐 경우에만 원자적으로 저장"""
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+class PostIndex:
+    """_data 목록 파일 증분 관리자"""
+
+    def __init__(self, posts_dir: Path = POSTS_DIR, data_dir: Path = DATA_DIR,
+                 state_path: Path = DEFAULT_STATE_PATH):
+        self.posts_dir = Path(posts_dir).resolve()
+        self.data_dir = Path(data_dir)
+        self.state_path = Path(state_path)
+        # posts_dir 기준 상대 경로 → 포스트 메타
+        self.entries: Dict[str, Dict] = {}
+        # posts_dir 기준 상대 경로 → 내용 해시 (reconcile 비교용)
+        self.files: Dict[str, str] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> bool:
+        """저장된 포스트 메타 로드 (없거나 깨졌으면 False)"""
+        if self._loaded:
+            return True
+        if not self.state_path.exists():
+            return False
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"포스트 인덱스 상태 파일 손상 (전체 재생성): {e}")
+            return False
+        if state.get("version") != INDEX_VERSION:
+            return False
+        self.entries = state.get("posts", {})
+        self.files = state.get("files", {})
+        self._loaded = True
+        return True
+
+    def _key(self, path: Path) -> str:
+        return Path(path).resolve().relative_to(self.posts_dir).as_posix()
+
+    def _post_files(self) -> List[Path]:
+        return sorted(self.posts_dir.rglob("*.md")) + sorted(self.posts_dir.rglob("*.markdown"))
+
+    @staticmethod
+    def _fingerprint(path: Path) -> str:
+        # mtime은 체크아웃마다 바뀌고 상태 파일이 커밋되므로 내용 해시만 쓴다
+        return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+    @staticmethod
+    def _entry(path: Path) -> Optional[Dict]:
+        post = parse_post(path) if path.exists() else None
+        if post is None:
+            return None
+        return {k: post[k] for k in ("url", "title", "date", "categories", "tags")}
+
+    def update(self, paths: Iterable[Path]) -> int:
+        """새로 쓰이거나 바뀌거나 삭제된 포스트 반영
+
+        저장된 상태가 없으면 전체 재생성한다.
+
+        Returns:
+            다시 쓴(또는 삭제한) 파일 수
+        """
+        with self._lock:
+            if not self._load():
+                return self._rebuild()
+            return self._update(paths)
+
+    def reconcile(self) -> int:
+        """_posts를 훑어 저장된 상태와 다른 포스트(손/git으로 추가, 수정, 삭제) 반영
+
+        내용 해시가 저장된 값과 같은 포스트는 다시 파싱하지 않는다.
+        저장된 상태가 없으면 전체 재생성한다.
+
+        Returns:
+            다시 쓴(또는 삭제한) 파일 수
+        """
+        with self._lock:
+            if not self._load():
+                return self._rebuild()
+            current = {self._key(path): path for path in self._post_files()}
+            changed = [self.posts_dir / key for key in self.entries.keys() - current.keys()]
+            changed += [path for key, path in current.items() if self.files.get(key) != self._fingerprint(path)]
+            return self._update(changed)
+
+    def _update(self, paths: Iterable[Path]) -> int:
+        affected: Set[Bucket] = set()
+        for path in paths:
+            path = Path(path)
+            key = self._key(path)
+            old = self.entries.pop(key, None)
+            new = self._entry(path)
+            if new is not None:
+                self.entries[key] = new
+            if path.exists():
+                self.files[key] = self._fingerprint(path)
+            else:
+                self.files.pop(key, None)
+            if old != new:
+                affected |= _buckets(old) if old else set()
+                affected |= _buckets(new) if new else set()
+        return self._write(affected)
+
+    def rebuild(self) -> int:
+        """_posts 전체를 다시 읽어 모든 목록 재생성"""
+        with self._lock:
+            return self._rebuild()
+
+    def _rebuild(self) -> int:
+        self.entries = {}
+        self.files = {}
+        for path in self._post_files():
+            key = self._key(path)
+            self.files[key] = self._fingerprint(path)
+            entry = self._entry(path)
+            if entry is not None:
+                self.entries[key] = entry
+        self._loaded = True
+
+        # 기존 파일도 대상에 넣어, 더 이상 포스트가 없는 목록은 삭제되게 한다
+        affected = {(kind, p.stem) for kind in BUCKET_KINDS for p in (self.data_dir / kind).glob("*.json")}
+        for entry in self.entries.values():
+            affected |= _buckets(entry)
+        return self._write(affected)
+
+    def _write(self, affected: Set[Bucket]) -> int:
+        """영향받은 목록 파일 + 요약 + 상태 저장"""
+        lists: Dict[Bucket, List[Dict]] = {bucket: [] for bucket in affected}
+        names: Dict[Bucket, str] = {}
+        counts: Dict[Bucket, int] = {}
+        for entry in self.entries.values():
+            for bucket in _buckets(entry):
+                counts[bucket] = counts.get(bucket, 0) + 1
+                if bucket[0] == TAGS:
+                    names.setdefault(bucket, next(t for t in entry["tags"] if tag_id(t) == bucket[1]))
+                if bucket in lists:
+                    lists[bucket].append(entry)
+
+        written = 0
+        for (kind, name), posts in lists.items():
+            path = self.data_dir / kind / f"{name}.json"
+            if not posts:
+                if path.exists():
+                    path.unlink()
+                    written += 1
+                continue
+            posts.sort(key=_sort_key, reverse=True)
+            written += _write_if_changed(path, {
+                "name": names.get((kind, name), name),
+                "posts": [{k: p[k] for k in ("url", "title", "date", "categories")} for p in posts],
+            })
+
+        def summary(kind: str) -> List[Dict]:
+            items = [{"name": names.get((k, n), n), "id": n, "count": c}
+                     for (k, n), c in counts.items() if k == kind]
+            return sorted(items, key=lambda item: item["id"], reverse=(kind == ARCHIVE))
+
+        written += _write_if_changed(self.data_dir / "archive_summary.json", {
+            "total": len(self.entries),
+            "years": summary(ARCHIVE),
+            "categories": summary(CATEGORIES),
+            "tags": summary(TAGS),
+        })
+        _write_if_changed(self.state_path, {
+            "version": INDEX_VERSION,
+            "posts": dict(sorted(self.entries.items())),
+            "files": dict(sorted(self.files.items())),
+        })
+
+        if written:
+            logger.info(f"포스트 인덱스: 포스트 {len(self.entries)}개, 파일 {written}개 갱신")
+        return written
+
+
+def update_post_index(paths: Iterable[Path]) -> int:
+    """기본 위치의 포스트 인덱스에 변경 반영"""
+    return PostIndex().update(paths)
+
+
+if __name__ == "__main__":
+    PostIndex().rebuild()
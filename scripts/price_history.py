@@ -0,0 +1,159 @@
+"""일별 종가 히스토리 저장소
+
+브리핑 표 항목별 일별 종가를 data/price_history.csv(행=날짜, 열="카테고리/이름")에
+누적한다. CI 실행 결과와 함께 커밋되므로 실행 간에 유지되고,
+스파크라인은 이 저장소에서 한 번에 행렬로 꺼내 그린다.
+"""
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from logger import logger
+from quotes import iter_quotes
+
+DEFAULT_HISTORY_PATH = Path(__file__).parent / "data" / "price_history.csv"
+
+# 보관 일수 (달력 기준, 스파크라인 30거래일 + 여유)
+MAX_DAYS = 120
+
+
+def series_key(category: str, name: str) -> str:
+    return f"{category}/{name}"
+
+
+class PriceHistory:
+    """일별 종가 테이블 (pandas DataFrame 래퍼)"""
+
+    def __init__(self, frame: Optional[pd.DataFrame] = None, path: Path = DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.frame = frame if frame is not None else pd.DataFrame(dtype=float)
+        self.frame.index = pd.DatetimeIndex(self.frame.index, name="date")
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_HISTORY_PATH) -> "PriceHistory":
+        """CSV에서 로드 (없으면 빈 히스토리)"""
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+        frame = pd.read_csv(path, index_col=0, parse_dates=True, encoding="utf-8")
+        return cls(frame.astype(float), path=path)
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """CSV로 원자적 저장"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        self.frame.sort_index().to_csv(tmp_path, encoding="utf-8", float_format="%.6g", date_format="%Y-%m-%d")
+        os.replace(tmp_path, path)
+        return path
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self.frame.columns)
+
+    def merge_closes(self, closes: Dict[str, pd.Series]) -> None:
+        """수집기가 받은 종가 시계열 병합 (같은 날짜는 새 값 우선)
+
+        받은 시리즈의 첫 날짜~마지막 날짜 구간에서는 배치 종가가 정답이므로, 그 구간에 있던
+        다른 날짜의 값(이전 버전의 record()가 주말/휴장일에 남긴 직전 종가)은 지운다.
+        """
+        if not closes:
+            return
+        incoming = pd.DataFrame({key: s for key, s in closes.items() if s is not None and len(s)})
+        if incoming.empty:
+            return
+        incoming.index = pd.DatetimeIndex(incoming.index).tz_localize(None).normalize()
+        incoming = incoming.groupby(level=0).last()
+        merged = incoming.combine_first(self.frame)
+
+        have = incoming.reindex(merged.index).notna().to_numpy()
+        inside = np.maximum.accumulate(have, axis=0) & np.maximum.accumulate(have[::-1], axis=0)[::-1]
+        columns = merged.columns.get_indexer(incoming.columns)
+        values = merged.to_numpy(dtype=float, copy=True)
+        values[:, columns] = np.where(inside & ~have, np.nan, values[:, columns])
+        self.frame = pd.DataFrame(values, index=merged.index, columns=merged.columns).dropna(how="all")
+        self._trim()
+
+    def record(self, data: Dict, when: Optional[datetime] = None, skip: Iterable[str] = ()) -> int:
+        """브리핑 데이터의 현재가를 해당 날짜 행으로 기록
+
+        배치 종가가 없는 항목(암호화폐 등)도 히스토리가 쌓이도록 한다. 종가 시계열이 있는
+        항목(skip)은 실행 날짜(주말 포함)로 직전 종가를 남기지 않도록 건너뛴다.
+
+        Returns:
+            기록한 항목 수
+        """
+        day = pd.Timestamp((when or datetime.now()).date())
+        skip = set(skip)
+        row = {}
+        for category, items in data.items():
+            if not isinstance(items, dict):
+                continue
+            for name, quote in iter_quotes(items):
+                key = series_key(category, name)
+                if isinstance(quote.price, (int, float)) and key not in skip:
+                    row[key] = float(quote.price)
+        if row:
+            # 같은 날 배치 종가가 이미 있으면 유지
+            today = pd.DataFrame(row, index=pd.DatetimeIndex([day], name="date"))
+            self.frame = self.frame.combine_first(today) if day in self.frame.index else today.combine_first(self.frame)
+            self._trim()
+        return len(row)
+
+    def _trim(self) -> None:
+        self.frame = self.frame.sort_index()
+        if len(self.frame):
+            cutoff = self.frame.index[-1] - pd.Timedelta(days=MAX_DAYS)
+            self.frame = self.frame[self.frame.index > cutoff]
+
+    def matrix(self, keys: Iterable[str], points: int = 30) -> Tuple[List[str], np.ndarray]:
+        """keys의 최근 points개 값을 (시리즈 × 시점) 행렬로 (없는 값은 NaN)
+
+        각 시리즈는 자기 값이 있는 날짜만 모아 오른쪽 정렬하므로,
+        휴장일이 다른 시장도 거래일 기준으로 비교된다.
+        """
+        keys = list(keys)
+        result = np.full((len(keys), points), np.nan)
+        if self.frame.empty:
+            return keys, result
+        frame = self.frame.reindex(columns=keys)
+        values = frame.to_numpy(dtype=float).T
+        for i, row in enumerate(values):
+            valid = row[~np.isnan(row)][-points:]
+            if len(valid):
+                result[i, points - len(valid):] = valid
+        return keys, result
+
+
+# 경로 → (mtime_ns, PriceHistory)
+_cache: Dict[str, Tuple[int, PriceHistory]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_price_history(path: Path = DEFAULT_HISTORY_PATH) -> PriceHistory:
+    """히스토리 로드 (파일 mtime이 같으면 캐시 반환)"""
+    path = Path(path).resolve()
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return PriceHistory(path=path)
+    key = str(path)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            history = PriceHistory.load(path)
+        except Exception as e:
+            logger.warning(f"가격 히스토리 읽기 실패 (무시): {e}")
+            return PriceHistory(path=path)
+        _cache[key] = (mtime, history)
+        return history
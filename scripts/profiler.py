@@ -0,0 +1,140 @@
+"""단계별 프로파일러 (main.py --profile)
+
+파이프라인 단계마다 다음 파일을 남긴다 (NN은 실행 순서):
+
+    NN-<단계>.prof          cProfile 결과 (snakeviz, pstats 등으로 열람)
+    NN-<단계>-stats.txt     누적 시간 상위 함수 (pstats 텍스트)
+    NN-<단계>.folded        샘플링한 스택 (flamegraph.pl, speedscope용 collapsed 형식)
+    NN-<단계>-alloc.txt     단계 동안 늘어난 메모리 상위 N개 (tracemalloc, 코드 줄 기준)
+
+cProfile은 단계를 실행하는 스레드만 보므로, 워커 스레드(yfinance, chart API 등)까지
+포함한 벽시계 시간 분포는 .folded 샘플로 확인한다.
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from logger import logger
+
+# 스택 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.005
+# 메모리/함수 보고서 항목 수
+TOP_N = 25
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """모든 스레드의 호출 스택을 주기적으로 수집 (collapsed 형식)"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.counts[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def write(self, path: Path) -> None:
+        lines = (f"{stack} {count}" for stack, count in sorted(self.counts.items()))
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class StageProfiler:
+    """단계별 cProfile + 스택 샘플 + tracemalloc 보고서
+
+    Args:
+        output_dir: 결과 디렉토리 (없으면 생성)
+        interval: 스택 샘플링 간격 (초)
+        top: 보고서 항목 수
+    """
+
+    def __init__(self, output_dir: Path, interval: float = SAMPLE_INTERVAL, top: int = TOP_N):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.interval = interval
+        self.top = top
+        self._index = 0
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        # 프로파일러 자신의 할당은 제외
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """블록을 프로파일링하고 단계 파일을 남김"""
+        self._index += 1
+        prefix = self.output_dir / f"{self._index:02d}-{name}"
+        sampler = StackSampler(self.interval)
+        profile = cProfile.Profile()
+        before = self._snapshot()
+        sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            sampler.stop()
+            after = self._snapshot()
+            try:
+                self._write(prefix, profile, sampler, before, after)
+            except Exception as e:
+                logger.warning(f"프로파일 저장 실패 ({name}): {e}")
+
+    def _write(self, prefix: Path, profile: cProfile.Profile, sampler: StackSampler,
+               before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> None:
+        profile.dump_stats(f"{prefix}.prof")
+
+        buf = io.StringIO()
+        pstats.Stats(profile, stream=buf).sort_stats("cumulative").print_stats(self.top)
+        Path(f"{prefix}-stats.txt").write_text(buf.getvalue(), encoding="utf-8")
+
+        sampler.write(Path(f"{prefix}.folded"))
+
+        diffs = after.compare_to(before, "lineno")[:self.top]
+        lines = [f"# 단계 동안 늘어난 메모리 상위 {len(diffs)}개 (tracemalloc)"]
+        lines += [str(diff) for diff in diffs]
+        Path(f"{prefix}-alloc.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        logger.info(f"프로파일 저장: {prefix}.* (샘플 {sum(sampler.counts.values())}개)")
+
+    def close(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
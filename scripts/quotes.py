@@ -0,0 +1,103 @@
+"""시세 레코드
+
+market_data의 각 항목(카테고리 → 이름 → 시세)은 __slots__ 기반 Quote로 담는다.
+필드는 price(가격, crypto는 USD), change(변동률 %), price_krw(crypto만) 하나의
+스키마이고, 코드에서는 속성으로 읽는다.
+
+Quote는 읽기 전용 Mapping이기도 해서 예전 dict 형태 그대로 보인다 (JSON 출력, Liquid,
+외부 스크립트 호환). crypto의 dict 키는 예전처럼 price_usd, price_krw, change_24h다.
+
+    quote = Quote(5000.0, 0.5)
+    quote.price, quote["price"], dict(quote)   # 5000.0, 5000.0, {"price": 5000.0, "change": 0.5}
+
+항목당 메모리는 키 두 개짜리 dict(184B)의 약 1/4(48B)이다.
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class Quote(Mapping):
+    """시세 한 건 (가격, 변동률 %)
+
+    Args:
+        price: 가격 (없으면 None)
+        change: 전일 대비 변동률 (%, 없으면 None)
+    """
+
+    __slots__ = ("price", "change")
+
+    # dict 호환 뷰의 키 → 속성
+    KEYS: Dict[str, str] = {"price": "price", "change": "change"}
+
+    def __init__(self, price: Optional[float], change: Optional[float] = None):
+        self.price = price
+        self.change = change
+
+    @property
+    def price_krw(self) -> Optional[float]:
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, self.KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+class CryptoQuote(Quote):
+    """암호화폐 시세 (price는 USD, change는 24시간 변동률)"""
+
+    __slots__ = ("_price_krw",)
+
+    KEYS = {"price_usd": "price", "price_krw": "price_krw", "change_24h": "change"}
+
+    def __init__(self, price: Optional[float], change: Optional[float] = None,
+                 price_krw: Optional[float] = None):
+        super().__init__(price, change)
+        self._price_krw = price_krw
+
+    @property
+    def price_krw(self) -> Optional[float]:
+        return self._price_krw
+
+
+def as_quote(info: Any) -> Optional[Quote]:
+    """Quote 또는 예전 dict 형태({"price", "change"} / {"price_usd", "price_krw", "change_24h"}) → Quote
+
+    시세가 아닌 값이면 None.
+    """
+    if isinstance(info, Quote):
+        return info
+    if not isinstance(info, Mapping):
+        return None
+    if "price_usd" in info:
+        return CryptoQuote(info.get("price_usd"), info.get("change_24h"), info.get("price_krw"))
+    if "price" in info:
+        return Quote(info.get("price"), info.get("change"))
+    return None
+
+
+def iter_quotes(rows: Any) -> Iterator[Tuple[str, Quote]]:
+    """카테고리 dict에서 (이름, Quote)를 순서대로 (시세가 아닌 항목은 건너뜀)"""
+    if not isinstance(rows, Mapping):
+        return
+    for name, info in rows.items():
+        quote = as_quote(info)
+        if quote is not None:
+            yield name, quote
+
+
+def get_quote(data: Mapping, category: str, name: str) -> Quote:
+    """data[category][name]의 Quote (없으면 값이 모두 None인 Quote)"""
+    rows = data.get(category)
+    quote = as_quote(rows.get(name)) if isinstance(rows, Mapping) else None
+    return quote if quote is not None else Quote(None)
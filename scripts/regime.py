@@ -0,0 +1,184 @@
+"""자산 간 상관/변동성 패널과 위험 선호 국면
+
+가격 히스토리(price_history)에서 미국 지수, 환율, 원자재, 채권, 암호화폐 시리즈를 꺼내
+최근 WINDOW 거래일의 상관 행렬, 실현 변동성, 구간 수익률과 간단한 위험 선호/회피 국면을
+계산한다.
+
+- 거래일은 기준 시리즈(S&P 500)에 종가가 있는 날이다. 다른 시리즈는 그날의 마지막
+  값으로 맞추므로 암호화폐 주말 변동은 월요일 수익률에 합쳐진다.
+- 상관은 시리즈 쌍마다 둘 다 값이 있는 날만 쓰는 pairwise 상관이며, 행렬 곱 몇 번으로
+  전체 (시리즈 × 시리즈) 행렬을 한 번에 계산한다.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from price_history import PriceHistory, series_key
+
+REGIME_CATEGORIES = ("us_indices", "currencies", "commodities", "bonds", "crypto")
+
+# 거래일 기준이자 상관 기준 시리즈
+ANCHOR = series_key("us_indices", "S&P 500")
+
+# 상관/변동성/수익률 구간 (거래일), 상관 변화는 직전 같은 길이 구간과 비교
+WINDOW = 20
+# 상관 계산에 필요한 최소 공통 관측치
+MIN_OBSERVATIONS = 10
+TRADING_DAYS = 252
+
+# 포스트 표에 보여 줄 시리즈 (전체 행렬은 브리핑 JSON에)
+PANEL = (
+    series_key("us_indices", "S&P 500"),
+    series_key("us_indices", "NASDAQ"),
+    series_key("bonds", "미국 10년물"),
+    series_key("currencies", "USD/KRW"),
+    series_key("currencies", "USD/JPY"),
+    series_key("commodities", "금"),
+    series_key("commodities", "WTI 원유"),
+    series_key("crypto", "BTC"),
+    series_key("crypto", "ETH"),
+)
+
+# 국면 신호: (시리즈, 방향). 구간 수익률 × 방향이 양수면 위험 선호 쪽 한 표
+SIGNALS = (
+    (series_key("us_indices", "S&P 500"), 1),
+    (series_key("crypto", "BTC"), 1),
+    (series_key("currencies", "USD/JPY"), 1),   # 엔화 약세 = 위험 선호
+    (series_key("commodities", "금"), -1),
+    (series_key("market_indicators", "VIX (공포지수)"), -1),
+)
+# 표 평균(-1 ~ 1)이 이 값 이상이면 위험 선호, -이 값 이하면 위험 회피
+REGIME_THRESHOLD = 0.5
+
+
+def regime_keys(history: PriceHistory, categories: Sequence[str] = REGIME_CATEGORIES) -> List[str]:
+    """히스토리에서 대상 카테고리의 시리즈 키 (저장 순서)"""
+    prefixes = tuple(f"{category}/" for category in categories)
+    return [key for key in history.keys if key.startswith(prefixes)]
+
+
+def aligned_prices(history: PriceHistory, keys: Sequence[str],
+                   anchor: str = ANCHOR) -> Tuple[np.ndarray, np.ndarray]:
+    """기준 시리즈 거래일에 맞춘 (거래일 × 시리즈) 가격
+
+    Returns:
+        (거래일 DatetimeIndex 값, 가격 배열). 그날까지 값이 없던 시리즈는 NaN
+    """
+    frame = history.frame.reindex(columns=list(dict.fromkeys([anchor, *keys])))
+    trading = frame[anchor].dropna().index
+    prices = frame.ffill().reindex(trading)[list(keys)]
+    return trading.to_numpy(), prices.to_numpy(dtype=float)
+
+
+def pairwise_correlation(returns: np.ndarray, min_observations: int = MIN_OBSERVATIONS) -> np.ndarray:
+    """(날짜 × 시리즈) 수익률의 pairwise 상관 행렬 (공통 관측치가 부족하면 NaN)"""
+    valid = (~np.isnan(returns)).astype(float)
+    x = np.where(valid > 0, returns, 0.0)
+    n = valid.T @ valid
+    sx = x.T @ valid                  # sx[i, j]: i와 j가 모두 있는 날의 i 합
+    sxx = (x * x).T @ valid
+    sxy = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n
+        corr = cov / np.sqrt(var * var.T)
+    corr[(n < min_observations) | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _window_stats(prices: np.ndarray, window: int) -> Dict[str, np.ndarray]:
+    """마지막 window 거래일의 수익률 통계"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = prices[1:] / prices[:-1] - 1
+    recent = returns[-window:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        period = prices[-1] / prices[-window - 1] - 1 if len(prices) > window else np.full(prices.shape[1], np.nan)
+    counts = (~np.isnan(recent)).sum(axis=0)
+    volatility = np.full(prices.shape[1], np.nan)
+    enough = counts >= 2
+    if enough.any():
+        volatility[enough] = np.nanstd(recent[:, enough], axis=0, ddof=1) * np.sqrt(TRADING_DAYS)
+    return {
+        "returns": returns,
+        "period": period,
+        "volatility": volatility,
+    }
+
+
+def _number(value: float, digits: int = 2) -> Optional[float]:
+    # + 0.0: 반올림한 -0.0을 0.0으로
+    return None if value is None or np.isnan(value) else round(float(value), digits) + 0.0
+
+
+def _matrix(values: np.ndarray, digits: int = 3) -> List[List[Optional[float]]]:
+    """JSON용 중첩 리스트 (NaN은 None, 원소별 파이썬 호출 없이)"""
+    rounded = np.round(values, digits)
+    return np.where(np.isnan(rounded), None, rounded).tolist()
+
+
+def classify_regime(period_returns: Dict[str, float]) -> Dict:
+    """SIGNALS 표결로 위험 선호/회피 국면
+
+    Args:
+        period_returns: 시리즈 키 → 구간 수익률 (없는 시리즈는 표결 제외)
+    """
+    votes = {key: int(np.sign(period_returns[key] * direction))
+             for key, direction in SIGNALS
+             if period_returns.get(key) is not None and not np.isnan(period_returns[key])}
+    if not votes:
+        return {"label": "-", "score": None, "votes": {}}
+    score = sum(votes.values()) / len(votes)
+    label = "위험 선호" if score >= REGIME_THRESHOLD else "위험 회피" if score <= -REGIME_THRESHOLD else "중립"
+    return {"label": label, "score": round(score, 2), "votes": votes}
+
+
+def compute_regime(history: PriceHistory, window: int = WINDOW,
+                   panel: Sequence[str] = PANEL) -> Dict:
+    """상관/변동성 패널과 국면 (market_data["regime"] 형태)
+
+    Returns:
+        as_of, window, keys, correlation(keys 순서의 행렬), assets(panel 행),
+        regime(label, score, votes). 기준 시리즈 거래일이 window + 1일보다 적으면 빈 dict
+    """
+    if history.frame.empty or ANCHOR not in history.frame.columns:
+        return {}
+    keys = regime_keys(history)
+    signal_keys = [key for key, _ in SIGNALS if key in history.frame.columns and key not in keys]
+    dates, prices = aligned_prices(history, keys + signal_keys)
+    if len(dates) < window + 1:
+        return {}
+
+    stats = _window_stats(prices, window)
+    returns = stats["returns"][:, :len(keys)]
+    current = pairwise_correlation(returns[-window:])
+    previous = pairwise_correlation(returns[-2 * window:-window]) if len(returns) >= 2 * window else None
+
+    column = {key: i for i, key in enumerate(keys)}
+    anchor = column[ANCHOR]
+    assets = []
+    for key in panel:
+        i = column.get(key)
+        if i is None:
+            continue
+        # 기준 시리즈 자신과의 상관은 표시하지 않음
+        correlation = current[i, anchor] if i != anchor else np.nan
+        change = correlation - previous[i, anchor] if previous is not None else np.nan
+        assets.append({
+            "key": key,
+            "name": key.split("/", 1)[1],
+            "return": _number(stats["period"][i] * 100),
+            "volatility": _number(stats["volatility"][i] * 100),
+            "correlation": _number(correlation),
+            "correlation_change": _number(change),
+        })
+
+    period = dict(zip(keys + signal_keys, stats["period"].tolist()))
+    return {
+        "as_of": str(np.datetime_as_string(dates[-1], unit="D")),
+        "window": window,
+        "anchor": ANCHOR.split("/", 1)[1],
+        "keys": keys,
+        "correlation": _matrix(current),
+        "assets": assets,
+        "regime": classify_regime(period),
+    }
@@ -6,16 +6,30 @@
     python report_uploader.py                    # 대화형 모드
     python report_uploader.py --file report.md   # 파일 직접 지정
     python report_uploader.py --category analysis --title "테슬라 분석"  # 카테고리와 제목 지정
+    python report_uploader.py --bulk ~/notes -c analysis       # 디렉토리 일괄 처리
+    python report_uploader.py --bulk "~/notes/**/*.md"          # glob 패턴 일괄 처리
+    python report_uploader.py --bulk ~/notes --force            # 매니페스트 무시하고 다시 생성
+
+--file/--bulk 모드는 scripts/data/report_manifest.json에 원본 해시 → 포스트를 기록해,
+내용이 그대로인 원본은 건너뛰고 바뀐 원본은 기존 포스트(날짜/파일명 유지)를 갱신한다.
+본문이 참조하는 로컬 이미지는 assets/images/에 내용 해시 이름으로 게시된다 (asset_pipeline.py).
 """
 import argparse
+import glob
+import os
 import re
-import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
+from asset_pipeline import asset_pipeline
 from config import config
 from logger import logger
+from post_index import update_post_index
+from search_index import build_search_index
+from upload_manifest import UploadManifest, content_hash
 
 
 # 카테고리별 디렉토리 매핑
@@ -27,6 +41,12 @@ CATEGORY_MAP = {
     "realestate": ("임장", "_posts/realestate"),
 }
 
+# front matter date 형식 (매니페스트에도 같은 형식으로 기록)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# sync_markdown_file 결과 상태
+CREATED, UPDATED, UNCHANGED = "created", "updated", "unchanged"
+
 
 def slugify(text: str) -> str:
     """한글/영문 텍스트를 URL-safe 슬러그로 변환"""
@@ -45,16 +65,17 @@ def create_front_matter(
     tags: list[str],
     author: str = None,
     excerpt: str = None,
-    downloadable: bool = True
+    downloadable: bool = True,
+    date: Optional[datetime] = None
 ) -> str:
-    """Jekyll front matter 생성"""
-    now = datetime.now()
+    """Jekyll front matter 생성 (date가 없으면 현재 시각)"""
+    date = date or datetime.now()
     author = author or config.SITE_AUTHOR
 
     front_matter = f"""---
 layout: post
 title: "{title}"
-date: {now.strftime('%Y-%m-%d %H:%M:%S')} +0900
+date: {date.strftime(DATE_FORMAT)} +0900
 categories: [{category}]
 tags: [{', '.join(tags)}]
 author: {author}
@@ -67,12 +88,75 @@ downloadable: {str(downloadable).lower()}
     return front_matter
 
 
+def extract_title(content: str, fallback: str) -> Tuple[str, str]:
+    """첫 번째 # 헤더를 제목으로 추출
+
+    Returns:
+        (제목, 제목 라인을 제거한 본문). 헤더가 없으면 (fallback, 원문)
+    """
+    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    if title_match:
+        title = title_match.group(1).strip()
+        return title, content.replace(title_match.group(0), '', 1).strip()
+    return fallback, content
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 교체 (중간에 실패해도 반쯤 쓰인 포스트가 남지 않음)"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _resolve_output_dir(category: str, output_dir: Optional[Path] = None) -> Path:
+    """출력 디렉토리 결정 (없으면 카테고리별 _posts 하위)"""
+    if not output_dir:
+        base_dir = Path(__file__).parent.parent
+        category_info = CATEGORY_MAP.get(category, ("기타", "_posts"))
+        output_dir = base_dir / category_info[1]
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def render_post(
+    content: str,
+    input_path: Path,
+    category: str,
+    title: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    date: Optional[datetime] = None
+) -> Tuple[str, str]:
+    """원본 내용을 포스트 텍스트로 변환 (로컬 이미지는 에셋으로 게시 후 링크 교체)
+
+    Returns:
+        (제목, front matter + 본문)
+    """
+    # 제목 추출 (없으면 첫 번째 # 헤더, 그것도 없으면 파일명)
+    if not title:
+        title, content = extract_title(content, input_path.stem)
+
+    # 태그 추출 (없으면 기본값)
+    if not tags:
+        tags = [CATEGORY_MAP.get(category, ("기타", ""))[0]]
+
+    content = asset_pipeline.rewrite(content, input_path.parent)
+
+    front_matter = create_front_matter(title, category, tags, date=date)
+    return title, front_matter + "\n" + content
+
+
 def process_markdown_file(
     input_path: Path,
     category: str,
     title: Optional[str] = None,
     tags: Optional[list[str]] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    slug: Optional[str] = None
 ) -> Path:
     """마크다운 파일 처리 및 포스트 생성
 
@@ -82,51 +166,198 @@ def process_markdown_file(
         title: 포스트 제목 (없으면 파일명에서 추출)
         tags: 태그 리스트
         output_dir: 출력 디렉토리 (없으면 자동 결정)
+        slug: 파일명 슬러그 (없으면 제목에서 생성)
 
     Returns:
         생성된 포스트 파일 경로
     """
-    # 파일 읽기
-    content = input_path.read_text(encoding="utf-8")
+    now = datetime.now()
+    title, full_content = render_post(
+        input_path.read_text(encoding="utf-8"), input_path, category, title, tags, now
+    )
 
-    # 제목 추출 (없으면 파일명에서)
-    if not title:
-        # 첫 번째 # 헤더를 제목으로 사용
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        if title_match:
-            title = title_match.group(1).strip()
-            # 제목 라인 제거
-            content = content.replace(title_match.group(0), '', 1).strip()
-        else:
-            title = input_path.stem
+    # 파일명 생성
+    output_dir = _resolve_output_dir(category, output_dir)
+    slug = slug or slugify(title) or slugify(input_path.stem)
+    output_path = output_dir / f"{now.strftime('%Y-%m-%d')}-{slug}.md"
 
-    # 태그 추출 (없으면 기본값)
-    if not tags:
-        tags = [CATEGORY_MAP.get(category, ("기타", ""))[0]]
+    # 저장
+    write_atomic(output_path, full_content)
+    logger.info(f"포스트 생성 완료: {output_path}")
 
-    # 출력 디렉토리 결정
-    if not output_dir:
-        base_dir = Path(__file__).parent.parent
-        category_info = CATEGORY_MAP.get(category, ("기타", "_posts"))
-        output_dir = base_dir / category_info[1]
+    return output_path
 
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # 파일명 생성
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    slug = slugify(title)
-    filename = f"{date_str}-{slug}.md"
-    output_path = output_dir / filename
+def sync_markdown_file(
+    input_path: Path,
+    category: str,
+    manifest: UploadManifest,
+    title: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    output_dir: Optional[Path] = None,
+    slug: Optional[str] = None,
+    force: bool = False
+) -> Tuple[Path, str]:
+    """매니페스트 기준 증분 처리
 
-    # front matter + 내용
-    front_matter = create_front_matter(title, category, tags)
-    full_content = front_matter + "\n" + content
+    - 원본(+참조 이미지) 해시가 그대로면 건너뜀 (이동/이름만 바뀐 원본도 해시로 찾아 건너뜀)
+    - 원본이 바뀌었으면 기존 포스트를 최초 날짜/파일명 그대로 갱신
+    - 처음 보는 원본이면 process_markdown_file과 같은 규칙으로 새 포스트 생성
+    렌더링 결과가 기존 파일과 같으면 쓰지 않는다.
 
-    # 저장
-    output_path.write_text(full_content, encoding="utf-8")
-    logger.info(f"포스트 생성 완료: {output_path}")
+    Args:
+        manifest: 업로드 매니페스트 (호출자가 save() 책임)
+        force: 해시가 같아도 다시 렌더링
 
-    return output_path
+    Returns:
+        (포스트 경로, CREATED | UPDATED | UNCHANGED)
+    """
+    raw = input_path.read_bytes()
+    # 참조 이미지가 바뀌어도 갱신되도록 이미지 내용까지 해시에 포함
+    images = asset_pipeline.local_images(raw.decode("utf-8"), input_path.parent)
+    digest = content_hash(raw + b"".join(content_hash(p.read_bytes()).encode() for p in images))
+
+    entry = manifest.get(input_path)
+    if entry and not manifest.post_path(entry).exists():
+        entry = None
+    if entry is None and not force:
+        moved = manifest.find_by_hash(digest)
+        if moved and manifest.post_path(moved).exists():
+            manifest.record(input_path, digest, manifest.post_path(moved), moved["date"])
+            return manifest.post_path(moved), UNCHANGED
+
+    if entry:
+        output_path = manifest.post_path(entry)
+        if entry["hash"] == digest and not force:
+            return output_path, UNCHANGED
+        date = datetime.strptime(entry["date"], DATE_FORMAT)
+    else:
+        output_path = None
+        date = datetime.now().replace(microsecond=0)
+
+    title, full_content = render_post(raw.decode("utf-8"), input_path, category, title, tags, date)
+
+    if output_path is None:
+        output_dir = _resolve_output_dir(category, output_dir)
+        slug = slug or slugify(title) or slugify(input_path.stem)
+        output_path = output_dir / f"{date.strftime('%Y-%m-%d')}-{slug}.md"
+        status = CREATED
+    else:
+        status = UPDATED
+
+    if output_path.exists() and output_path.read_text(encoding="utf-8") == full_content:
+        status = UNCHANGED
+    else:
+        write_atomic(output_path, full_content)
+        logger.info(f"포스트 {'생성' if status == CREATED else '갱신'} 완료: {output_path}")
+
+    manifest.record(input_path, digest, output_path, date.strftime(DATE_FORMAT))
+    return output_path, status
+
+
+def collect_sources(target: str) -> List[Path]:
+    """디렉토리 또는 glob 패턴에서 마크다운 파일 목록 수집 (정렬됨)"""
+    path = Path(target).expanduser()
+    if path.is_dir():
+        candidates = [p for p in path.rglob("*") if p.suffix.lower() in (".md", ".markdown")]
+    else:
+        candidates = [Path(p) for p in glob.glob(str(path), recursive=True)]
+    return sorted({p.resolve() for p in candidates if p.is_file()})
+
+
+def assign_slugs(base_slugs: Iterable[str], reserved: Iterable[str] = ()) -> List[str]:
+    """슬러그 충돌 해결 (입력 순서대로 -2, -3 ... 접미사, reserved는 이미 사용 중)"""
+    used = set(reserved)
+    result = []
+    for base in base_slugs:
+        slug, n = base, 1
+        while slug in used:
+            n += 1
+            slug = f"{base}-{n}"
+        used.add(slug)
+        result.append(slug)
+    return result
+
+
+def _base_slug(path: Path) -> str:
+    """파일 제목(없으면 파일명)에서 기본 슬러그 생성"""
+    try:
+        title, _ = extract_title(path.read_text(encoding="utf-8"), path.stem)
+    except (OSError, UnicodeDecodeError):
+        # 읽기 실패는 3단계에서 기록하고 건너뜀
+        title = path.stem
+    return slugify(title) or slugify(path.stem) or "post"
+
+
+def bulk_import(
+    sources: Iterable[Path],
+    category: str,
+    tags: Optional[list[str]] = None,
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    manifest: Optional[UploadManifest] = None,
+    force: bool = False
+) -> List[Path]:
+    """여러 마크다운 파일을 워커 풀에서 일괄 처리
+
+    입력은 경로순으로 정렬되고 슬러그 충돌은 그 순서대로 접미사를 붙여 해결하므로,
+    같은 입력이면 항상 같은 파일명이 나온다.
+    manifest가 주어지면 sync_markdown_file로 증분 처리하고, 끝나면 매니페스트를 저장한다.
+
+    Args:
+        sources: 입력 마크다운 파일 경로들
+        category: 카테고리
+        tags: 태그 리스트 (없으면 카테고리 기본값)
+        output_dir: 출력 디렉토리 (없으면 카테고리별 자동 결정)
+        workers: 워커 수 (없으면 ThreadPoolExecutor 기본값)
+        manifest: 업로드 매니페스트 (없으면 매번 새 포스트 생성)
+        force: 매니페스트 해시가 같아도 다시 렌더링
+
+    Returns:
+        포스트 파일 경로 목록 (입력 순서, 실패한 파일 제외)
+    """
+    sources = sorted({Path(p).resolve() for p in sources})
+    if not sources:
+        return []
+
+    output_dir = _resolve_output_dir(category, output_dir)
+    reserved = set()
+    if manifest is not None:
+        # 새 포스트가 오늘 날짜의 기존 포스트 파일명과 겹치지 않도록 예약
+        prefix = datetime.now().strftime("%Y-%m-%d-")
+        reserved = {p.stem[len(prefix):] for p in output_dir.glob(f"{prefix}*.md")}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 1단계: 제목 → 기본 슬러그 (병렬 읽기)
+        base_slugs = list(pool.map(_base_slug, sources))
+
+        # 2단계: 충돌 해결 (결정적, 순차)
+        slugs = assign_slugs(base_slugs, reserved)
+
+        # 3단계: 포스트 생성 (병렬 쓰기)
+        def run(item: Tuple[Path, str]) -> Optional[Tuple[Path, str]]:
+            path, slug = item
+            try:
+                if manifest is None:
+                    return process_markdown_file(path, category, tags=tags, output_dir=output_dir, slug=slug), CREATED
+                return sync_markdown_file(path, category, manifest, tags=tags,
+                                          output_dir=output_dir, slug=slug, force=force)
+            except Exception as e:
+                logger.error(f"포스트 생성 실패: {path}: {e}")
+                return None
+
+        results = list(pool.map(run, zip(sources, slugs)))
+
+    if manifest is not None:
+        manifest.save()
+
+    done = [r for r in results if r is not None]
+    counts = {status: sum(1 for _, s in done if s == status) for status in (CREATED, UPDATED, UNCHANGED)}
+    logger.info(
+        f"일괄 처리 완료: {len(done)}/{len(sources)}개 "
+        f"(생성 {counts[CREATED]}, 갱신 {counts[UPDATED]}, 변경 없음 {counts[UNCHANGED]})"
+    )
+    return [path for path, _ in done]
 
 
 def interactive_mode():
@@ -161,9 +392,16 @@ def interactive_mode():
     tags = [t.strip() for t in tags_input.split(",")] if tags_input else None
 
     # 처리
-    output_path = process_markdown_file(path, category, title, tags)
-
-    print(f"\n✅ 포스트가 생성되었습니다: {output_path}")
+    manifest = UploadManifest()
+    output_path, status = sync_markdown_file(path, category, manifest, title, tags)
+    manifest.save()
+
+    if status == UNCHANGED:
+        print(f"\n변경 없음 (건너뜀): {output_path}")
+        return
+    update_post_index([output_path])
+    build_search_index()
+    print(f"\n✅ 포스트가 {'생성' if status == CREATED else '갱신'}되었습니다: {output_path}")
     print("\n다음 단계:")
     print("  1. git add -A")
     print("  2. git commit -m '새 포스트 추가'")
@@ -181,10 +419,29 @@ def main():
     )
     parser.add_argument("--title", "-t", type=str, help="포스트 제목")
     parser.add_argument("--tags", type=str, help="태그 (쉼표로 구분)")
+    parser.add_argument("--bulk", "-b", type=str, help="일괄 처리할 디렉토리 또는 glob 패턴")
+    parser.add_argument("--workers", "-w", type=int, help="일괄 처리 워커 수")
+    parser.add_argument("--force", action="store_true", help="매니페스트 해시가 같아도 다시 생성")
 
     args = parser.parse_args()
 
-    if args.file:
+    if args.bulk:
+        # 일괄 처리 모드
+        sources = collect_sources(args.bulk)
+        if not sources:
+            print(f"마크다운 파일을 찾을 수 없습니다: {args.bulk}")
+            return 1
+
+        category = args.category or "essays"
+        tags = [t.strip() for t in args.tags.split(",")] if args.tags else None
+
+        outputs = bulk_import(sources, category, tags, workers=args.workers,
+                              manifest=UploadManifest(), force=args.force)
+        print(f"포스트 {len(outputs)}/{len(sources)}개 처리 완료")
+        update_post_index(outputs)
+        build_search_index()
+        return 0 if len(outputs) == len(sources) else 1
+    elif args.file:
         # 명령줄 모드
         path = Path(args.file).expanduser()
         if not path.exists():
@@ -194,8 +451,15 @@ def main():
         category = args.category or "essays"
         tags = [t.strip() for t in args.tags.split(",")] if args.tags else None
 
-        output_path = process_markdown_file(path, category, args.title, tags)
-        print(f"포스트 생성 완료: {output_path}")
+        manifest = UploadManifest()
+        output_path, status = sync_markdown_file(path, category, manifest, args.title, tags, force=args.force)
+        manifest.save()
+        if status == UNCHANGED:
+            print(f"변경 없음 (건너뜀): {output_path}")
+        else:
+            print(f"포스트 {'생성' if status == CREATED else '갱신'} 완료: {output_path}")
+            update_post_index([output_path])
+            build_search_index()
     else:
         # 대화형 모드
         interactive_mode()
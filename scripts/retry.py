@@ -4,6 +4,7 @@ from functools import wraps
 from typing import Callable, TypeVar, Any, Tuple, Type
 from config import config
 from logger import logger
+from metrics import metrics
 
 T = TypeVar("T")
 
@@ -47,6 +48,7 @@ def retry_on_exception(
                             f"[재시도 {attempt + 1}/{max_retries}] "
                             f"{func.__name__} 실패: {e}. {current_delay:.1f}초 후 재시도..."
                         )
+                        metrics.inc("retry_attempts_total", func=func.__name__)
                         if on_retry:
                             on_retry(e, attempt + 1)
                         time.sleep(current_delay)
@@ -55,6 +57,7 @@ def retry_on_exception(
                         logger.error(
                             f"[최종 실패] {func.__name__}: {max_retries}회 재시도 후 실패 - {e}"
                         )
+                        metrics.inc("retry_exhausted_total", func=func.__name__)
 
             raise last_exception
 
@@ -104,11 +107,13 @@ def retry_request(
                     f"[재시도 {attempt + 1}/{max_retries}] "
                     f"{func.__name__} 실패: {e}. {current_delay:.1f}초 후 재시도..."
                 )
+                metrics.inc("retry_attempts_total", func=func.__name__)
                 time.sleep(current_delay)
                 current_delay *= backoff
             else:
                 logger.error(
                     f"[최종 실패] {func.__name__}: {max_retries}회 재시도 후 실패 - {e}"
                 )
+                metrics.inc("retry_exhausted_total", func=func.__name__)
 
     raise last_exception
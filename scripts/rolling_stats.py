@@ -0,0 +1,231 @@
+"""증분 이동 통계 캐시
+
+시리즈("카테고리/이름")마다 이동평균/52주 고저/변동성에 필요한 상태만 들고 있다가
+새 봉이 들어오면 그 봉만 반영한다. data/rolling_stats.json에 저장돼 실행 간에 유지되므로
+가격 히스토리(price_history, 120일 보관)보다 긴 52주 구간도 계산할 수 있다.
+
+    prices          최근 LONG_WINDOW개 종가 (이동평균에서 빠질 값) + 구간 합
+    returns         최근 SHORT_WINDOW개 수익률 + 합, 제곱합 (실현 변동성)
+    highs / lows    EXTREME_WINDOW 구간의 단조 덱 [(봉 번호, 가격)] (구간 최고/최저)
+    ema, ewma_var   가격 EMA, 수익률 EWMA 분산 (RiskMetrics λ)
+
+봉 하나를 반영하는 비용은 O(1)(단조 덱은 분할 상환 O(1))이고, 하루 갱신은 히스토리에서
+시리즈별 마지막 반영 날짜 이후 행만 읽는다. 처음 보는 시리즈는 히스토리 전체를 한 번 재생한다.
+"""
+import json
+import math
+import os
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from price_history import PriceHistory
+
+DEFAULT_ROLLING_PATH = Path(__file__).parent / "data" / "rolling_stats.json"
+
+ROLLING_VERSION = 1
+
+SHORT_WINDOW = 20
+LONG_WINDOW = 60
+EXTREME_WINDOW = 252
+EMA_SPAN = 20
+EWMA_LAMBDA = 0.94
+TRADING_DAYS = 252
+
+
+class RollingState:
+    """한 시리즈의 이동 통계 상태"""
+
+    __slots__ = ("last_date", "bars", "prices", "sum_short", "sum_long", "returns", "return_sum",
+                 "return_sumsq", "highs", "lows", "ema", "ewma_var")
+
+    def __init__(self):
+        self.last_date: Optional[str] = None
+        self.bars = 0
+        self.prices = deque(maxlen=LONG_WINDOW)
+        self.sum_short = 0.0
+        self.sum_long = 0.0
+        self.returns = deque(maxlen=SHORT_WINDOW)
+        self.return_sum = 0.0
+        self.return_sumsq = 0.0
+        self.highs = deque()
+        self.lows = deque()
+        self.ema: Optional[float] = None
+        self.ewma_var: Optional[float] = None
+
+    def update(self, date: str, price: float) -> None:
+        """새 봉 하나 반영"""
+        if self.prices and self.prices[-1]:
+            ret = price / self.prices[-1] - 1
+            if len(self.returns) == SHORT_WINDOW:
+                old = self.returns[0]
+                self.return_sum -= old
+                self.return_sumsq -= old * old
+            self.returns.append(ret)
+            self.return_sum += ret
+            self.return_sumsq += ret * ret
+            self.ewma_var = ret * ret if self.ewma_var is None else (
+                EWMA_LAMBDA * self.ewma_var + (1 - EWMA_LAMBDA) * ret * ret)
+
+        # 구간에서 빠지는 값 (prices는 LONG_WINDOW개에서 가장 오래된 값이 밀려남)
+        if len(self.prices) >= SHORT_WINDOW:
+            self.sum_short -= self.prices[-SHORT_WINDOW]
+        if len(self.prices) == LONG_WINDOW:
+            self.sum_long -= self.prices[0]
+        self.prices.append(price)
+        self.sum_short += price
+        self.sum_long += price
+
+        bar = self.bars
+        while self.highs and self.highs[-1][1] <= price:
+            self.highs.pop()
+        self.highs.append((bar, price))
+        while self.lows and self.lows[-1][1] >= price:
+            self.lows.pop()
+        self.lows.append((bar, price))
+        for extremes in (self.highs, self.lows):
+            if extremes[0][0] <= bar - EXTREME_WINDOW:
+                extremes.popleft()
+
+        self.ema = price if self.ema is None else self.ema + 2 / (EMA_SPAN + 1) * (price - self.ema)
+        self.bars += 1
+        self.last_date = date
+
+    def indicators(self) -> Dict[str, Optional[float]]:
+        """파생 지표 (봉이 모자라면 None)
+
+        Returns:
+            date, bars, price, ma_short, ma_long, high, low(최근 EXTREME_WINDOW봉, 그보다 짧으면
+            전체), ema, volatility(SHORT_WINDOW봉 실현, 연율 %), ewma_volatility(연율 %)
+        """
+        n = len(self.returns)
+        volatility = None
+        if n >= 2:
+            variance = max((self.return_sumsq - self.return_sum ** 2 / n) / (n - 1), 0.0)
+            volatility = round(math.sqrt(variance * TRADING_DAYS) * 100, 2)
+        return {
+            "date": self.last_date,
+            "bars": self.bars,
+            "price": self.prices[-1] if self.prices else None,
+            "ma_short": round(self.sum_short / SHORT_WINDOW, 6) if len(self.prices) >= SHORT_WINDOW else None,
+            "ma_long": round(self.sum_long / LONG_WINDOW, 6) if len(self.prices) >= LONG_WINDOW else None,
+            "high": self.highs[0][1] if self.highs else None,
+            "low": self.lows[0][1] if self.lows else None,
+            "ema": round(self.ema, 6) if self.ema is not None else None,
+            "volatility": volatility,
+            "ewma_volatility": (round(math.sqrt(self.ewma_var * TRADING_DAYS) * 100, 2)
+                                if self.ewma_var is not None else None),
+        }
+
+    def to_json(self) -> Dict:
+        return {
+            "date": self.last_date,
+            "bars": self.bars,
+            "prices": list(self.prices),
+            "sums": [self.sum_short, self.sum_long],
+            "returns": list(self.returns),
+            "return_sums": [self.return_sum, self.return_sumsq],
+            "highs": [list(item) for item in self.highs],
+            "lows": [list(item) for item in self.lows],
+            "ema": self.ema,
+            "ewma_var": self.ewma_var,
+        }
+
+    @classmethod
+    def from_json(cls, raw: Dict) -> "RollingState":
+        state = cls()
+        state.last_date = raw["date"]
+        state.bars = raw["bars"]
+        state.prices.extend(raw["prices"])
+        state.sum_short, state.sum_long = raw["sums"]
+        state.returns.extend(raw["returns"])
+        state.return_sum, state.return_sumsq = raw["return_sums"]
+        state.highs.extend((bar, price) for bar, price in raw["highs"])
+        state.lows.extend((bar, price) for bar, price in raw["lows"])
+        state.ema = raw["ema"]
+        state.ewma_var = raw["ewma_var"]
+        return state
+
+
+class RollingStatsCache:
+    """시리즈 키 → RollingState (JSON으로 저장)"""
+
+    def __init__(self, states: Optional[Dict[str, RollingState]] = None, path: Path = DEFAULT_ROLLING_PATH):
+        self.path = Path(path)
+        self.states: Dict[str, RollingState] = states if states is not None else {}
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_ROLLING_PATH) -> "RollingStatsCache":
+        """JSON에서 로드 (없거나 버전이 다르면 빈 캐시, 다음 update()가 히스토리로 다시 채움)"""
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("version") != ROLLING_VERSION:
+            return cls(path=path)
+        states = {key: RollingState.from_json(value) for key, value in raw.get("series", {}).items()}
+        return cls(states, path=path)
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """JSON으로 원자적 저장 (키 순서 고정)"""
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        series = {key: self.states[key].to_json() for key in sorted(self.states)}
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": ROLLING_VERSION, "series": series}, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp_path, path)
+        return path
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def update(self, history: PriceHistory) -> int:
+        """히스토리에서 시리즈별 마지막 반영 날짜 이후의 봉만 반영
+
+        히스토리의 값은 모두 실제 봉이다 (배치 종가가 있는 시리즈는 record()가 실행 날짜로
+        기록하지 않음). 같은 값이 이어져도 그대로 반영한다.
+
+        Returns:
+            반영한 봉 수
+        """
+        frame = history.frame
+        if frame.empty:
+            return 0
+        known = [state.last_date for key, state in self.states.items()
+                 if key in frame.columns and state.last_date]
+        if len(known) == len(frame.columns):
+            # 모두 아는 시리즈면 가장 오래된 마지막 날짜 이후 행만 읽음
+            frame = frame[frame.index > pd.Timestamp(min(known))]
+        if frame.empty:
+            return 0
+
+        # 시리즈별 마지막 반영 날짜 이후의 값이 있는 칸 (처음 보는 시리즈는 전체)
+        states = [self.states.get(key) for key in frame.columns]
+        last = np.array([state.last_date if state and state.last_date else "NaT" for state in states],
+                        dtype="datetime64[ns]")
+        values = frame.to_numpy(dtype=float)
+        dates = frame.index.to_numpy()[:, None]
+        mask = ~np.isnan(values) & ((dates > last) | np.isnat(last))
+        labels = frame.index.strftime("%Y-%m-%d")
+
+        added = 0
+        for j in np.flatnonzero(mask.any(axis=0)):
+            state = states[j]
+            if state is None:
+                state = self.states[frame.columns[j]] = RollingState()
+            column = values[:, j]
+            rows = np.flatnonzero(mask[:, j])
+            for i in rows:
+                state.update(labels[i], float(column[i]))
+            added += len(rows)
+        return added
+
+    def indicators(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Optional[float]]]:
+        """키 → 파생 지표 (없으면 전체)"""
+        keys = self.states if keys is None else [key for key in keys if key in self.states]
+        return {key: self.states[key].indicators() for key in keys}
@@ -0,0 +1,196 @@
+"""사이트 검색 인덱스 빌더
+
+_posts/** 를 토큰화해 샤딩된 역색인을 assets/search/에 만든다.
+브라우저(assets/js/search.js)는 검색어 토큰이 속한 샤드만 지연 로딩한다.
+
+토큰화 규칙 (search.js와 동일하게 유지할 것):
+    - 한글 연속 구간은 2-gram (1글자 구간은 그대로)
+    - 색인할 때만 한글 글자 하나씩(1-gram)도 넣는다. 1글자 검색어("금")가
+      긴 단어("금리", "황금") 안의 글자도 찾도록 (검색어 토큰화는 그대로)
+    - 영문/숫자는 소문자 단어 (2글자 이상, 숫자만으로 된 토큰 제외)
+    - 샤드 = FNV-1a 32bit(UTF-8 토큰) % 샤드 수
+
+사용법:
+    python search_index.py
+"""
+import json
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from logger import logger
+
+BASE_DIR = Path(__file__).parent.parent
+POSTS_DIR = BASE_DIR / "_posts"
+DEFAULT_OUTPUT_DIR = BASE_DIR / "assets" / "search"
+
+INDEX_VERSION = 1
+SHARD_COUNT = 16
+
+FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+POST_FILENAME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-(.+)\.(?:md|markdown)$")
+TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+# 본문 정리용 (Liquid, HTML 태그, 마크다운 링크 URL)
+STRIP_PATTERNS = (
+    re.compile(r"\{%.*?%\}|\{\{.*?\}\}", re.DOTALL),
+    re.compile(r"<[^>]+>"),
+    re.compile(r"\]\([^)]*\)"),
+)
+
+
+def fnv1a(token: str) -> int:
+    """FNV-1a 32bit 해시 (UTF-8 바이트 기준)"""
+    h = 0x811C9DC5
+    for byte in token.encode("utf-8"):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def shard_of(token: str, shard_count: int = SHARD_COUNT) -> int:
+    return fnv1a(token) % shard_count
+
+
+def tokenize(text: str, unigrams: bool = False) -> List[str]:
+    """한글 2-gram + 영문/숫자 단어 토큰 (순서 유지, 중복 포함)
+
+    unigrams면 2글자 이상 한글 구간의 글자 하나씩도 넣는다 (색인용).
+    """
+    tokens = []
+    for run in TOKEN_RE.findall(text.lower()):
+        if "가" <= run[0] <= "힣":
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+                if unigrams:
+                    tokens.extend(run)
+        elif len(run) >= 2 and not run.isdigit():
+            tokens.append(run)
+    return tokens
+
+
+def parse_post(path: Path) -> Optional[Dict]:
+    """포스트 파일을 (front matter, 본문)으로 파싱 (파일명이 규칙에 안 맞으면 None)"""
+    name_match = POST_FILENAME_RE.match(path.name)
+    if not name_match:
+        return None
+
+    text = path.read_text(encoding="utf-8")
+    fm_match = FRONT_MATTER_RE.match(text)
+    front_matter = {}
+    if fm_match:
+        try:
+            front_matter = yaml.safe_load(fm_match.group(1)) or {}
+        except yaml.YAMLError as e:
+            logger.warning(f"front matter 파싱 실패 (건너뜀): {path}: {e}")
+            return None
+        text = text[fm_match.end():]
+
+    year, month, day, slug = name_match.groups()
+    categories = front_matter.get("categories") or []
+    if isinstance(categories, str):
+        categories = categories.split()
+
+    posted = front_matter.get("date")
+    if isinstance(posted, (datetime, date)):
+        posted = posted.strftime("%Y-%m-%d")
+    else:
+        posted = f"{year}-{month}-{day}"
+
+    body = text
+    for pattern in STRIP_PATTERNS:
+        body = pattern.sub(" ", body)
+
+    return {
+        "title": str(front_matter.get("title") or slug),
+        "date": posted,
+        "categories": [str(c) for c in categories],
+        "tags": [str(t) for t in front_matter.get("tags") or []],
+        # Jekyll 기본 permalink (/:categories/:year/:month/:day/:title)
+        "url": "/" + "/".join([*map(str, categories), year, month, day, slug]),
+        "body": body,
+    }
+
+
+def collect_posts(posts_dir: Path = POSTS_DIR) -> List[Dict]:
+    """모든 포스트 파싱 (최신순)"""
+    posts = []
+    for path in sorted(posts_dir.rglob("*.md")) + sorted(posts_dir.rglob("*.markdown")):
+        post = parse_post(path)
+        if post is not None:
+            posts.append(post)
+    posts.sort(key=lambda p: (p["date"], p["url"]), reverse=True)
+    return posts
+
+
+def build_index(posts: Iterable[Dict], shard_count: int = SHARD_COUNT) -> Tuple[Dict, List[Dict[str, List[int]]]]:
+    """문서 메타 + 샤드별 역색인 생성
+
+    문서 ID는 posts 순서(최신순)이고, 게시 목록은 ID 오름차순을
+    차분 인코딩([첫 ID, 간격, 간격, ...])해 JSON 크기를 줄인다.
+
+    Returns:
+        (meta, shards)
+    """
+    docs = []
+    postings: Dict[str, List[int]] = {}
+    for doc_id, post in enumerate(posts):
+        docs.append([post["url"], post["title"], post["date"], " ".join(post["categories"])])
+        text = " ".join([post["title"], *post["tags"], *post["categories"], post["body"]])
+        for token in dict.fromkeys(tokenize(text, unigrams=True)):
+            postings.setdefault(token, []).append(doc_id)
+
+    shards: List[Dict[str, List[int]]] = [{} for _ in range(shard_count)]
+    for token in sorted(postings):
+        ids = postings[token]
+        shards[shard_of(token, shard_count)][token] = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+
+    meta = {"version": INDEX_VERSION, "shards": shard_count, "docs": docs}
+    return meta, shards
+
+
+def _write_if_changed(path: Path, payload) -> bool:
+    """내용이 바뀐 경우에만 원자적으로 저장"""
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_search_index(posts_dir: Path = POSTS_DIR, output_dir: Path = DEFAULT_OUTPUT_DIR,
+                       shard_count: int = SHARD_COUNT) -> Dict[str, int]:
+    """검색 인덱스 빌드 및 저장
+
+    바뀐 파일만 다시 쓰고, 샤드 수가 줄어 남은 옛 샤드는 삭제한다.
+
+    Returns:
+        {"docs": 문서 수, "tokens": 토큰 수, "written": 다시 쓴 파일 수}
+    """
+    meta, shards = build_index(collect_posts(posts_dir), shard_count)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written = sum(
+        _write_if_changed(output_dir / f"shard-{i:02d}.json", shard) for i, shard in enumerate(shards)
+    )
+    written += _write_if_changed(output_dir / "meta.json", meta)
+
+    expected = {f"shard-{i:02d}.json" for i in range(shard_count)}
+    for stale in output_dir.glob("shard-*.json"):
+        if stale.name not in expected:
+            stale.unlink()
+
+    stats = {"docs": len(meta["docs"]), "tokens": sum(len(s) for s in shards), "written": written}
+    logger.info(f"검색 인덱스: 문서 {stats['docs']}개, 토큰 {stats['tokens']}개, 파일 {written}개 갱신")
+    return stats
+
+
+if __name__ == "__main__":
+    build_search_index()
@@ -0,0 +1,170 @@
+"""정적 JSON API 발행
+
+매일 수집한 market_data를 GitHub Pages 아래 api/v1/에 정적 파일로 남긴다.
+다른 도구는 공급자(Yahoo 등)를 다시 호출하지 않고 이 파일만 받아 가면 된다.
+
+    api/v1/index.json                         발행일 목록, 심볼 목록
+    api/v1/latest.json                        최신 스냅샷
+    api/v1/daily/YYYY-MM-DD.json              일별 스냅샷
+    api/v1/symbols/<카테고리>/<id>.json        심볼별 시계열 [[날짜, 가격, 변동], ...]
+
+JSON은 키 순서가 고정된 압축 형식이고, 내용이 바뀐 파일만 다시 쓰므로
+바뀌지 않은 파일은 ETag가 유지되어 캐시가 그대로 유효하다.
+"""
+import json
+import math
+import os
+import re
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from logger import logger
+from quotes import iter_quotes
+from universe import load_universe
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_API_DIR = BASE_DIR / "api" / "v1"
+
+API_VERSION = 1
+
+# 시계열 대상에서 제외할 최상위 키 (가격 표가 아닌 항목)
+NON_SERIES_KEYS = ("timestamp", "economic_indicators", "fear_greed", "economic_calendar", "breadth",
+                   "regime", "anomalies", "trend")
+
+
+def _clean(value: Any) -> Any:
+    """JSON 표준에 없는 NaN/Infinity를 null로 (재귀)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {str(k): _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(v) for v in value]
+    return value
+
+
+def dumps(payload: Any) -> str:
+    """정적 API용 JSON 직렬화 (키 정렬, 공백 없음)"""
+    return json.dumps(_clean(payload), ensure_ascii=False, sort_keys=True,
+                      separators=(",", ":"), allow_nan=False, default=str)
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """내용이 바뀐 경우에만 원자적으로 저장"""
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return True
+
+
+def symbol_id(ticker: str) -> str:
+    """티커 → 파일명용 ID (^GSPC → gspc, KRW=X → krw-x)"""
+    slug = re.sub(r"[^a-z0-9]+", "-", ticker.lower()).strip("-")
+    return slug or "unknown"
+
+
+def _series_points(market_data: Dict) -> Dict[Tuple[str, str], Tuple[Optional[float], Optional[float]]]:
+    """(카테고리, 이름) → (가격, 변동)"""
+    points = {}
+    for category, items in market_data.items():
+        if category in NON_SERIES_KEYS or not isinstance(items, dict):
+            continue
+        for name, quote in iter_quotes(items):
+            if quote.price is not None:
+                points[(category, name)] = (quote.price, quote.change)
+    return points
+
+
+class SnapshotAPI:
+    """api/v1 정적 파일 발행기"""
+
+    def __init__(self, api_dir: Path = DEFAULT_API_DIR):
+        self.api_dir = Path(api_dir)
+
+    def _ticker(self, category: str, name: str) -> str:
+        universe = load_universe()
+        if category == "crypto":
+            return name
+        return universe.symbols.get(category, {}).get(name, name)
+
+    def _update_series(self, category: str, name: str, day: str,
+                       price: Optional[float], change: Optional[float]) -> Tuple[str, bool]:
+        """심볼 시계열 파일에 해당 날짜 값을 넣거나 교체"""
+        ticker = self._ticker(category, name)
+        rel_path = f"symbols/{category}/{symbol_id(ticker)}.json"
+        path = self.api_dir / rel_path
+
+        points = []
+        if path.exists():
+            try:
+                points = json.loads(path.read_text(encoding="utf-8")).get("points", [])
+            except (OSError, ValueError) as e:
+                logger.warning(f"시계열 파일 손상 (새로 작성): {path}: {e}")
+        by_day = {p[0]: p for p in points}
+        by_day[day] = [day, price, change]
+
+        payload = {
+            "version": API_VERSION,
+            "category": category,
+            "name": name,
+            "ticker": ticker,
+            "points": [by_day[d] for d in sorted(by_day)],
+        }
+        return rel_path, write_if_changed(path, dumps(payload))
+
+    def publish(self, market_data: Dict, now: Optional[datetime] = None) -> Dict[str, int]:
+        """스냅샷 발행 (일별, latest, 심볼 시계열, index)
+
+        Returns:
+            {"symbols": 심볼 수, "written": 다시 쓴 파일 수}
+        """
+        now = now or datetime.now()
+        day = now.strftime("%Y-%m-%d")
+
+        snapshot = dumps({
+            "version": API_VERSION,
+            "date": day,
+            "generated_at": now.strftime("%Y-%m-%dT%H:%M:%S+09:00"),
+            "data": {k: v for k, v in market_data.items() if k != "timestamp"},
+        })
+        written = write_if_changed(self.api_dir / "daily" / f"{day}.json", snapshot)
+
+        symbols = {}
+        for (category, name), (price, change) in _series_points(market_data).items():
+            rel_path, changed = self._update_series(category, name, day, price, change)
+            written += changed
+            symbols[f"{category}/{name}"] = rel_path
+
+        days = sorted(p.stem for p in (self.api_dir / "daily").glob("*.json"))
+        latest = days[-1]
+        if latest == day:
+            written += write_if_changed(self.api_dir / "latest.json", snapshot)
+
+        # 이전 실행에서 만든 심볼도 index에 유지
+        index_path = self.api_dir / "index.json"
+        if index_path.exists():
+            try:
+                symbols = {**json.loads(index_path.read_text(encoding="utf-8")).get("symbols", {}), **symbols}
+            except (OSError, ValueError):
+                pass
+        written += write_if_changed(index_path, dumps({
+            "version": API_VERSION,
+            "latest": latest,
+            "days": days,
+            "symbols": symbols,
+        }))
+
+        stats = {"symbols": len(symbols), "written": written}
+        logger.info(f"정적 API 발행: {day}, 심볼 {stats['symbols']}개, 파일 {written}개 갱신")
+        return stats
+
+
+def publish_snapshot(market_data: Dict, now: Optional[datetime] = None,
+                     api_dir: Path = DEFAULT_API_DIR) -> Dict[str, int]:
+    """기본 위치(api/v1)에 스냅샷 발행"""
+    return SnapshotAPI(api_dir).publish(market_data, now)
@@ -0,0 +1,100 @@
+"""인라인 SVG 스파크라인
+
+(시리즈 × 시점) 행렬을 한 번에 정규화/좌표 변환하고,
+Ramer-Douglas-Peucker 단순화로 점 수를 줄여 짧은 path 문자열을 만든다.
+"""
+from typing import List, Optional
+
+import numpy as np
+
+WIDTH = 60
+HEIGHT = 16
+PADDING = 1.5
+# RDP 허용 오차 (px). 60x16 크기에서 눈에 띄지 않는 수준
+TOLERANCE = 0.6
+
+
+def to_coordinates(matrix: np.ndarray, width: float = WIDTH, height: float = HEIGHT,
+                   padding: float = PADDING) -> np.ndarray:
+    """값 행렬 → y 좌표 행렬 (행별 min-max 정규화, 위가 큰 값, NaN 유지)"""
+    lo = np.nanmin(matrix, axis=1, keepdims=True)
+    hi = np.nanmax(matrix, axis=1, keepdims=True)
+    span = np.where(hi - lo > 0, hi - lo, 1.0)
+    norm = (matrix - lo) / span
+    # 변동이 없으면 가운데 수평선
+    norm = np.where(hi - lo > 0, norm, 0.5)
+    return padding + (1.0 - norm) * (height - 2 * padding)
+
+
+def simplify(points: np.ndarray, tolerance: float = TOLERANCE) -> np.ndarray:
+    """Ramer-Douglas-Peucker 단순화 (N × 2 점 배열, 양 끝점 유지)"""
+    if len(points) <= 2:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        seg = points[start + 1:end]
+        dx, dy = b - a
+        norm = np.hypot(dx, dy)
+        # 선분 a-b에서 각 점까지의 수직 거리 (벡터 연산)
+        dist = np.abs(dx * (seg[:, 1] - a[1]) - dy * (seg[:, 0] - a[0])) / norm
+        idx = int(np.argmax(dist))
+        if dist[idx] > tolerance:
+            mid = start + 1 + idx
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return points[keep]
+
+
+def _fmt(value: float) -> str:
+    """소수점 1자리, 불필요한 .0 제거 (path 길이 최소화)"""
+    text = f"{value:.1f}"
+    return text[:-2] if text.endswith(".0") else text
+
+
+def render_sparklines(matrix: np.ndarray, width: int = WIDTH, height: int = HEIGHT,
+                      tolerance: float = TOLERANCE) -> List[Optional[str]]:
+    """행렬의 각 행을 인라인 SVG로 (유효한 점이 2개 미만이면 None)
+
+    색상은 기간 전체 추세(첫 값 대비 마지막 값)로 chg-up/chg-down/chg-flat 클래스를 붙인다.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.size == 0:
+        return []
+    n_points = matrix.shape[1]
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=1)
+
+    result: List[Optional[str]] = [None] * len(matrix)
+    drawable = counts >= 2
+    if not drawable.any():
+        return result
+
+    rows = matrix[drawable]
+    ys = to_coordinates(rows, width, height)
+    xs = np.linspace(0, width, n_points)
+
+    # 추세 (행별 첫/마지막 유효값)
+    first_idx = np.argmax(~np.isnan(rows), axis=1)
+    firsts = rows[np.arange(len(rows)), first_idx]
+    lasts = rows[:, -1]
+    lasts = np.where(np.isnan(lasts), firsts, lasts)
+    trend = np.sign(np.round(lasts - firsts, 6))
+
+    for out_idx, y_row, t in zip(np.flatnonzero(drawable), ys, trend):
+        mask = ~np.isnan(y_row)
+        points = simplify(np.column_stack((xs[mask], y_row[mask])), tolerance)
+        # M 뒤의 좌표쌍은 암묵적 L
+        d = "M" + " ".join(f"{_fmt(x)} {_fmt(y)}" for x, y in points)
+        css = "chg-up" if t > 0 else "chg-down" if t < 0 else "chg-flat"
+        result[out_idx] = (
+            f'<svg class="spark {css}" viewBox="0 0 {width} {height}" width="{width}" height="{height}" '
+            f'aria-hidden="true"><path d="{d}"/></svg>'
+        )
+    return result
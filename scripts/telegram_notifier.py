@@ -4,15 +4,21 @@ from datetime import datetime
 from telegram import Bot
 from config import config
 from logger import logger, LogContext
+from metrics import metrics
+from quotes import Quote, get_quote, iter_quotes
+from universe import load_universe
 
 
 class TelegramNotifier:
     """텔레그램 봇 알림 클라이언트"""
 
     def __init__(self):
-        if not config.validate_telegram():
+        if "telegram" not in config.capabilities:
             logger.warning("텔레그램 설정이 유효하지 않습니다")
-        self.bot = Bot(token=config.TELEGRAM_BOT_TOKEN) if config.TELEGRAM_BOT_TOKEN else None
+        self.bot = (
+            Bot(token=config.TELEGRAM_BOT_TOKEN, base_url=config.TELEGRAM_API_URL)
+            if config.TELEGRAM_BOT_TOKEN else None
+        )
         self.chat_id = config.TELEGRAM_CHAT_ID
         self.max_message_length = config.TELEGRAM_MAX_MESSAGE_LENGTH
         self.message_delay = config.TELEGRAM_MESSAGE_DELAY
@@ -23,6 +29,17 @@ class TelegramNotifier:
             return "-"
         return f"+{val:.2f}%" if val >= 0 else f"{val:.2f}%"
 
+    def _quote_line(self, name: str, quote: Quote, price: str) -> str:
+        """등락 이모지 + 이름: 가격 (변동률)"""
+        change_val = quote.change or 0
+        emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
+        return f"{emoji} {name}: {price} ({self._format_change(quote.change)})"
+
+    def _sorted_by_change(self, rows) -> list:
+        """가격이 있는 항목을 변동률 내림차순으로 (변동률 없으면 0)"""
+        items = [(name, quote) for name, quote in iter_quotes(rows) if quote.price is not None]
+        return sorted(items, key=lambda x: x[1].change if x[1].change is not None else 0, reverse=True)
+
     def _build_full_briefing(self, data: dict, post_url: str) -> list:
         """전체 시황 브리핑 메시지 생성 (여러 메시지로 분할)"""
         now = datetime.now()
@@ -41,11 +58,11 @@ class TelegramNotifier:
         msg1.append("*📈 시장 심리 지표*")
         msg1.append("")
 
-        vix = data.get("market_indicators", {}).get("VIX (공포지수)", {})
-        if vix.get("price"):
-            status = "안정" if vix["price"] < 20 else "주의" if vix["price"] < 30 else "공포"
-            emoji = "🟢" if vix["price"] < 20 else "🟡" if vix["price"] < 30 else "🔴"
-            msg1.append(f"{emoji} VIX: {vix['price']:.1f} ({self._format_change(vix.get('change'))}) - {status}")
+        vix = get_quote(data, "market_indicators", "VIX (공포지수)")
+        if vix.price:
+            status = "안정" if vix.price < 20 else "주의" if vix.price < 30 else "공포"
+            emoji = "🟢" if vix.price < 20 else "🟡" if vix.price < 30 else "🔴"
+            msg1.append(f"{emoji} VIX: {vix.price:.1f} ({self._format_change(vix.change)}) - {status}")
 
         # Fear & Greed
         fear_greed = data.get("fear_greed", {})
@@ -59,14 +76,29 @@ class TelegramNotifier:
             emoji = "🟢" if crypto_fg["value"] >= 55 else "🟡" if crypto_fg["value"] >= 45 else "🔴"
             msg1.append(f"{emoji} 크립토 F&G: {crypto_fg['value']}/100 ({crypto_fg.get('classification', '-')})")
 
+        # 자산 간 상관 기반 국면
+        regime = data.get("regime", {}).get("regime", {})
+        if regime.get("score") is not None:
+            emoji = "🟢" if regime["label"] == "위험 선호" else "🔴" if regime["label"] == "위험 회피" else "🟡"
+            msg1.append(f"{emoji} 국면: {regime['label']} (점수 {regime['score']:+.2f})")
+
+        # 통계적 이상 변동 (과거 일간 변동 분포 대비)
+        anomalies = data.get("anomalies", [])
+        if anomalies:
+            msg1.append("")
+            msg1.append("*⚠️ 이례적 변동*")
+            for item in anomalies[:config.ANOMALY_SUMMARY_LIMIT]:
+                tail = f"상위 {100 - item['percentile']:.2f}%" if item["z"] > 0 else f"하위 {item['percentile']:.2f}%"
+                msg1.append(f"• {item['name']}: {self._format_change(item['change'])} ({item['z']:+.1f}σ, {tail})")
+
         # 채권 금리
         bonds = data.get("bonds", {})
         if bonds:
             msg1.append("")
             msg1.append("*💵 채권 금리*")
-            for name, info in bonds.items():
-                if info.get("price"):
-                    msg1.append(f"• {name}: {info['price']:.2f}% ({self._format_change(info.get('change'))})")
+            for name, quote in iter_quotes(bonds):
+                if quote.price:
+                    msg1.append(f"• {name}: {quote.price:.2f}% ({self._format_change(quote.change)})")
 
         msg1.append("")
         msg1.append("─" * 20)
@@ -75,12 +107,9 @@ class TelegramNotifier:
         # 미국 증시
         msg1.append("*🇺🇸 미국 증시*")
         msg1.append("")
-        us = data.get("us_indices", {})
-        for name, info in us.items():
-            if info.get("price"):
-                change_val = info.get('change', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                msg1.append(f"{emoji} {name}: {info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name, quote in iter_quotes(data.get("us_indices")):
+            if quote.price:
+                msg1.append(self._quote_line(name, quote, f"{quote.price:,.2f}"))
 
         messages.append("\n".join(msg1))
 
@@ -88,18 +117,8 @@ class TelegramNotifier:
         msg2 = []
         msg2.append("*💻 빅테크 (MAG7)*")
         msg2.append("")
-        mag7 = data.get("mag7", {})
-        mag7_items = [(k, v) for k, v in mag7.items() if v.get('price') is not None]
-        # 정렬 시 None 처리 개선
-        mag7_sorted = sorted(
-            mag7_items,
-            key=lambda x: x[1].get('change') if x[1].get('change') is not None else 0,
-            reverse=True
-        )
-        for name, info in mag7_sorted:
-            change_val = info.get('change', 0) or 0
-            emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-            msg2.append(f"{emoji} {name}: ${info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name, quote in self._sorted_by_change(data.get("mag7")):
+            msg2.append(self._quote_line(name, quote, f"${quote.price:,.2f}"))
 
         msg2.append("")
         msg2.append("─" * 20)
@@ -108,17 +127,20 @@ class TelegramNotifier:
         # 섹터 ETF
         msg2.append("*📊 섹터 ETF*")
         msg2.append("")
-        sectors = data.get("us_sectors", {})
-        sector_items = [(k, v) for k, v in sectors.items() if v.get('price') is not None]
-        sector_sorted = sorted(
-            sector_items,
-            key=lambda x: x[1].get('change') if x[1].get('change') is not None else 0,
-            reverse=True
-        )
-        for name, info in sector_sorted:
-            change_val = info.get('change', 0) or 0
-            emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-            msg2.append(f"{emoji} {name}: ${info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name, quote in self._sorted_by_change(data.get("us_sectors")):
+            msg2.append(self._quote_line(name, quote, f"${quote.price:,.2f}"))
+
+        # 시장 폭 (구성 종목 파일이 있을 때만)
+        for index in data.get("breadth", {}).get("indices", []):
+            msg2.append("")
+            msg2.append(f"*📊 시장 폭 - {index['name']}*")
+            msg2.append(f"🔺 상승 {index['advancers']:,} / 🔻 하락 {index['decliners']:,} / "
+                        f"▪️ 보합 {index['unchanged']:,} (총 {index['count']:,})")
+            msg2.append(f"신고가 {index['new_highs']:,} / 신저가 {index['new_lows']:,}")
+            for key, label in (("gainers", "상승 상위"), ("losers", "하락 상위")):
+                if index.get(key):
+                    movers = ", ".join(f"{m['name']} {self._format_change(m['change'])}" for m in index[key])
+                    msg2.append(f"{label}: {movers}")
 
         messages.append("\n".join(msg2))
 
@@ -129,25 +151,19 @@ class TelegramNotifier:
 
         # 아시아
         msg3.append("_아시아_")
-        global_idx = data.get("global_indices", {})
-        asia_keys = ["KOSPI", "KOSDAQ", "니케이225", "항셍", "상해종합"]
-        for name in asia_keys:
-            info = global_idx.get(name, {})
-            if info.get("price"):
-                change_val = info.get('change', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                msg3.append(f"{emoji} {name}: {info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        universe = load_universe()
+        for name in universe.group("global_indices", "아시아"):
+            quote = get_quote(data, "global_indices", name)
+            if quote.price:
+                msg3.append(self._quote_line(name, quote, f"{quote.price:,.2f}"))
 
         # 유럽
         msg3.append("")
         msg3.append("_유럽_")
-        europe_keys = ["DAX", "FTSE 100"]
-        for name in europe_keys:
-            info = global_idx.get(name, {})
-            if info.get("price"):
-                change_val = info.get('change', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                msg3.append(f"{emoji} {name}: {info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name in universe.group("global_indices", "유럽"):
+            quote = get_quote(data, "global_indices", name)
+            if quote.price:
+                msg3.append(self._quote_line(name, quote, f"{quote.price:,.2f}"))
 
         msg3.append("")
         msg3.append("─" * 20)
@@ -156,13 +172,10 @@ class TelegramNotifier:
         # 암호화폐
         msg3.append("*🪙 암호화폐*")
         msg3.append("")
-        crypto = data.get("crypto", {})
-        for name, info in crypto.items():
-            if info.get("price_usd"):
-                change_val = info.get('change_24h', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                krw = f"₩{info['price_krw']:,.0f}" if info.get('price_krw') else ""
-                msg3.append(f"{emoji} {name}: ${info['price_usd']:,.2f} {krw} ({self._format_change(info.get('change_24h'))})")
+        for name, quote in iter_quotes(data.get("crypto")):
+            if quote.price:
+                krw = f"₩{quote.price_krw:,.0f}" if quote.price_krw else ""
+                msg3.append(self._quote_line(name, quote, f"${quote.price:,.2f} {krw}"))
 
         messages.append("\n".join(msg3))
 
@@ -170,12 +183,9 @@ class TelegramNotifier:
         msg4 = []
         msg4.append("*💱 환율*")
         msg4.append("")
-        currencies = data.get("currencies", {})
-        for name, info in currencies.items():
-            if info.get("price"):
-                change_val = info.get('change', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                msg4.append(f"{emoji} {name}: {info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name, quote in iter_quotes(data.get("currencies")):
+            if quote.price:
+                msg4.append(self._quote_line(name, quote, f"{quote.price:,.2f}"))
 
         msg4.append("")
         msg4.append("─" * 20)
@@ -184,23 +194,18 @@ class TelegramNotifier:
         # 원자재
         msg4.append("*🛢️ 원자재*")
         msg4.append("")
-        commodities = data.get("commodities", {})
-        for name, info in commodities.items():
-            if info.get("price"):
-                change_val = info.get('change', 0) or 0
-                emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                msg4.append(f"{emoji} {name}: ${info['price']:,.2f} ({self._format_change(info.get('change'))})")
+        for name, quote in iter_quotes(data.get("commodities")):
+            if quote.price:
+                msg4.append(self._quote_line(name, quote, f"${quote.price:,.2f}"))
 
         # 농산물
         agriculture = data.get("agriculture", {})
         if agriculture:
             msg4.append("")
             msg4.append("_농산물_")
-            for name, info in agriculture.items():
-                if info.get("price"):
-                    change_val = info.get('change', 0) or 0
-                    emoji = "🔺" if change_val > 0 else "🔻" if change_val < 0 else "▪️"
-                    msg4.append(f"{emoji} {name}: ${info['price']:,.2f} ({self._format_change(info.get('change'))})")
+            for name, quote in iter_quotes(agriculture):
+                if quote.price:
+                    msg4.append(self._quote_line(name, quote, f"${quote.price:,.2f}"))
 
         messages.append("\n".join(msg4))
 
@@ -271,12 +276,14 @@ class TelegramNotifier:
         try:
             with LogContext("텔레그램 메시지 발송"):
                 for i, msg in enumerate(messages):
-                    await self.bot.send_message(
-                        chat_id=self.chat_id,
-                        text=msg,
-                        parse_mode='Markdown',
-                        disable_web_page_preview=True
-                    )
+                    with metrics.track_request("telegram"):
+                        await self.bot.send_message(
+                            chat_id=self.chat_id,
+                            text=msg,
+                            parse_mode='Markdown',
+                            disable_web_page_preview=True
+                        )
+                    metrics.inc("telegram_messages_total", status="ok")
                     logger.info(f"메시지 {i + 1}/{len(messages)} 발송 완료")
                     # 메시지 사이 약간의 딜레이
                     if i < len(messages) - 1:
@@ -284,11 +291,12 @@ class TelegramNotifier:
             return True
         except Exception as e:
             logger.error(f"텔레그램 발송 오류: {e}")
+            metrics.inc("telegram_messages_total", status="error")
             return False
 
     def send_sync(self, data: dict, post_url: str) -> bool:
         """동기 방식 발송 (GitHub Actions용)"""
-        if not config.validate_telegram():
+        if "telegram" not in config.capabilities:
             logger.warning("텔레그램 설정이 없어 알림을 건너뜁니다")
             return False
         return asyncio.run(self.send_full_briefing(data, post_url))
@@ -0,0 +1,172 @@
+"""심볼 유니버스 모듈
+
+universe.yml을 검증해 불변 조회 테이블로 컴파일한다.
+파일 mtime 기준으로 캐시하므로 반복 호출 비용이 없다.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import yaml
+
+from metrics import metrics
+
+DEFAULT_UNIVERSE_PATH = Path(__file__).parent / "universe.yml"
+
+
+class UniverseError(ValueError):
+    """유니버스 파일 형식 오류"""
+    pass
+
+
+@dataclass(frozen=True)
+class Universe:
+    """컴파일된 심볼 유니버스 (불변)
+
+    Attributes:
+        categories: 카테고리 렌더링 순서
+        symbols: 카테고리 → {이름: 심볼}
+        symbol_map: 심볼 → (카테고리, 이름)
+        category_symbols: 카테고리 → 심볼 튜플
+        all_symbols: 전체 yfinance 심볼 (렌더링 순서)
+        config_keys: 카테고리 → Config 속성 이름
+        crypto: CoinGecko ID → 표시 심볼
+        display_groups: 카테고리 → {그룹 이름: 이름 튜플}
+    """
+
+    categories: Tuple[str, ...]
+    symbols: Mapping[str, Mapping[str, str]]
+    symbol_map: Mapping[str, Tuple[str, str]]
+    category_symbols: Mapping[str, Tuple[str, ...]]
+    all_symbols: Tuple[str, ...]
+    config_keys: Mapping[str, str]
+    crypto: Mapping[str, str]
+    display_groups: Mapping[str, Mapping[str, Tuple[str, ...]]]
+
+    def group(self, category: str, group_name: str) -> Tuple[str, ...]:
+        """표시 그룹에 속한 이름 목록 (없으면 빈 튜플)"""
+        return self.display_groups.get(category, {}).get(group_name, ())
+
+
+def compile_universe(raw: Dict) -> Universe:
+    """YAML 원본을 검증하고 조회 테이블로 컴파일
+
+    Args:
+        raw: yaml.safe_load 결과
+
+    Returns:
+        Universe 인스턴스
+
+    Raises:
+        UniverseError: 형식 오류, 중복 심볼, 알 수 없는 그룹 멤버
+    """
+    if not isinstance(raw, dict):
+        raise UniverseError("유니버스 파일 최상위는 매핑이어야 합니다")
+
+    raw_categories = raw.get("categories")
+    if not isinstance(raw_categories, dict) or not raw_categories:
+        raise UniverseError("'categories' 항목이 비어 있거나 매핑이 아닙니다")
+
+    symbols = {}
+    symbol_map = {}
+    category_symbols = {}
+    config_keys = {}
+    all_symbols = []
+
+    for category, spec in raw_categories.items():
+        if not isinstance(spec, dict) or not isinstance(spec.get("symbols"), dict):
+            raise UniverseError(f"카테고리 '{category}'에 symbols 매핑이 없습니다")
+
+        tickers = {}
+        for name, symbol in spec["symbols"].items():
+            if not isinstance(symbol, str) or not symbol.strip():
+                raise UniverseError(f"'{category}.{name}'의 심볼이 문자열이 아닙니다: {symbol!r}")
+            if symbol in symbol_map:
+                other_category, other_name = symbol_map[symbol]
+                raise UniverseError(
+                    f"심볼 중복: {symbol} ({other_category}.{other_name}, {category}.{name})"
+                )
+            name = str(name)
+            tickers[name] = symbol
+            symbol_map[symbol] = (category, name)
+            all_symbols.append(symbol)
+
+        symbols[category] = MappingProxyType(tickers)
+        category_symbols[category] = tuple(tickers.values())
+        if spec.get("config_key"):
+            config_keys[category] = str(spec["config_key"])
+
+    raw_crypto = raw.get("crypto") or {}
+    if not isinstance(raw_crypto, dict):
+        raise UniverseError("'crypto' 항목은 매핑이어야 합니다")
+    crypto = {str(coin_id): str(ticker) for coin_id, ticker in raw_crypto.items()}
+
+    display_groups = {}
+    for category, groups in (raw.get("display_groups") or {}).items():
+        if category not in symbols:
+            raise UniverseError(f"display_groups의 알 수 없는 카테고리: {category}")
+        compiled = {}
+        for group_name, members in groups.items():
+            members = tuple(str(m) for m in members)
+            unknown = [m for m in members if m not in symbols[category]]
+            if unknown:
+                raise UniverseError(f"'{category}.{group_name}' 그룹의 알 수 없는 이름: {unknown}")
+            compiled[str(group_name)] = members
+        display_groups[category] = MappingProxyType(compiled)
+
+    return Universe(
+        categories=tuple(symbols),
+        symbols=MappingProxyType(symbols),
+        symbol_map=MappingProxyType(symbol_map),
+        category_symbols=MappingProxyType(category_symbols),
+        all_symbols=tuple(all_symbols),
+        config_keys=MappingProxyType(config_keys),
+        crypto=MappingProxyType(crypto),
+        display_groups=MappingProxyType(display_groups),
+    )
+
+
+# 경로 → (mtime_ns, Universe)
+_cache: Dict[str, Tuple[int, Universe]] = {}
+_cache_lock = threading.Lock()
+
+
+def resolve_universe_path(path: Optional[str] = None) -> Path:
+    """유니버스 파일 경로 결정 (인자 > UNIVERSE_FILE 환경변수 > 기본값)"""
+    return Path(path or os.getenv("UNIVERSE_FILE") or DEFAULT_UNIVERSE_PATH).resolve()
+
+
+def load_universe(path: Optional[str] = None) -> Universe:
+    """유니버스 로드 (파일 mtime이 바뀌지 않았으면 캐시 반환)
+
+    Args:
+        path: 유니버스 YAML 경로 (없으면 UNIVERSE_FILE 또는 scripts/universe.yml)
+
+    Returns:
+        Universe 인스턴스
+    """
+    resolved = resolve_universe_path(path)
+    try:
+        mtime = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise UniverseError(f"유니버스 파일을 찾을 수 없습니다: {resolved}")
+
+    key = str(resolved)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == mtime:
+            metrics.inc("cache_requests_total", cache="universe", result="hit")
+            return cached[1]
+
+        metrics.inc("cache_requests_total", cache="universe", result="miss")
+        try:
+            raw = yaml.safe_load(resolved.read_text(encoding="utf-8"))
+        except yaml.YAMLError as e:
+            raise UniverseError(f"유니버스 YAML 파싱 실패 ({resolved}): {e}")
+
+        universe = compile_universe(raw)
+        _cache[key] = (mtime, universe)
+        return universe
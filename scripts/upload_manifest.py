@@ -0,0 +1,126 @@
+"""보고서 업로드 매니페스트
+
+원본 파일의 내용 해시 → 생성된 포스트 매핑을 저장해,
+같은 원본을 다시 올릴 때 변경 없는 파일은 건너뛰고
+바뀐 파일은 기존 포스트를 제자리에서 갱신하도록 한다.
+
+매니페스트는 저장소에 커밋되므로 원본은 노트 루트(REPORT_SOURCE_ROOT, 기본 홈 디렉토리)
+기준 상대경로로 기록한다. 작성자 PC의 절대경로가 남지 않고, 다른 체크아웃/머신에서도
+같은 노트 구조면 그대로 맞는다. 루트 밖 원본은 이름이 같은 파일끼리 겹치지 않도록
+external/<절대경로 해시 12자리>/<파일 이름>으로 기록한다.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import config
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_MANIFEST_PATH = Path(__file__).parent / "data" / "report_manifest.json"
+
+# 2: 원본 키를 절대경로에서 노트 루트 기준 상대경로로 변경 (1은 로드할 때 변환)
+MANIFEST_VERSION = 2
+
+
+def content_hash(data: bytes) -> str:
+    """원본 내용 해시 (sha256)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class UploadManifest:
+    """원본 경로/내용 해시 → 포스트 매핑
+
+    entries 형식:
+        {원본 키: {"hash": sha256, "post": 포스트 경로, "date": 최초 발행 시각}}
+    원본 키는 노트 루트 기준 상대경로(루트 밖이면 external/<경로 해시>/<파일 이름>),
+    포스트 경로는 저장소 내부면 저장소 기준 상대경로로 기록한다.
+    """
+
+    def __init__(self, path: Path = DEFAULT_MANIFEST_PATH, source_root: Optional[Path] = None):
+        self.path = Path(path)
+        self.source_root = Path(source_root or config.REPORT_SOURCE_ROOT or Path.home()).expanduser().resolve()
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._by_hash: Dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        raw = json.loads(self.path.read_text(encoding="utf-8"))
+        self.entries = raw.get("sources", {})
+        if raw.get("version", 1) < MANIFEST_VERSION:
+            # 절대경로 키 → 루트 기준 키 (다음 save()에서 새 형식으로 저장)
+            self.entries = {self.source_key(Path(source)): entry for source, entry in self.entries.items()}
+            self._dirty = True
+        self._by_hash = {entry["hash"]: source for source, entry in self.entries.items()}
+
+    def source_key(self, source: Path) -> str:
+        """원본 키 (노트 루트 기준 상대경로, 루트 밖이면 external/<경로 해시>/<파일 이름>)"""
+        source = Path(source).resolve()
+        try:
+            return source.relative_to(self.source_root).as_posix()
+        except ValueError:
+            digest = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+            return f"external/{digest}/{source.name}"
+
+    @staticmethod
+    def _post_key(post: Path) -> str:
+        post = Path(post).resolve()
+        try:
+            return post.relative_to(BASE_DIR.resolve()).as_posix()
+        except ValueError:
+            return str(post)
+
+    @staticmethod
+    def post_path(entry: Dict[str, str]) -> Path:
+        """매니페스트 항목의 포스트 절대경로"""
+        post = Path(entry["post"])
+        return post if post.is_absolute() else BASE_DIR / post
+
+    def get(self, source: Path) -> Optional[Dict[str, str]]:
+        """원본 경로로 항목 조회"""
+        return self.entries.get(self.source_key(source))
+
+    def find_by_hash(self, digest: str) -> Optional[Dict[str, str]]:
+        """내용 해시로 항목 조회 (파일 이동/이름 변경 감지)"""
+        source = self._by_hash.get(digest)
+        return self.entries.get(source) if source else None
+
+    def record(self, source: Path, digest: str, post: Path, date: str) -> None:
+        """항목 기록/갱신"""
+        key = self.source_key(source)
+        entry = {"hash": digest, "post": self._post_key(post), "date": date}
+        with self._lock:
+            old = self.entries.get(key)
+            if old == entry:
+                return
+            if old and self._by_hash.get(old["hash"]) == key:
+                del self._by_hash[old["hash"]]
+            self.entries[key] = entry
+            self._by_hash[digest] = key
+            self._dirty = True
+
+    def save(self) -> bool:
+        """변경이 있을 때만 원자적으로 저장
+
+        Returns:
+            실제로 저장했는지 여부
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "version": MANIFEST_VERSION,
+                "sources": dict(sorted(self.entries.items())),
+            }
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            return True
@@ -0,0 +1,134 @@
+"""anomaly.py 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from anomaly import MIN_COUNT, ReturnStats, detect_anomalies, percentile
+from market_snapshot import MarketSnapshot
+from price_history import PriceHistory
+
+
+def _history(days: int = 60) -> PriceHistory:
+    """변동률이 ±1% 번갈아 나오는 A, 값이 부족한 B"""
+    index = pd.date_range(end="2026-01-28", periods=days, freq="D", name="date")
+    a = 100 * np.cumprod(np.where(np.arange(days) % 2, 1.01, 0.99))
+    b = np.full(days, np.nan)
+    b[-2:] = [10.0, 11.0]
+    return PriceHistory(pd.DataFrame({"us_indices/A": a, "us_indices/B": b}, index=index))
+
+
+def _snapshot(prices, changes) -> MarketSnapshot:
+    return MarketSnapshot(["A", "B"], ["A", "B"], ["us_indices"] * 2, prices, changes)
+
+
+class TestReturnStats:
+    """Welford 누적 통계 테스트"""
+
+    def test_incremental_matches_full(self):
+        """하루씩 반영한 평균/분산이 전체를 한 번에 계산한 값과 같음"""
+        rng = np.random.default_rng(0)
+        changes = rng.normal(0.1, 1.5, (100, 3))
+        stats = ReturnStats()
+        for day, row in enumerate(changes):
+            stats.observe(["a", "b", "c"], np.full(3, 100.0 + day), row)
+
+        assert stats.count.tolist() == [100, 100, 100]
+        assert np.allclose(stats.mean, changes.mean(axis=0))
+        assert np.allclose(stats.m2 / 99, changes.var(axis=0, ddof=1))
+
+    def test_same_quote_is_not_new_bar(self):
+        """가격과 변동률이 그대로면(주말 등) 통계 갱신도 z도 없음, 반올림된 가격만 같으면 새 봉"""
+        stats = ReturnStats()
+        stats.observe(["a"], [1.09], [0.12])
+        z, new = stats.observe(["a"], [1.09], [0.12])
+        assert not new[0] and np.isnan(z[0]) and stats.count[0] == 1
+        _, new = stats.observe(["a"], [1.09], [-0.2])
+        assert new[0] and stats.count[0] == 2
+
+    def test_seed_keeps_last_bar_for_today(self, tmp_path):
+        """히스토리로 초기화할 때 마지막 값은 오늘 관측으로 남김, 저장/로드 왕복"""
+        history = _history()
+        stats = ReturnStats(path=tmp_path / "stats.json")
+        assert stats.seed(history, ["us_indices/A", "us_indices/B", "us_indices/없음"]) == 2
+
+        a = stats.index["us_indices/A"]
+        assert stats.count[a] == 58
+        assert stats.last[a] == history.frame["us_indices/A"].iloc[-2]
+        assert stats.count[stats.index["us_indices/B"]] == 0
+        # 이미 있는 시리즈는 다시 초기화하지 않음
+        assert stats.seed(history, ["us_indices/A"]) == 0
+
+        stats.save()
+        loaded = ReturnStats.load(tmp_path / "stats.json")
+        assert loaded.keys == sorted(stats.keys)
+        assert loaded.count[loaded.index["us_indices/A"]] == 58
+        assert np.isnan(loaded.last[loaded.index["us_indices/B"]])
+
+    def test_seed_keeps_unchanged_days(self):
+        """같은 값이 이어진 날(보합)도 실제 봉으로 초기화"""
+        index = pd.date_range(end="2026-01-28", periods=5, freq="D", name="date")
+        history = PriceHistory(pd.DataFrame({"currencies/EUR/USD": [1.08, 1.09, 1.09, 1.1, 1.1]}, index=index))
+        stats = ReturnStats()
+        stats.seed(history, ["currencies/EUR/USD"])
+        row = stats.index["currencies/EUR/USD"]
+        assert stats.count[row] == 3 and stats.last[row] == 1.1
+
+    def test_old_version_rebuilt(self, tmp_path):
+        """저장 형식 버전이 다르면 버리고 히스토리로 다시 초기화"""
+        path = tmp_path / "stats.json"
+        path.write_text('{"version":1,"series":{"us_indices/A":[58,0.0,1.0,100.0]}}\n', encoding="utf-8")
+        stats = ReturnStats.load(path)
+        assert len(stats) == 0
+        assert stats.seed(_history(), ["us_indices/A"]) == 1
+        assert stats.count[stats.index["us_indices/A"]] == 58
+
+
+class TestDetectAnomalies:
+    """이상 변동 탐지 테스트"""
+
+    def test_flags_unusual_move(self):
+        """±1% 분포에서 +5%는 이상, 관측치가 부족한 시리즈는 제외"""
+        history = _history()
+        stats = ReturnStats()
+        stats.seed(history, ["us_indices/A", "us_indices/B"])
+        price = history.frame["us_indices/A"].iloc[-1]
+
+        anomalies = detect_anomalies(_snapshot([price, 11.0], [5.0, 10.0]), stats, threshold=2.0)
+        assert [a["name"] for a in anomalies] == ["A"]
+        assert anomalies[0]["z"] > 2 and anomalies[0]["percentile"] > 97.7
+        assert stats.count[stats.index["us_indices/A"]] == 59
+
+        # 같은 날 다시 돌려도 새 봉이 아니므로 플래그 없음
+        assert detect_anomalies(_snapshot([price, 11.0], [5.0, 10.0]), stats) == []
+
+    def test_min_count(self):
+        stats = ReturnStats()
+        for day in range(MIN_COUNT - 1):
+            stats.observe(["a"], [100.0 + day], [(-1) ** day * 1.0])
+        z, new = stats.observe(["a"], [1.0], [50.0])
+        assert new[0] and np.isnan(z[0])
+
+    def test_percentile(self):
+        assert percentile(0) == pytest.approx(50.0)
+        assert percentile(1.96) == pytest.approx(97.5, abs=0.01)
+
+
+class TestAnomalyOutput:
+    """요약/텔레그램 출력 테스트"""
+
+    ANOMALIES = [{"category": "mag7", "name": "엔비디아", "change": 8.2, "z": 3.1, "percentile": 99.9},
+                 {"category": "commodities", "name": "금", "change": -4.0, "z": -2.5, "percentile": 0.62}]
+
+    def test_summary(self, sample_market_data):
+        from main import generate_simple_summary
+
+        summary = generate_simple_summary(dict(sample_market_data, anomalies=self.ANOMALIES))
+        assert "이례적 변동: 엔비디아 +8.20%(+3.1σ), 금 -4.00%(-2.5σ)." in summary
+
+    def test_telegram(self, sample_market_data):
+        from telegram_notifier import TelegramNotifier
+
+        messages = TelegramNotifier()._build_full_briefing(dict(sample_market_data, anomalies=self.ANOMALIES),
+                                                           "https://example.com/post")
+        assert "• 엔비디아: +8.20% (+3.1σ, 상위 0.10%)" in messages[0]
+        assert "• 금: -4.00% (-2.5σ, 하위 0.62%)" in messages[0]
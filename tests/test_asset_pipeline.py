@@ -0,0 +1,81 @@
+"""asset_pipeline.py 테스트"""
+import io
+
+import pytest
+from pathlib import Path
+from asset_pipeline import AssetPipeline
+
+
+def _write_bytes(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return AssetPipeline(assets_dir=tmp_path / "assets")
+
+
+class TestRewrite:
+    """링크 교체 테스트"""
+
+    def test_local_image_rewritten(self, tmp_path, pipeline):
+        """로컬 이미지는 해시 이름으로 게시되고 링크가 바뀜"""
+        _write_bytes(tmp_path / "src" / "img" / "chart.svg", b"<svg/>")
+        content = '![차트](img/chart.svg "제목")\n'
+
+        result = pipeline.rewrite(content, tmp_path / "src")
+
+        published = list((tmp_path / "assets").iterdir())
+        assert len(published) == 1
+        assert published[0].read_bytes() == b"<svg/>"
+        assert result == f"![차트]({{{{ '/assets/images/{published[0].name}' | relative_url }}}} \"제목\")\n"
+
+    def test_duplicate_images_deduped(self, tmp_path, pipeline):
+        """같은 내용의 이미지는 한 번만 저장"""
+        _write_bytes(tmp_path / "src" / "a.gif", b"GIF89a-same")
+        _write_bytes(tmp_path / "src" / "b.gif", b"GIF89a-same")
+
+        result = pipeline.rewrite("![a](a.gif) <img src=\"b.gif\">", tmp_path / "src")
+
+        published = list((tmp_path / "assets").iterdir())
+        assert len(published) == 1
+        assert result.count(published[0].name) == 2
+
+    def test_remote_and_missing_untouched(self, tmp_path, pipeline):
+        """원격 URL, 없는 파일은 그대로 둠"""
+        content = "![r](https://example.com/x.png) ![m](missing.png)"
+        assert pipeline.rewrite(content, tmp_path) == content
+        assert not (tmp_path / "assets").exists()
+
+    def test_local_images_listed(self, tmp_path, pipeline):
+        """참조 순서대로 중복 없이 수집"""
+        a = _write_bytes(tmp_path / "a.svg", b"<svg/>")
+        content = "![](a.svg) ![](<a.svg>) ![](http://x/y.png)"
+        assert pipeline.local_images(content, tmp_path) == [a.resolve()]
+
+
+class TestOptimize:
+    """축소/재압축 테스트"""
+
+    def test_oversized_image_downscaled(self, tmp_path):
+        """긴 변이 기준보다 크면 축소"""
+        Image = pytest.importorskip("PIL.Image")
+        buf = io.BytesIO()
+        Image.new("RGB", (800, 400), (200, 30, 30)).save(buf, format="PNG")
+        src = _write_bytes(tmp_path / "big.png", buf.getvalue())
+
+        pipeline = AssetPipeline(assets_dir=tmp_path / "assets", max_dimension=200)
+        name = pipeline.publish(src)
+
+        assert name.endswith(".jpg")
+        with Image.open(tmp_path / "assets" / name) as img:
+            assert img.size == (200, 100)
+
+    def test_small_image_kept(self, tmp_path, pipeline):
+        """작은 이미지는 원본 그대로"""
+        Image = pytest.importorskip("PIL.Image")
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, format="PNG")
+        assert pipeline.optimize(buf.getvalue(), ".png") == (buf.getvalue(), ".png")
@@ -0,0 +1,51 @@
+"""benchmarks/ 테스트 (합성 데이터, 기준값 비교)"""
+import pytest
+
+from benchmarks.bench import CASES, compare, run_case
+from benchmarks.synthetic import make_batch_frame, make_market_data, make_symbols
+
+
+def _result(normalized: float, peak_kib: float) -> dict:
+    return {"results": {"batch": {"50": {"normalized": normalized, "peak_kib": peak_kib}}}}
+
+
+class TestSynthetic:
+    """합성 데이터 테스트"""
+
+    def test_scales_to_requested_size(self):
+        """요청한 심볼 수만큼 표 항목 생성, 같은 seed면 같은 데이터"""
+        data = make_market_data(500)
+        rows = sum(len(v) for k, v in data.items() if k not in ("economic_indicators", "fear_greed", "economic_calendar")
+                   and isinstance(v, dict))
+        assert rows == 500
+        assert data == make_market_data(500)
+        assert "S&P 500" in data["us_indices"]
+
+    def test_batch_frame_shape(self):
+        """yf.download(group_by='ticker') 형태"""
+        symbols = list(make_symbols(60))
+        frame = make_batch_frame(symbols, days=5)
+        assert frame.shape == (5, len(symbols) * 5)
+        assert frame[symbols[0]]["Close"].notna().all()
+
+
+class TestBench:
+    """측정/비교 테스트"""
+
+    @pytest.mark.parametrize("name", list(CASES))
+    def test_cases_run(self, name):
+        """모든 케이스가 작은 크기에서 실행됨"""
+        result = run_case(name, 50, calibration=1.0, budget=0.0)
+        assert result["seconds"] > 0
+        assert result["peak_kib"] > 0
+
+    def test_compare_flags_regressions(self):
+        """허용 범위를 넘는 시간/메모리 증가만 회귀"""
+        baseline = _result(1.0, 1000.0)
+        assert compare(_result(1.9, 1100.0), baseline) == []
+        assert len(compare(_result(2.5, 1000.0), baseline)) == 1
+        assert len(compare(_result(1.0, 2000.0), baseline)) == 1
+        # 잡음 수준의 작은 메모리 차이는 무시
+        assert compare(_result(1.0, 30.0), _result(1.0, 10.0)) == []
+        # 기준값에 없는 크기는 비교하지 않음
+        assert compare({"results": {"batch": {"10000": {"normalized": 9.0, "peak_kib": 9.0}}}}, baseline) == []
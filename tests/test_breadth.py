@@ -0,0 +1,121 @@
+"""breadth.py 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from breadth import BreadthError, BreadthIndex, compute_index_breadth, compute_market_breadth, load_breadth_indices
+from market_snapshot import select_top
+from post_generator import PostGenerator
+
+INDEX = BreadthIndex("test", "테스트 지수", ("A", "B", "C", "D", "E"), ("에이", "비", "씨", "디", "이"))
+
+
+class TestLoadIndices:
+    """구성 종목 파일 로드 테스트"""
+
+    def test_list_and_mapping(self, tmp_path):
+        """티커 목록 또는 {이름: 티커}, 이름 없으면 키"""
+        path = tmp_path / "breadth.yaml"
+        path.write_text(
+            "indices:\n"
+            "  sp500:\n    name: S&P 500\n    symbols: [AAPL, MSFT]\n"
+            "  kospi200:\n    symbols:\n      삼성전자: 005930.KS\n",
+            encoding="utf-8",
+        )
+        sp500, kospi = load_breadth_indices(str(path))
+        assert (sp500.name, sp500.symbols, sp500.names) == ("S&P 500", ("AAPL", "MSFT"), ("AAPL", "MSFT"))
+        assert (kospi.name, kospi.symbols, kospi.names) == ("kospi200", ("005930.KS",), ("삼성전자",))
+
+    @pytest.mark.parametrize("text", ["", "indices: []\n", "indices:\n  x:\n    name: X\n",
+                                      "indices:\n  x:\n    symbols: {a: 1}\n", "indices: [\n"])
+    def test_invalid(self, tmp_path, text):
+        """형식 오류는 BreadthError"""
+        path = tmp_path / "breadth.yaml"
+        path.write_text(text, encoding="utf-8")
+        with pytest.raises(BreadthError):
+            load_breadth_indices(str(path))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(BreadthError):
+            load_breadth_indices(str(tmp_path / "없음.yaml"))
+
+
+class TestComputeBreadth:
+    """시장 폭 계산 테스트"""
+
+    def test_counts_and_movers(self):
+        """상승/하락/보합, 기간 신고가/신저가, 상승/하락 상위 (변동 방향이 맞는 종목만)"""
+        values = np.array([
+            [10.0, 20.0, 5.0, 8.0, np.nan],
+            [11.0, 19.0, 5.0, 9.0, np.nan],
+            [12.0, 18.0, 5.0, 9.5, 7.0],
+        ])
+        result = compute_index_breadth(values, INDEX, top_n=5)
+
+        assert (result["count"], result["advancers"], result["decliners"], result["unchanged"]) == (5, 2, 1, 1)
+        # C는 전 기간 같은 값이라 신고가이자 신저가, E는 관측치 하나라 제외
+        assert (result["new_highs"], result["new_lows"]) == (3, 2)
+        assert [m["symbol"] for m in result["gainers"]] == ["A", "D"]
+        assert result["gainers"][0] == {"name": "에이", "symbol": "A", "price": 12.0,
+                                        "change": round((12.0 - 11.0) / 11.0 * 100, 2)}
+        assert [m["symbol"] for m in result["losers"]] == ["B"]
+        assert result["losers"][0]["change"] == round((18.0 - 19.0) / 19.0 * 100, 2)
+
+    def test_market_breadth_skips_empty_index(self):
+        """프레임에 없는 종목은 NaN, 가격이 하나도 없는 지수는 제외"""
+        closes = pd.DataFrame({"A": [1.0, 2.0], "B": [2.0, 1.0]})
+        empty = BreadthIndex("none", "없음", ("X",), ("X",))
+        result = compute_market_breadth(closes, [INDEX, empty], top_n=1)
+
+        assert [index["key"] for index in result["indices"]] == ["test"]
+        index = result["indices"][0]
+        assert (index["count"], index["advancers"], index["decliners"]) == (2, 1, 1)
+        assert [m["symbol"] for m in index["gainers"]] == ["A"]
+
+    def test_select_top_matches_sort(self):
+        """argpartition 결과가 전체 안정 정렬의 앞 n개와 같음 (동률, NaN 포함)"""
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            values = rng.integers(-5, 5, 40).astype(float)
+            values[rng.random(40) < 0.2] = np.nan
+            n = int(rng.integers(0, 45))
+            valid = np.flatnonzero(~np.isnan(values))
+            for largest in (True, False):
+                keys = -values[valid] if largest else values[valid]
+                expected = valid[np.argsort(keys, kind="stable")][:n]
+                assert select_top(values, n, largest).tolist() == expected.tolist()
+
+
+class TestBreadthRendering:
+    """시장 폭 포스트/텔레그램 렌더링 테스트"""
+
+    BREADTH = {"period": "1y", "indices": [{
+        "key": "sp500", "name": "S&P 500", "count": 503, "advancers": 320, "decliners": 170, "unchanged": 13,
+        "new_highs": 12, "new_lows": 3,
+        "gainers": [{"name": "NVDA", "symbol": "NVDA", "price": 900.0, "change": 5.2}],
+        "losers": [{"name": "INTC", "symbol": "INTC", "price": 30.0, "change": -4.1}],
+    }]}
+
+    def test_post_section(self, sample_market_data):
+        """데이터가 있으면 섹터 표 뒤에 시장 폭 섹션, 없으면 출력 그대로"""
+        generator = PostGenerator()
+        now = pd.Timestamp("2026-01-29 06:00").to_pydatetime()
+        without = generator._build_post_content(sample_market_data, "요약", now)
+        with_breadth = generator._build_post_content(dict(sample_market_data, breadth=self.BREADTH), "요약", now)
+
+        section = generator._format_market_breadth(self.BREADTH)
+        assert with_breadth.replace(section, "", 1) == without
+        assert with_breadth.index("섹터 ETF") < with_breadth.index("시장 폭") < with_breadth.index("글로벌 증시")
+        assert "| S&P 500 | 503 | 320 | 170 | 13 | 12 | 3 |" in section
+        assert '**S&P 500 상승 상위**: NVDA <span class="chg-up">+5.20%</span>' in section
+        assert generator._format_market_breadth({}) == ""
+
+    def test_telegram_block(self, sample_market_data):
+        """텔레그램 메시지 2에 지수별 시장 폭"""
+        from telegram_notifier import TelegramNotifier
+
+        messages = TelegramNotifier()._build_full_briefing(dict(sample_market_data, breadth=self.BREADTH),
+                                                           "https://example.com/post")
+        assert "시장 폭 - S&P 500" in messages[1]
+        assert "상승 상위: NVDA +5.20%" in messages[1]
+        assert "하락 상위: INTC -4.10%" in messages[1]
@@ -0,0 +1,119 @@
+"""calendar_engine.py 테스트"""
+from datetime import date
+
+import pytest
+
+from calendar_engine import (
+    CalendarEngine, ExplicitDates, MonthlyBusinessDay, MonthlyNthWeekday, MonthlyRule, Rule, Weekly,
+    FRI, THU, WED, build_engine, nth_business_day, nth_weekday,
+)
+from economic_calendar import EconomicCalendarFetcher
+
+
+class TestRules:
+    """반복 규칙 테스트"""
+
+    def test_first_friday(self):
+        """첫째 금요일 (NFP)"""
+        assert nth_weekday(2026, 1, FRI, 1) == date(2026, 1, 2)
+        assert nth_weekday(2026, 5, FRI, 1) == date(2026, 5, 1)
+
+    def test_last_thursday(self):
+        """마지막 목요일"""
+        assert nth_weekday(2026, 1, THU, -1) == date(2026, 1, 29)
+
+    def test_fifth_weekday_missing(self):
+        """다섯째 요일이 없는 달은 None"""
+        assert nth_weekday(2026, 2, WED, 5) is None
+
+    def test_nth_business_day_skips_weekend(self):
+        """영업일 계산 시 주말 제외"""
+        # 2026-08-01은 토요일
+        assert nth_business_day(2026, 8, 1) == date(2026, 8, 3)
+
+    def test_weekly_rule(self):
+        """매주 목요일 전개"""
+        rule = Weekly("청구", THU)
+        dates = [e.date for e in rule.expand(date(2026, 1, 1), date(2026, 1, 31))]
+        assert dates == [date(2026, 1, d) for d in (1, 8, 15, 22, 29)]
+
+    def test_incomplete_rule_rejected(self):
+        """날짜 계산을 구현하지 않은 규칙은 조회 시점이 아니라 생성 시점에 실패"""
+        class NoDates(Rule):
+            pass
+
+        class NoMonthDate(MonthlyRule):
+            pass
+
+        with pytest.raises(TypeError):
+            NoDates("이벤트")
+        with pytest.raises(TypeError):
+            NoMonthDate("이벤트")
+
+    def test_explicit_table_overrides_rule(self):
+        """명시 테이블이 있는 달은 규칙 기반 예상일 생략"""
+        table = ExplicitDates("CPI", ["2026-01-13"])
+        rule = MonthlyNthWeekday("CPI", WED, 2, skip_months=table.covered_months)
+        engine = CalendarEngine([table, rule], date(2026, 1, 1), date(2026, 2, 28))
+        assert [e.date for e in engine.between(date(2026, 1, 1), date(2026, 2, 28))] == [
+            date(2026, 1, 13), date(2026, 2, 11)
+        ]
+
+
+class TestCalendarEngine:
+    """CalendarEngine 조회 테스트"""
+
+    def test_index_sorted(self):
+        """전개 결과가 날짜순"""
+        engine = build_engine(2025, 2026)
+        events = engine.between(date(2025, 1, 1), date(2026, 12, 31))
+        assert len(events) == len(engine)
+        assert events == sorted(events, key=lambda e: e.date)
+
+    def test_upcoming_by_kind(self):
+        """kind 필터 + 기간 조회"""
+        engine = build_engine(2025, 2026)
+        fomc = engine.upcoming(date(2026, 1, 20), 30, kind="fomc")
+        assert [e.date for e in fomc] == [date(2026, 1, 28)]
+
+    def test_range_inclusive(self):
+        """기간 양끝 포함"""
+        engine = CalendarEngine([MonthlyBusinessDay("ISM", 1)], date(2026, 1, 1), date(2026, 12, 31))
+        assert len(engine.between(date(2026, 1, 1), date(2026, 1, 1))) == 1
+
+    def test_engine_cached(self):
+        """같은 연도 범위는 캐시된 엔진 재사용"""
+        assert build_engine(2025, 2027) is build_engine(2025, 2027)
+
+
+class TestEconomicCalendarFetcher:
+    """EconomicCalendarFetcher 통합 테스트"""
+
+    def test_fed_events_format(self, monkeypatch):
+        """FOMC 이벤트 형식 (D-day 표시)"""
+        fetcher = EconomicCalendarFetcher()
+        monkeypatch.setattr(fetcher, "_today", lambda: date(2026, 1, 26))
+        events = fetcher.get_upcoming_fed_events()
+        assert events[0]["date"] == "2026-01-28"
+        assert events[0]["display"] == "D-2"
+        assert events[0]["importance"] == "high"
+
+    def test_weekly_schedule_next_thursday(self, monkeypatch):
+        """다음 목요일 실업수당 청구"""
+        fetcher = EconomicCalendarFetcher()
+        monkeypatch.setattr(fetcher, "_today", lambda: date(2026, 1, 26))
+        weekly = fetcher.get_weekly_indicators_schedule()
+        assert weekly == [{
+            "date": "2026-01-29",
+            "event": "신규 실업수당 청구건수",
+            "importance": "medium",
+            "frequency": "매주 목요일",
+        }]
+
+    def test_this_week_nfp(self, monkeypatch):
+        """이번 주 고용보고서 포함"""
+        fetcher = EconomicCalendarFetcher()
+        monkeypatch.setattr(fetcher, "_today", lambda: date(2026, 1, 30))
+        week = fetcher.get_this_week_highlights()
+        events = {e["event"]: e["date"] for e in week["economic"]}
+        assert events["비농업 고용 (NFP)"] == "2026-02-06"
@@ -0,0 +1,108 @@
+"""calendar_store.py 테스트"""
+import os
+import pytest
+from datetime import date
+from calendar_engine import build_engine
+from calendar_store import CalendarDataError, CalendarStore, load_calendar_data, parse_calendar_file
+from economic_calendar import EconomicCalendarFetcher
+
+
+@pytest.fixture
+def store_paths(tmp_path):
+    """임시 캘린더 소스 (기본 파일 + drop-in 디렉토리)"""
+    base = tmp_path / "calendar.csv"
+    base.write_text(
+        "# 주석\n"
+        "2026-01-28,fomc,FOMC 금리결정,high\n"
+        "2026-03-18,fomc,FOMC 금리결정,high\n",
+        encoding="utf-8",
+    )
+    dropin = tmp_path / "calendar.d"
+    dropin.mkdir()
+    return base, dropin, tmp_path / ".calendar.cache"
+
+
+def _touch(path):
+    """mtime을 확실히 바꿈 (파일시스템 해상도 대비)"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestCalendarStore:
+    """CalendarStore 테스트"""
+
+    def test_load_base_file(self, store_paths):
+        """기본 파일 로드"""
+        base, dropin, cache = store_paths
+        data = CalendarStore(base, dropin, cache).load()
+        assert [r[0] for r in data.by_kind("fomc")] == [date(2026, 1, 28), date(2026, 3, 18)]
+        assert cache.exists()
+
+    def test_dropin_overrides_and_cancels(self, store_paths):
+        """drop-in 파일이 추가/취소 반영"""
+        base, dropin, cache = store_paths
+        (dropin / "2026.csv").write_text(
+            "2026-03-18,fomc,FOMC 금리결정,cancel\n"
+            "2026-01-30,earnings,애플 실적 발표,high\n",
+            encoding="utf-8",
+        )
+        data = CalendarStore(base, dropin, cache).load()
+        assert [r[0] for r in data.by_kind("fomc")] == [date(2026, 1, 28)]
+        assert data.by_kind("earnings")[0][2] == "애플 실적 발표"
+
+    def test_in_process_reuse(self, store_paths):
+        """소스가 그대로면 같은 객체 재사용"""
+        base, dropin, cache = store_paths
+        store = CalendarStore(base, dropin, cache)
+        assert store.load() is store.load()
+
+    def test_incremental_refresh(self, store_paths, monkeypatch):
+        """변경된 소스만 다시 파싱"""
+        import calendar_store
+        base, dropin, cache = store_paths
+        extra = dropin / "extra.csv"
+        extra.write_text("2026-02-11,economic,CPI (소비자물가지수),high\n", encoding="utf-8")
+        first = CalendarStore(base, dropin, cache).load()
+
+        parsed = []
+        original = calendar_store.parse_calendar_file
+        monkeypatch.setattr(calendar_store, "parse_calendar_file",
+                            lambda path: parsed.append(path.name) or original(path))
+
+        extra.write_text("2026-02-12,economic,CPI (소비자물가지수),high\n", encoding="utf-8")
+        _touch(extra)
+        data = CalendarStore(base, dropin, cache).load()
+
+        assert parsed == ["extra.csv"]
+        assert data.version != first.version
+        assert data.by_kind("economic")[0][0] == date(2026, 2, 12)
+
+    def test_invalid_row(self, tmp_path):
+        """형식 오류 검출"""
+        path = tmp_path / "bad.csv"
+        path.write_text("2026-13-01,fomc,FOMC,high\n", encoding="utf-8")
+        with pytest.raises(CalendarDataError):
+            parse_calendar_file(path)
+
+
+class TestCalendarDataIntegration:
+    """기본 데이터 파일 + 엔진 연동 테스트"""
+
+    def test_explicit_nfp_replaces_rule(self):
+        """명시 NFP 일정이 있으면 첫째 금요일 규칙 대신 사용"""
+        engine = build_engine(2025, 2025)
+        nfp = [e.date for e in engine.between(date(2025, 1, 1), date(2025, 1, 31))
+               if e.event == "비농업 고용 (NFP)"]
+        assert nfp == [date(2025, 1, 10)]
+
+    def test_earnings_highlights(self, monkeypatch):
+        """실적 발표 일정 조회"""
+        fetcher = EconomicCalendarFetcher()
+        monkeypatch.setattr(fetcher, "_today", lambda: date(2025, 10, 20))
+        events = [e["event"] for e in fetcher.get_earnings_highlights()]
+        assert "테슬라 실적 발표" in events
+        assert "엔비디아 실적 발표" not in events
+
+    def test_default_data_covers_fomc(self):
+        """기본 데이터에 FOMC 일정 포함"""
+        assert len(load_calendar_data().by_kind("fomc")) >= 16
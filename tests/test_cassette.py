@@ -0,0 +1,76 @@
+"""cassette.py 테스트 (스탠드인 서버 녹화 → 네트워크 없이 재생)"""
+import pandas as pd
+import pytest
+
+from benchmarks.standin import StandinServer
+from cassette import RECORD, REPLAY, Cassette, CassetteMiss, frame_from_json, frame_to_json, request_key
+from config import config
+
+
+class TestCassette:
+    """녹화/재생 테스트"""
+
+    def test_request_key_drops_secrets(self):
+        """쿼리는 정렬되고 API 키는 빠짐"""
+        key = request_key("get", "https://x.test/obs?b=2", {"api_key": "secret", "a": 1})
+        assert key == "GET https://x.test/obs?a=1&b=2"
+
+    def test_frame_roundtrip(self):
+        """MultiIndex 컬럼 + NaN 보존"""
+        frame = pd.DataFrame(
+            [[1.0, None], [2.0, 3.0]],
+            index=pd.to_datetime(["2026-01-27", "2026-01-28"]),
+            columns=pd.MultiIndex.from_tuples([("^GSPC", "Close"), ("^IXIC", "Close")]),
+        )
+        restored = frame_from_json(frame_to_json(frame))
+        pd.testing.assert_frame_equal(restored, frame, check_names=False, check_freq=False)
+
+    def test_record_then_replay_offline(self, tmp_path, monkeypatch):
+        """녹화한 수집 결과를 서버 없이 그대로 재생"""
+        from data_fetcher import DataFetcher
+
+        path = tmp_path / "cassette.json.gz"
+        with StandinServer() as server:
+            for name, value in server.env().items():
+                monkeypatch.setattr(config, name, value)
+            with Cassette(path, RECORD):
+                recorded = DataFetcher().fetch_all()
+
+        # 서버가 내려간 뒤에도 같은 결과
+        for _ in range(2):
+            with Cassette(path, REPLAY):
+                replayed = DataFetcher().fetch_all()
+            for key in ("crypto", "us_indices", "economic_indicators", "fear_greed"):
+                assert replayed[key] == recorded[key]
+        assert b"0" * 32 not in path.read_bytes()
+
+    def test_yfinance_frames_replayed(self, tmp_path, monkeypatch):
+        """yfinance 미설치 환경에서도 녹화된 프레임으로 배치 처리"""
+        from data_fetcher import DataFetcher
+
+        monkeypatch.setattr(config, "YAHOO_CHART_URL", "")
+        fetcher = DataFetcher()
+        symbols = " ".join(fetcher.universe.all_symbols)
+        frame = pd.DataFrame(
+            [[100.0 + i for i in range(len(fetcher.universe.all_symbols))],
+             [101.0 + i for i in range(len(fetcher.universe.all_symbols))]],
+            index=pd.to_datetime(["2026-01-27", "2026-01-28"]),
+            columns=pd.MultiIndex.from_tuples([(s, "Close") for s in fetcher.universe.all_symbols]),
+        )
+        cassette = Cassette(tmp_path / "c.json", RECORD)
+        cassette._record_frame("download", symbols, fetcher.HISTORY_PERIOD, frame)
+        cassette.save()
+
+        with Cassette(tmp_path / "c.json", REPLAY):
+            fetcher._fetch_all_yfinance()
+        assert fetcher.data["us_indices"]["S&P 500"]["price"] > 100
+
+    def test_miss_is_connection_error(self, tmp_path):
+        """녹화에 없는 요청은 ConnectionError"""
+        import requests
+
+        Cassette(tmp_path / "empty.json", RECORD).save()
+        with Cassette(tmp_path / "empty.json", REPLAY):
+            with pytest.raises(requests.ConnectionError) as excinfo:
+                requests.get("https://example.invalid/x", timeout=1)
+        assert isinstance(excinfo.value, CassetteMiss)
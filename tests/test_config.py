@@ -76,3 +76,42 @@ class TestConfig:
         """환율 설정 테스트"""
         assert len(config.CURRENCIES) == 4
         assert "USD/KRW" in config.CURRENCIES
+
+
+class TestValidationCache:
+    """검증 결과 캐시 / capability 테스트"""
+
+    def test_capabilities_is_frozen(self):
+        """capability 집합은 frozenset"""
+        cfg = Config()
+        assert isinstance(cfg.capabilities, frozenset)
+
+    def test_validation_memoized(self):
+        """키 값이 그대로면 재계산하지 않음"""
+        cfg = Config()
+        cfg.TELEGRAM_BOT_TOKEN = "123456789:ABCdefGHIjklMNOpqrsTUVwxyz"
+        cfg.TELEGRAM_CHAT_ID = "-1001234567890"
+        first = cfg.capabilities
+        assert cfg.capabilities is first
+
+    def test_cache_invalidated_on_key_change(self):
+        """키가 바뀌면 capability 재계산"""
+        cfg = Config()
+        cfg.TELEGRAM_BOT_TOKEN = ""
+        cfg.TELEGRAM_CHAT_ID = ""
+        assert "telegram" not in cfg.capabilities
+
+        cfg.TELEGRAM_BOT_TOKEN = "123456789:ABCdefGHIjklMNOpqrsTUVwxyz"
+        cfg.TELEGRAM_CHAT_ID = "-1001234567890"
+        assert "telegram" in cfg.capabilities
+        assert cfg.validate_telegram() is True
+
+    def test_refresh_from_env(self, monkeypatch):
+        """환경변수 변경 후 refresh_from_env로 반영"""
+        cfg = Config()
+        monkeypatch.setenv("FRED_API_KEY", "a" * 32)
+        assert cfg.validate_fred() == bool(cfg.FRED_API_KEY and len(cfg.FRED_API_KEY) >= 32)
+
+        cfg.refresh_from_env()
+        assert "fred" in cfg.capabilities
+        assert cfg.validate_required_keys()["FRED_API_KEY"] is True
@@ -0,0 +1,78 @@
+"""market_snapshot.py 테스트"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from market_snapshot import MarketSnapshot, batch_fields
+from quotes import CryptoQuote
+
+SYMBOL_MAP = {
+    "AAPL": ("mag7", "Apple"),
+    "MSFT": ("mag7", "Microsoft"),
+    "^GSPC": ("us_indices", "S&P 500"),
+    "NVDA": ("mag7", "NVIDIA"),
+    "GONE": ("mag7", "없음"),
+}
+
+
+def _frame():
+    index = pd.date_range("2026-01-26", periods=4, freq="D")
+    return pd.DataFrame({
+        "AAPL": [100.0, 101.0, 102.0, np.nan],   # 마지막 날 NaN → 101 → 102
+        "MSFT": [np.nan, np.nan, 50.0, np.nan],  # 값 하나 → 변동 0
+        "^GSPC": [10.0, np.nan, 9.0, 9.9],
+        "NVDA": [np.nan] * 4,                    # 값 없음 → 제외
+    }, index=index)
+
+
+class TestMarketSnapshot:
+    """컬럼형 스냅샷 테스트"""
+
+    def test_from_closes(self):
+        """마지막 두 유효 종가로 변동률, 카테고리별 연속 구간"""
+        volumes = _frame() * 1000
+        snapshot = MarketSnapshot.from_closes(_frame(), SYMBOL_MAP, volumes)
+
+        assert list(snapshot.names) == ["Apple", "Microsoft", "S&P 500"]
+        assert snapshot.index == {"mag7": slice(0, 2), "us_indices": slice(2, 3)}
+        assert snapshot.prices.tolist() == [102.0, 50.0, 9.9]
+        assert snapshot.changes.tolist() == [round((102.0 - 101.0) / 101.0 * 100, 2), 0.0, 10.0]
+        assert snapshot.volumes.tolist() == [102000.0, 50000.0, 9900.0]
+        assert snapshot.quote(2) == {"price": 9.9, "change": 10.0}
+
+    def test_batch_fields(self):
+        """티커 레벨 없는 단일 심볼 프레임도 (날짜 × 티커)로"""
+        single = pd.DataFrame({"Close": [1.0, 2.0], "Volume": [5.0, 6.0]})
+        fields = batch_fields(single, ["AAPL"])
+        assert list(fields["Close"].columns) == ["AAPL"]
+        assert fields["Volume"]["AAPL"].tolist() == [5.0, 6.0]
+
+    def test_top_movers_and_stats(self):
+        """변동률 순위 (NaN 제외, 동률은 원래 순서), 카테고리 집계"""
+        snapshot = MarketSnapshot(
+            ["A", "B", "C", "D", "X"], ["a", "b", "c", "d", "x"],
+            ["s", "s", "s", "s", "t"],
+            [1.0] * 5, [1.5, -2.0, np.nan, 1.5, 9.0],
+        )
+        assert snapshot.top_movers(2, "s").tolist() == [0, 3]
+        assert snapshot.top_movers(1, "s", ascending=True).tolist() == [1]
+        assert snapshot.top_movers(1).tolist() == [4]
+        assert snapshot.top_movers(3, "없음").tolist() == []
+
+        stats = snapshot.category_stats()
+        assert stats["s"] == {"count": 3, "advancers": 2, "decliners": 1, "unchanged": 0,
+                              "mean_change": 1.0 / 3}
+        assert stats["t"]["count"] == 1
+
+    def test_from_market_data_concat(self, sample_market_data):
+        """dict에서 생성 후 합치기 (티커는 유니버스, crypto는 CryptoQuote)"""
+        crypto = MarketSnapshot.from_market_data(sample_market_data, ["crypto"])
+        rest = MarketSnapshot.from_market_data(sample_market_data, ["us_indices", "mag7"])
+        snapshot = MarketSnapshot.concat([crypto, rest])
+
+        assert snapshot.category_names == ("crypto", "us_indices", "mag7")
+        assert len(snapshot) == len(crypto) + len(rest)
+        assert snapshot.symbols[snapshot.rows("us_indices")][0] == "^GSPC"
+        assert isinstance(snapshot.quote(0), CryptoQuote) and snapshot.quote(0).price == 95000
+        assert math.isnan(snapshot.volumes[0])
@@ -0,0 +1,88 @@
+"""metrics.py 테스트"""
+import json
+import pytest
+from metrics import MetricsRegistry
+from retry import retry_on_exception
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 클래스 테스트"""
+
+    def test_counter_increments_per_label_set(self):
+        """라벨 조합별 카운터 증가"""
+        registry = MetricsRegistry()
+        registry.inc("provider_requests_total", provider="fred", status="ok")
+        registry.inc("provider_requests_total", provider="fred", status="ok")
+        registry.inc("provider_requests_total", provider="fred", status="error")
+
+        assert registry.get_counter("provider_requests_total", provider="fred", status="ok") == 2
+        assert registry.get_counter("provider_requests_total", status="error", provider="fred") == 1
+        assert registry.get_counter("provider_requests_total", provider="coingecko", status="ok") == 0
+
+    def test_histogram_buckets(self):
+        """히스토그램 버킷 누적 카운트"""
+        registry = MetricsRegistry()
+        for value in (0.01, 0.2, 3.0):
+            registry.observe("provider_request_seconds", value, provider="fred")
+
+        hist = registry.get_histogram("provider_request_seconds", provider="fred")
+        assert hist.count == 3
+        assert hist.sum == pytest.approx(3.21)
+        cumulative = dict(zip(hist.buckets, hist.cumulative()))
+        assert cumulative[0.05] == 1
+        assert cumulative[0.25] == 2
+        assert cumulative[5.0] == 3
+
+    def test_track_request_records_error(self):
+        """요청 실패 시 error 상태로 기록하고 예외 전파"""
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            with registry.track_request("coingecko"):
+                raise ValueError("boom")
+
+        assert registry.get_counter("provider_requests_total", provider="coingecko", status="error") == 1
+        assert registry.get_histogram("provider_request_seconds", provider="coingecko").count == 1
+
+    def test_prometheus_format(self):
+        """Prometheus textfile 형식 출력"""
+        registry = MetricsRegistry()
+        registry.inc("provider_requests_total", provider="fred", status="ok")
+        registry.observe("provider_request_seconds", 0.3, provider="fred")
+
+        text = registry.to_prometheus()
+        assert "# TYPE autodiary_provider_requests_total counter" in text
+        assert 'autodiary_provider_requests_total{provider="fred",status="ok"} 1' in text
+        assert "# TYPE autodiary_provider_request_seconds histogram" in text
+        assert 'autodiary_provider_request_seconds_bucket{provider="fred",le="+Inf"} 1' in text
+        assert 'autodiary_provider_request_seconds_count{provider="fred"} 1' in text
+
+    def test_export_writes_files(self, tmp_path):
+        """textfile + JSON 파일 저장"""
+        registry = MetricsRegistry()
+        registry.inc("symbols_total", 5, provider="yfinance", status="ok")
+
+        prom_path, json_path = registry.export(tmp_path, "2026-01-29")
+
+        assert prom_path.read_text(encoding="utf-8").startswith("# HELP")
+        payload = json.loads(json_path.read_text(encoding="utf-8"))
+        assert payload["run_id"] == "2026-01-29"
+        assert payload["counters"]["symbols_total"][0]["value"] == 5
+
+
+class TestRetryMetrics:
+    """retry 헬퍼의 메트릭 연동 테스트"""
+
+    def test_retry_attempts_counted(self):
+        """재시도/최종 실패 횟수 기록"""
+        from metrics import metrics
+
+        @retry_on_exception(max_retries=2, delay=0.01, backoff=1.0)
+        def metrics_always_fail():
+            raise ValueError("fail")
+
+        before = metrics.get_counter("retry_attempts_total", func="metrics_always_fail")
+        with pytest.raises(ValueError):
+            metrics_always_fail()
+
+        assert metrics.get_counter("retry_attempts_total", func="metrics_always_fail") == before + 2
+        assert metrics.get_counter("retry_exhausted_total", func="metrics_always_fail") >= 1
@@ -3,7 +3,9 @@ import pytest
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from post_generator import PostGenerator
+from post_generator import (
+    DATA_TEMPLATE, CompiledTemplate, PostGenerator, TemplateError, change_class, format_change, load_template,
+)
 
 
 class TestPostGenerator:
@@ -34,6 +36,19 @@ class TestPostGenerator:
         assert "+0.35%" in result
         assert "-0.15%" in result
 
+    def test_change_classes(self):
+        """변동값에 상승/하락/보합 클래스 부여"""
+        assert format_change(0.35) == '<span class="chg-up">+0.35%</span>'
+        assert format_change(-0.15) == '<span class="chg-down">-0.15%</span>'
+        assert change_class(0.004) == "chg-flat"
+        assert format_change(None) == "-"
+
+    def test_format_table_colored_at_generation(self):
+        """테이블 변동 셀이 생성 시점에 클래스를 가짐"""
+        generator = PostGenerator()
+        result = generator._format_table({"KOSPI": {"price": 2550.3, "change": -0.85}}, ["지수", "종가", "변동"])
+        assert '| <span class="chg-down">-0.85%</span> |' in result
+
     def test_format_crypto_table(self):
         """암호화폐 테이블 포맷팅"""
         generator = PostGenerator()
@@ -119,3 +134,130 @@ class TestPostGenerator:
         result = generator._format_economic_calendar(calendar_data)
 
         assert "FOMC" in result or "연준" in result
+
+
+class TestBriefingTemplate:
+    """브리핑 템플릿 테스트"""
+
+    def test_compiled_template_render(self):
+        """리터럴/값/스트리밍 필드, $$ 이스케이프"""
+        template = CompiledTemplate("가격 $$${price} ${table}끝")
+        out = []
+        template.render(out.append, {"price": 10, "table": lambda w: (w("A"), w("B"))})
+        assert "".join(out) == "가격 $10 AB끝"
+        assert template.fields == {"price", "table"}
+
+    def test_missing_field_raises(self):
+        """context에 없는 필드는 오류"""
+        with pytest.raises(TemplateError):
+            CompiledTemplate("${a}").render(lambda s: None, {})
+
+    def test_load_template_cached(self, tmp_path):
+        """mtime이 같으면 같은 컴파일 결과 재사용"""
+        path = tmp_path / "t.md"
+        path.write_text("${summary}", encoding="utf-8")
+        assert load_template(path) is load_template(path)
+
+    def test_custom_template(self, tmp_path, sample_market_data):
+        """템플릿 파일로 레이아웃 교체"""
+        path = tmp_path / "custom.md"
+        path.write_text("# ${date_short}\n${summary}\n${us_indices}", encoding="utf-8")
+        generator = PostGenerator(posts_dir=str(tmp_path), template_path=path)
+
+        content = generator._build_post_content(sample_market_data, "요약", datetime(2026, 1, 29))
+        assert content.startswith("# 2026.01.29\n요약\n\n| 지수 | 종가 | 변동 |")
+
+    def test_generate_with_date(self, tmp_path, sample_market_data):
+        """백필: 지정한 날짜로 파일 생성"""
+        generator = PostGenerator(posts_dir=str(tmp_path))
+        filepath = generator.generate_briefing_post(sample_market_data, "요약", datetime(2025, 12, 1, 6))
+        assert Path(filepath).name == "2025-12-01-daily-market-briefing.md"
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_post_index_updated(self, tmp_path, sample_market_data):
+        """post_index를 주면 포스트를 쓴 뒤 카테고리 목록 갱신"""
+        import json
+        from post_index import PostIndex
+        index = PostIndex(tmp_path / "_posts", tmp_path / "_data", tmp_path / "state.json")
+        generator = PostGenerator(posts_dir=str(tmp_path / "_posts" / "market"), post_index=index)
+        generator.generate_briefing_post(sample_market_data, "요약", datetime(2026, 1, 29, 6))
+
+        market = json.loads((tmp_path / "_data" / "categories" / "market.json").read_text(encoding="utf-8"))
+        assert market["posts"][0]["date"] == "2026-01-29"
+
+
+class TestBriefingData:
+    """_data/briefings JSON 출력 테스트"""
+
+    def test_json_written_with_post(self, tmp_path, sample_market_data):
+        """포스트와 같은 날짜의 JSON 저장, front matter가 참조"""
+        import json
+        generator = PostGenerator(posts_dir=str(tmp_path / "posts"), data_dir=str(tmp_path / "data"))
+        filepath = generator.generate_briefing_post(sample_market_data, "요약", datetime(2026, 1, 29, 6))
+
+        data = json.loads((tmp_path / "data" / "2026-01-29.json").read_text(encoding="utf-8"))
+        assert data["date"] == "2026-01-29"
+        assert data["summary"] == "요약"
+        assert "briefing_data: 2026-01-29" in Path(filepath).read_text(encoding="utf-8")
+
+    def test_table_rows_have_raw_and_display(self, sample_market_data):
+        """원본 숫자 + 표시 문자열 + 변동 클래스"""
+        generator = PostGenerator()
+        data = generator.build_briefing_data(sample_market_data, "요약", datetime(2026, 1, 29))
+
+        row = data["tables"]["us_indices"]["rows"][0]
+        source = sample_market_data["us_indices"][row["name"]]
+        assert row["price"] == source["price"]
+        assert row["display"] == [f"{source['price']:,.2f}", f"{source['change']:+.2f}%"]
+        assert row["class"] in ("chg-up", "chg-down", "chg-flat")
+        assert data["tables"]["crypto"]["headers"][0] == "코인"
+
+    def test_data_template_uses_includes(self, tmp_path, sample_market_data):
+        """데이터 레이아웃은 표 대신 include"""
+        generator = PostGenerator(posts_dir=str(tmp_path), template_path=DATA_TEMPLATE)
+        content = generator._build_post_content(sample_market_data, "요약", datetime(2026, 1, 29))
+        assert '{% include briefing-table.html table="us_indices" %}' in content
+        assert "| 지수 | 종가 | 변동 |" not in content
+
+
+class TestSparklines:
+    """스파크라인 열 테스트"""
+
+    def _history(self):
+        import pandas as pd
+        from price_history import PriceHistory
+        history = PriceHistory()
+        index = pd.date_range("2026-01-01", periods=10, freq="D")
+        history.merge_closes({
+            "us_indices/S&P 500": pd.Series(range(10), index=index, dtype=float),
+            "crypto/BTC": pd.Series(range(10, 0, -1), index=index, dtype=float),
+        })
+        return history
+
+    def test_spark_column_added(self, tmp_path, sample_market_data):
+        """히스토리가 있는 표에만 추이 열"""
+        generator = PostGenerator(posts_dir=str(tmp_path), history=self._history())
+        content = generator._build_post_content(sample_market_data, "요약", datetime(2026, 1, 29))
+
+        assert "| 지수 | 종가 | 변동 | 30일 |" in content
+        assert '<svg class="spark chg-up"' in content
+        assert '<svg class="spark chg-down"' in content
+        assert "| 통화쌍 | 환율 | 변동 |\n" in content
+
+    def test_json_rows_carry_spark(self, sample_market_data):
+        """JSON 행에도 스파크라인"""
+        generator = PostGenerator(history=self._history())
+        data = generator.build_briefing_data(sample_market_data, "요약", datetime(2026, 1, 29))
+        assert data["tables"]["us_indices"]["spark"] is True
+        assert data["tables"]["currencies"]["spark"] is False
+
+    def test_generated_once_per_post(self, tmp_path, sample_market_data, monkeypatch):
+        """포스트와 JSON이 같은 스파크라인을 공유 (히스토리 행렬/단순화는 한 번만)"""
+        generator = PostGenerator(posts_dir=str(tmp_path), data_dir=str(tmp_path / "data"), history=self._history())
+        calls = []
+        sparklines = generator._sparklines
+        monkeypatch.setattr(generator, "_sparklines", lambda data: calls.append(1) or sparklines(data))
+
+        filepath = generator.generate_briefing_post(sample_market_data, "요약", datetime(2026, 1, 29, 6))
+        assert len(calls) == 1
+        assert '<svg class="spark' in open(filepath, encoding="utf-8").read()
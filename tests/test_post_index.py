@@ -0,0 +1,104 @@
+"""post_index.py 테스트"""
+import json
+from pathlib import Path
+
+from post_index import PostIndex, tag_id
+
+
+def _post(path: Path, title: str, day: str, categories: str = "[market, briefing]",
+          tags: str = "[시황]") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f'---\nlayout: post\ntitle: "{title}"\ndate: {day} 06:00:00 +0900\n'
+        f"categories: {categories}\ntags: {tags}\n---\n\n본문\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _read(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _index(tmp_path: Path) -> PostIndex:
+    return PostIndex(tmp_path / "_posts", tmp_path / "_data", tmp_path / "state.json")
+
+
+class TestPostIndex:
+    """아카이브/카테고리/태그 인덱스 테스트"""
+
+    def test_tag_id(self):
+        """한글 유지, 특수문자는 하이픈"""
+        assert tag_id("시황") == "시황"
+        assert tag_id("S&P 500") == "s-p-500"
+
+    def test_first_update_rebuilds(self, tmp_path):
+        """상태 파일이 없으면 전체 생성 (최신순)"""
+        posts = tmp_path / "_posts"
+        _post(posts / "market" / "2025-12-31-a.md", "연말", "2025-12-31")
+        new = _post(posts / "market" / "2026-01-02-b.md", "연초", "2026-01-02")
+
+        _index(tmp_path).update([new])
+
+        data = tmp_path / "_data"
+        summary = _read(data / "archive_summary.json")
+        assert summary["total"] == 2
+        assert [y["id"] for y in summary["years"]] == ["2026", "2025"]
+        market = _read(data / "categories" / "market.json")
+        assert [p["title"] for p in market["posts"]] == ["연초", "연말"]
+        assert market["posts"][0]["url"] == "/market/briefing/2026/01/02/b"
+        assert _read(data / "tags" / "시황.json")["name"] == "시황"
+
+    def test_incremental_update_touches_only_affected(self, tmp_path):
+        """새 포스트는 자기 목록만 다시 쓰고, 태그가 빠지면 빈 목록 파일 삭제"""
+        posts = tmp_path / "_posts"
+        _post(posts / "market" / "2025-12-31-a.md", "연말", "2025-12-31")
+        _index(tmp_path).rebuild()
+        year_2025 = tmp_path / "_data" / "archive" / "2025.json"
+        mtime = year_2025.stat().st_mtime_ns
+
+        essay = _post(posts / "essays" / "2026-01-02-b.md", "일기", "2026-01-02", "[essays]", "[일상]")
+        index = _index(tmp_path)
+        index.update([essay])
+        assert year_2025.stat().st_mtime_ns == mtime
+        assert _read(tmp_path / "_data" / "categories" / "essays.json")["posts"][0]["title"] == "일기"
+
+        # 변경 없는 포스트 재반영은 아무것도 쓰지 않음
+        assert index.update([essay]) == 0
+
+        _post(essay, "일기", "2026-01-02", "[essays]", "[]")
+        index.update([essay])
+        assert not (tmp_path / "_data" / "tags" / "일상.json").exists()
+
+    def test_deleted_post_removed(self, tmp_path):
+        """삭제된 포스트는 목록과 요약에서 제거"""
+        posts = tmp_path / "_posts"
+        a = _post(posts / "market" / "2026-01-01-a.md", "a", "2026-01-01")
+        _post(posts / "market" / "2026-01-02-b.md", "b", "2026-01-02")
+        _index(tmp_path).rebuild()
+
+        a.unlink()
+        _index(tmp_path).update([a])
+
+        assert _read(tmp_path / "_data" / "archive_summary.json")["total"] == 1
+        assert [p["title"] for p in _read(tmp_path / "_data" / "archive" / "2026.json")["posts"]] == ["b"]
+
+    def test_reconcile_picks_up_manual_changes(self, tmp_path):
+        """손/git으로 추가, 수정, 삭제한 포스트를 찾아 반영하고, 그대로인 포스트는 다시 파싱하지 않음"""
+        posts = tmp_path / "_posts"
+        a = _post(posts / "market" / "2026-01-01-a.md", "a", "2026-01-01")
+        b = _post(posts / "market" / "2026-01-02-b.md", "b", "2026-01-02")
+        _index(tmp_path).rebuild()
+
+        a.unlink()
+        _post(b, "b 수정", "2026-01-02")
+        _post(posts / "essays" / "2026-01-03-c.md", "c", "2026-01-03", "[essays]", "[일상]")
+        assert _index(tmp_path).reconcile() > 0
+
+        assert _read(tmp_path / "_data" / "archive_summary.json")["total"] == 2
+        assert [p["title"] for p in _read(tmp_path / "_data" / "archive" / "2026.json")["posts"]] == ["c", "b 수정"]
+        assert (tmp_path / "_data" / "tags" / "일상.json").exists()
+
+        # 내용이 그대로면 mtime이 바뀌어도(체크아웃 등) 아무것도 쓰지 않음
+        b.touch()
+        assert _index(tmp_path).reconcile() == 0
@@ -0,0 +1,80 @@
+"""price_history.py 테스트"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from price_history import PriceHistory, series_key
+
+
+def _closes(values, start="2026-01-01"):
+    return pd.Series(values, index=pd.date_range(start, periods=len(values), freq="D"))
+
+
+class TestPriceHistory:
+    """가격 히스토리 테스트"""
+
+    def test_merge_and_roundtrip(self, tmp_path):
+        """종가 병합 후 CSV 저장/로드"""
+        history = PriceHistory(path=tmp_path / "h.csv")
+        history.merge_closes({series_key("us_indices", "S&P 500"): _closes([1.0, 2.0, 3.0])})
+        history.save()
+
+        loaded = PriceHistory.load(tmp_path / "h.csv")
+        assert loaded.keys == ["us_indices/S&P 500"]
+        assert len(loaded) == 3
+
+    def test_record_snapshot(self):
+        """현재가 기록 (crypto는 price_usd), 숫자 아닌 항목 무시"""
+        history = PriceHistory()
+        count = history.record({
+            "timestamp": "x",
+            "crypto": {"BTC": {"price_usd": 95000.0}},
+            "us_indices": {"NASDAQ": {"price": 18500.5}, "없음": {"price": None}},
+        }, datetime(2026, 1, 29, 6))
+        assert count == 2
+        assert history.frame.loc["2026-01-29", "crypto/BTC"] == 95000.0
+
+    def test_record_keeps_batch_close(self):
+        """같은 날 배치 종가가 있으면 유지"""
+        history = PriceHistory()
+        history.merge_closes({"us_indices/NASDAQ": _closes([10.0], start="2026-01-29")})
+        history.record({"us_indices": {"NASDAQ": {"price": 99.0}}}, datetime(2026, 1, 29))
+        assert history.frame.loc["2026-01-29", "us_indices/NASDAQ"] == 10.0
+
+    def test_record_skips_batch_series(self):
+        """종가 시계열이 있는 항목은 주말 실행에서도 기록하지 않음"""
+        history = PriceHistory()
+        history.merge_closes({"us_indices/NASDAQ": _closes([10.0], start="2026-01-30")})
+        count = history.record({"us_indices": {"NASDAQ": {"price": 10.0}}, "crypto": {"BTC": {"price_usd": 1.0}}},
+                               datetime(2026, 1, 31), skip=["us_indices/NASDAQ"])
+        assert count == 1
+        assert history.frame["us_indices/NASDAQ"].dropna().index.strftime("%Y-%m-%d").tolist() == ["2026-01-30"]
+
+    def test_merge_drops_stale_rows(self):
+        """배치 종가 구간 안에 있던 다른 날짜 값(주말 직전 종가)은 지우고, 구간 밖과 다른 시리즈는 유지"""
+        history = PriceHistory()
+        history.record({"us_indices": {"NASDAQ": {"price": 10.0}, "S&P 500": {"price": 5.0}},
+                        "crypto": {"BTC": {"price_usd": 1.0}}}, datetime(2026, 1, 31))
+        history.record({"us_indices": {"NASDAQ": {"price": 9.0}}}, datetime(2026, 1, 20))
+        fridays = pd.Series([10.0, 11.0], index=pd.to_datetime(["2026-01-30", "2026-02-02"]))
+        history.merge_closes({"us_indices/NASDAQ": fridays})
+
+        nasdaq = history.frame["us_indices/NASDAQ"].dropna()
+        assert nasdaq.index.strftime("%Y-%m-%d").tolist() == ["2026-01-20", "2026-01-30", "2026-02-02"]
+        assert history.frame.loc["2026-01-31", "us_indices/S&P 500"] == 5.0
+        assert history.frame.loc["2026-01-31", "crypto/BTC"] == 1.0
+
+    def test_matrix_right_aligned(self):
+        """시리즈별 유효값을 오른쪽 정렬, 없는 키는 NaN"""
+        history = PriceHistory()
+        history.merge_closes({
+            "a/x": _closes([1.0, 2.0, 3.0]),
+            "a/y": _closes([5.0, np.nan, 6.0]),
+        })
+        keys, matrix = history.matrix(["a/x", "a/y", "a/z"], points=3)
+
+        assert keys == ["a/x", "a/y", "a/z"]
+        assert matrix[0].tolist() == [1.0, 2.0, 3.0]
+        assert np.isnan(matrix[1, 0]) and matrix[1, 1:].tolist() == [5.0, 6.0]
+        assert np.isnan(matrix[2]).all()
@@ -0,0 +1,46 @@
+"""profiler.py 테스트"""
+import pstats
+import threading
+import time
+
+from profiler import StageProfiler
+
+
+def _work():
+    data = [str(i) * 10 for i in range(20000)]
+    time.sleep(0.03)
+    return data
+
+
+class TestStageProfiler:
+    """단계 프로파일 파일 테스트"""
+
+    def test_stage_files(self, tmp_path):
+        """단계마다 .prof, stats, .folded, 메모리 보고서 생성"""
+        profiler = StageProfiler(tmp_path, interval=0.001)
+        with profiler.stage("fetch"):
+            kept = _work()
+        with profiler.stage("post"):
+            pass
+        profiler.close()
+
+        assert sorted(p.name for p in tmp_path.glob("01-fetch*")) == [
+            "01-fetch-alloc.txt", "01-fetch-stats.txt", "01-fetch.folded", "01-fetch.prof",
+        ]
+        assert (tmp_path / "02-post.prof").exists()
+        assert "_work" in str(pstats.Stats(str(tmp_path / "01-fetch.prof")).stats)
+        assert "test_profiler.py" in (tmp_path / "01-fetch-alloc.txt").read_text(encoding="utf-8")
+        assert len(kept) == 20000
+
+    def test_folded_includes_worker_threads(self, tmp_path):
+        """샘플 스택은 워커 스레드도 포함 (스레드 이름이 루트)"""
+        profiler = StageProfiler(tmp_path, interval=0.001)
+        with profiler.stage("fetch"):
+            worker = threading.Thread(target=time.sleep, args=(0.05,), name="worker-1")
+            worker.start()
+            worker.join()
+        profiler.close()
+
+        folded = (tmp_path / "01-fetch.folded").read_text(encoding="utf-8").splitlines()
+        assert any(line.startswith("worker-1;") for line in folded)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
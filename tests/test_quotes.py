@@ -0,0 +1,46 @@
+"""quotes.py 테스트"""
+import json
+import pickle
+
+import pytest
+
+from quotes import CryptoQuote, Quote, as_quote, get_quote, iter_quotes
+
+
+class TestQuote:
+    """시세 레코드 테스트"""
+
+    def test_dict_view(self):
+        """속성과 예전 dict 키가 같은 값, dict와 비교/변환 가능"""
+        quote = Quote(5000.0, 0.5)
+        assert (quote.price, quote.change, quote.price_krw) == (5000.0, 0.5, None)
+        assert quote["price"] == 5000.0 and quote.get("change") == 0.5
+        assert quote == {"price": 5000.0, "change": 0.5}
+        assert json.dumps(dict(quote)) == '{"price": 5000.0, "change": 0.5}'
+        with pytest.raises(KeyError):
+            quote["price_usd"]
+        assert not hasattr(quote, "__dict__")
+
+    def test_crypto_keys(self):
+        """crypto는 같은 속성에 price_usd/price_krw/change_24h 키"""
+        quote = CryptoQuote(95000.0, 2.5, 139000000.0)
+        assert (quote.price, quote.change, quote.price_krw) == (95000.0, 2.5, 139000000.0)
+        assert quote == {"price_usd": 95000.0, "price_krw": 139000000.0, "change_24h": 2.5}
+        assert pickle.loads(pickle.dumps(quote)) == quote
+
+    def test_as_quote_legacy(self):
+        """예전 dict 형태 변환, 시세가 아닌 값은 None"""
+        quote = as_quote({"price_usd": 3200, "change_24h": -1.2})
+        assert isinstance(quote, CryptoQuote) and quote.change == -1.2 and quote.price_krw is None
+        assert as_quote({"price": 1.0}).change is None
+        assert as_quote({"value": 50}) is None
+        assert as_quote("x") is None
+
+    def test_iter_and_get(self):
+        """카테고리 순회 (시세 아닌 항목 제외), 없는 항목은 빈 Quote"""
+        data = {"us_indices": {"S&P 500": Quote(5000.0, 0.5), "NASDAQ": {"price": 1.0, "change": 2.0},
+                               "note": "x"}}
+        assert [name for name, _ in iter_quotes(data["us_indices"])] == ["S&P 500", "NASDAQ"]
+        assert list(iter_quotes(None)) == []
+        assert get_quote(data, "us_indices", "NASDAQ").change == 2.0
+        assert get_quote(data, "crypto", "BTC").price is None
@@ -0,0 +1,100 @@
+"""regime.py 테스트"""
+import numpy as np
+import pandas as pd
+
+from post_generator import PostGenerator
+from price_history import PriceHistory
+from regime import ANCHOR, aligned_prices, classify_regime, compute_regime, pairwise_correlation
+
+
+def _history(days: int = 50, seed: int = 0) -> PriceHistory:
+    """S&P 500 거래일 + 주말 포함 BTC, S&P와 같은 방향인 NASDAQ, 반대 방향인 금"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end="2026-01-28", periods=days * 7 // 5, freq="D", name="date")
+    steps = rng.normal(0, 0.01, len(index))
+    sp = 5000 * np.cumprod(1 + steps)
+    frame = pd.DataFrame({
+        ANCHOR: sp,
+        "us_indices/NASDAQ": 18000 * np.cumprod(1 + 2 * steps),
+        "commodities/금": 2000 * np.cumprod(1 - steps),
+        "crypto/BTC": 90000 * np.cumprod(1 + rng.normal(0, 0.03, len(index))),
+        "mag7/애플": 200.0,
+    }, index=index)
+    weekend = index.dayofweek >= 5
+    frame.loc[weekend, [ANCHOR, "us_indices/NASDAQ", "commodities/금"]] = np.nan
+    return PriceHistory(frame)
+
+
+class TestCorrelation:
+    """상관 계산 테스트"""
+
+    def test_pairwise_matches_pandas(self):
+        """결측이 섞여도 pandas pairwise 상관과 같음"""
+        rng = np.random.default_rng(1)
+        returns = rng.normal(size=(40, 12))
+        returns[rng.random(returns.shape) < 0.3] = np.nan
+        expected = pd.DataFrame(returns).corr(min_periods=5).to_numpy()
+        result = pairwise_correlation(returns, min_observations=5)
+        assert np.allclose(result, expected, equal_nan=True)
+
+    def test_aligned_to_anchor_days(self):
+        """거래일은 S&P 종가가 있는 날"""
+        history = _history()
+        dates, prices = aligned_prices(history, [ANCHOR, "crypto/BTC"])
+
+        assert pd.DatetimeIndex(dates).dayofweek.max() < 5
+        assert len(dates) == history.frame[ANCHOR].notna().sum()
+        # BTC는 거래일의 값 그대로 (주말 변동은 월요일에 합쳐짐)
+        assert prices[-1, 1] == history.frame.loc[pd.Timestamp(dates[-1]), "crypto/BTC"]
+
+
+class TestRegime:
+    """패널/국면 테스트"""
+
+    def test_panel(self):
+        """대상 카테고리만, 같은 방향 +1 / 반대 방향 -1 상관"""
+        regime = compute_regime(_history())
+        assets = {asset["name"]: asset for asset in regime["assets"]}
+
+        assert "mag7/애플" not in regime["keys"]
+        assert len(regime["correlation"]) == len(regime["keys"])
+        assert assets["NASDAQ"]["correlation"] > 0.99
+        assert assets["금"]["correlation"] < -0.99
+        assert assets["S&P 500"]["volatility"] > 0
+        assert regime["regime"]["label"] in ("위험 선호", "위험 회피", "중립")
+
+    def test_short_history(self):
+        """거래일이 구간보다 짧으면 빈 dict"""
+        assert compute_regime(_history(days=10)) == {}
+        assert compute_regime(PriceHistory()) == {}
+
+    def test_classify(self):
+        """표 평균으로 국면 (금/VIX는 반대 방향), 값 없는 신호는 제외"""
+        risk_on = classify_regime({ANCHOR: 0.03, "crypto/BTC": 0.1, "commodities/금": -0.01,
+                                   "market_indicators/VIX (공포지수)": np.nan})
+        assert (risk_on["label"], risk_on["score"]) == ("위험 선호", 1.0)
+        assert classify_regime({ANCHOR: -0.03, "commodities/금": 0.02})["label"] == "위험 회피"
+        assert classify_regime({ANCHOR: 0.03, "commodities/금": 0.02})["label"] == "중립"
+        assert classify_regime({})["score"] is None
+
+    def test_rendered_after_indicators(self, sample_market_data):
+        """포스트에 패널 표, 데이터가 없으면 출력 그대로"""
+        generator = PostGenerator()
+        now = pd.Timestamp("2026-01-29 06:00").to_pydatetime()
+        regime = compute_regime(_history())
+        without = generator._build_post_content(sample_market_data, "요약", now)
+        content = generator._build_post_content(dict(sample_market_data, regime=regime), "요약", now)
+
+        section = generator._format_regime(regime)
+        assert content.replace(section, "", 1) == without
+        assert "| NASDAQ |" in section and "S&P 500 상관" in section
+        assert content.index("주요 경제지표") < content.index("자산 간 상관") < content.index("미국 증시")
+
+    def test_telegram_line(self, sample_market_data):
+        """텔레그램 메시지 1 시장 심리에 국면"""
+        from telegram_notifier import TelegramNotifier
+
+        regime = {"assets": [], "regime": {"label": "위험 회피", "score": -0.6, "votes": {}}}
+        messages = TelegramNotifier()._build_full_briefing(dict(sample_market_data, regime=regime),
+                                                           "https://example.com/post")
+        assert "🔴 국면: 위험 회피 (점수 -0.60)" in messages[0]
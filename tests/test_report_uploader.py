@@ -0,0 +1,232 @@
+"""report_uploader.py 테스트"""
+import json
+from pathlib import Path
+from report_uploader import (
+    CREATED, UNCHANGED, UPDATED,
+    assign_slugs, bulk_import, collect_sources, extract_title, process_markdown_file, slugify,
+    sync_markdown_file,
+)
+from upload_manifest import UploadManifest
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestHelpers:
+    """헬퍼 함수 테스트"""
+
+    def test_slugify_korean(self):
+        """한글 유지, 공백은 하이픈"""
+        assert slugify("테슬라 분석 2026!") == "테슬라-분석-2026"
+
+    def test_extract_title(self):
+        """첫 # 헤더를 제목으로 추출"""
+        title, body = extract_title("# 제목\n\n본문", "fallback")
+        assert title == "제목"
+        assert body == "본문"
+
+    def test_extract_title_fallback(self):
+        """헤더가 없으면 fallback"""
+        assert extract_title("본문만", "파일명") == ("파일명", "본문만")
+
+    def test_assign_slugs_deterministic(self):
+        """충돌 시 입력 순서대로 접미사"""
+        assert assign_slugs(["a", "b", "a", "a"]) == ["a", "b", "a-2", "a-3"]
+
+    def test_assign_slugs_reserved(self):
+        """이미 사용 중인 슬러그는 피함"""
+        assert assign_slugs(["a", "b"], reserved={"a"}) == ["a-2", "b"]
+
+
+class TestProcessMarkdownFile:
+    """단일 파일 처리 테스트"""
+
+    def test_front_matter_and_body(self, tmp_path):
+        """front matter + 본문 생성"""
+        src = _write(tmp_path / "src" / "note.md", "# 테슬라 분석\n\n내용입니다.")
+        out = process_markdown_file(src, "analysis", output_dir=tmp_path / "out")
+
+        text = out.read_text(encoding="utf-8")
+        assert out.name.endswith("-테슬라-분석.md")
+        assert 'title: "테슬라 분석"' in text
+        assert "categories: [analysis]" in text
+        assert "내용입니다." in text
+        assert not list((tmp_path / "out").glob(".*.tmp"))
+
+
+class TestBulkImport:
+    """일괄 처리 테스트"""
+
+    def test_collect_sources_from_dir(self, tmp_path):
+        """디렉토리에서 마크다운만 재귀 수집"""
+        _write(tmp_path / "a.md", "# A")
+        _write(tmp_path / "sub" / "b.markdown", "# B")
+        _write(tmp_path / "c.txt", "not markdown")
+        names = [p.name for p in collect_sources(str(tmp_path))]
+        assert names == ["a.md", "b.markdown"]
+
+    def test_collect_sources_glob(self, tmp_path):
+        """glob 패턴 수집"""
+        _write(tmp_path / "x" / "a.md", "# A")
+        _write(tmp_path / "y" / "b.md", "# B")
+        assert len(collect_sources(str(tmp_path / "**" / "*.md"))) == 2
+
+    def test_bulk_resolves_slug_collisions(self, tmp_path):
+        """같은 제목은 경로순으로 -2 접미사"""
+        _write(tmp_path / "src" / "1.md", "# 같은 제목\n\n첫째")
+        _write(tmp_path / "src" / "2.md", "# 같은 제목\n\n둘째")
+        _write(tmp_path / "src" / "3.md", "# 다른 제목\n\n셋째")
+
+        outputs = bulk_import(
+            collect_sources(str(tmp_path / "src")), "essays",
+            output_dir=tmp_path / "out", workers=4,
+        )
+
+        names = sorted(p.name.split("-", 3)[3] for p in outputs)
+        assert names == ["같은-제목-2.md", "같은-제목.md", "다른-제목.md"]
+        first = next(p for p in outputs if p.name.endswith("-같은-제목.md"))
+        assert "첫째" in first.read_text(encoding="utf-8")
+
+    def test_bulk_skips_failed_file(self, tmp_path):
+        """읽을 수 없는 파일은 건너뛰고 나머지 처리"""
+        good = _write(tmp_path / "src" / "good.md", "# 정상")
+        bad = _write(tmp_path / "src" / "bad.md", "# 깨짐")
+        bad.write_bytes(b"\xff\xfe\x00broken")
+
+        outputs = bulk_import([good, bad], "essays", output_dir=tmp_path / "out")
+        assert len(outputs) == 1
+        assert outputs[0].name.endswith("-정상.md")
+
+
+class TestManifest:
+    """매니페스트 기반 증분 처리 테스트"""
+
+    def test_unchanged_source_skipped(self, tmp_path):
+        """같은 원본을 다시 올리면 쓰지 않음"""
+        src = _write(tmp_path / "src" / "note.md", "# 제목\n\n내용")
+        manifest = UploadManifest(tmp_path / "manifest.json")
+
+        out, status = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+        assert status == CREATED
+        mtime = out.stat().st_mtime_ns
+
+        out2, status = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+        assert (out2, status) == (out, UNCHANGED)
+        assert out.stat().st_mtime_ns == mtime
+
+    def test_changed_source_updates_in_place(self, tmp_path):
+        """바뀐 원본은 기존 포스트를 날짜/파일명 그대로 갱신"""
+        src = _write(tmp_path / "src" / "note.md", "# 제목\n\n첫 버전")
+        manifest = UploadManifest(tmp_path / "manifest.json")
+        out, _ = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+        date_line = next(line for line in out.read_text(encoding="utf-8").splitlines() if line.startswith("date:"))
+
+        _write(src, "# 바뀐 제목\n\n둘째 버전")
+        out2, status = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+
+        assert (out2, status) == (out, UPDATED)
+        text = out.read_text(encoding="utf-8")
+        assert "둘째 버전" in text and date_line in text
+        assert len(list((tmp_path / "out").glob("*.md"))) == 1
+
+    def test_moved_source_found_by_hash(self, tmp_path):
+        """이동한 원본은 해시로 기존 포스트에 연결"""
+        src = _write(tmp_path / "src" / "note.md", "# 제목\n\n내용")
+        manifest = UploadManifest(tmp_path / "manifest.json")
+        out, _ = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+
+        moved = _write(tmp_path / "src" / "renamed.md", src.read_text(encoding="utf-8"))
+        src.unlink()
+        assert sync_markdown_file(moved, "essays", manifest, output_dir=tmp_path / "out") == (out, UNCHANGED)
+
+    def test_manifest_persisted(self, tmp_path):
+        """저장 후 다시 열어도 매핑 유지, 변경 없으면 저장 안 함"""
+        src = _write(tmp_path / "src" / "note.md", "# 제목")
+        path = tmp_path / "manifest.json"
+        manifest = UploadManifest(path)
+        out, _ = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+        assert manifest.save() is True
+        assert manifest.save() is False
+
+        reloaded = UploadManifest(path)
+        assert reloaded.post_path(reloaded.get(src)) == out
+
+    def test_source_key_relative_to_root(self, tmp_path):
+        """원본 키는 노트 루트 기준 상대경로 (루트 밖은 경로 해시 + 파일 이름), 절대경로를 남기지 않음"""
+        manifest = UploadManifest(tmp_path / "manifest.json", source_root=tmp_path / "notes")
+        assert manifest.source_key(tmp_path / "notes" / "기업" / "a.md") == "기업/a.md"
+        key = manifest.source_key(tmp_path / "other" / "b.md")
+        assert key.startswith("external/") and key.endswith("/b.md")
+        assert str(tmp_path) not in key
+
+    def test_same_name_outside_root(self, tmp_path):
+        """루트 밖의 같은 이름 원본 둘은 서로의 포스트를 덮어쓰지 않음"""
+        first = _write(tmp_path / "a" / "index.md", "# 첫째\n\n하나")
+        second = _write(tmp_path / "b" / "index.md", "# 둘째\n\n둘")
+        path = tmp_path / "manifest.json"
+
+        outputs = []
+        for src in (first, second):
+            manifest = UploadManifest(path, source_root=tmp_path / "notes")
+            out, status = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+            manifest.save()
+            outputs.append(out)
+            assert status == CREATED
+
+        assert outputs[0] != outputs[1]
+        assert "하나" in outputs[0].read_text(encoding="utf-8")
+        assert "둘" in outputs[1].read_text(encoding="utf-8")
+
+        # 다시 올려도 둘 다 변경 없음 (서로 번갈아 갱신하지 않음)
+        manifest = UploadManifest(path, source_root=tmp_path / "notes")
+        for src, out in zip((first, second), outputs):
+            assert sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out") == (out, UNCHANGED)
+
+    def test_absolute_keys_migrated(self, tmp_path):
+        """버전 1(절대경로 키) 매니페스트는 로드할 때 상대 키로 변환"""
+        src = _write(tmp_path / "notes" / "note.md", "# 제목")
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"version": 1, "sources": {
+            str(src.resolve()): {"hash": "x", "post": "_posts/essays/a.md", "date": "2026-01-01 00:00:00 +0900"},
+        }}), encoding="utf-8")
+
+        manifest = UploadManifest(path, source_root=tmp_path / "notes")
+        assert manifest.get(src)["post"] == "_posts/essays/a.md"
+        assert manifest.save() is True
+        assert list(json.loads(path.read_text(encoding="utf-8"))["sources"]) == ["note.md"]
+
+    def test_bulk_rerun_writes_only_deltas(self, tmp_path):
+        """일괄 재실행 시 바뀐 파일만 갱신"""
+        _write(tmp_path / "src" / "a.md", "# A\n\n하나")
+        b = _write(tmp_path / "src" / "b.md", "# B\n\n둘")
+        path = tmp_path / "manifest.json"
+        sources = collect_sources(str(tmp_path / "src"))
+
+        first = bulk_import(sources, "essays", output_dir=tmp_path / "out", manifest=UploadManifest(path))
+        mtimes = {p: p.stat().st_mtime_ns for p in first}
+
+        _write(b, "# B\n\n둘 수정")
+        second = bulk_import(sources, "essays", output_dir=tmp_path / "out", manifest=UploadManifest(path))
+
+        assert second == first
+        changed = [p for p in second if p.stat().st_mtime_ns != mtimes[p]]
+        assert [p.name.endswith("-b.md") for p in changed] == [True]
+
+    def test_image_change_triggers_update(self, tmp_path, monkeypatch):
+        """참조 이미지만 바뀌어도 포스트 갱신"""
+        import report_uploader
+        from asset_pipeline import AssetPipeline
+        monkeypatch.setattr(report_uploader, "asset_pipeline", AssetPipeline(assets_dir=tmp_path / "assets"))
+
+        src = _write(tmp_path / "src" / "note.md", "# 제목\n\n![차트](chart.svg)")
+        _write(tmp_path / "src" / "chart.svg", "<svg>1</svg>")
+        manifest = UploadManifest(tmp_path / "manifest.json")
+        out, _ = sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out")
+        assert "relative_url" in out.read_text(encoding="utf-8")
+
+        _write(tmp_path / "src" / "chart.svg", "<svg>2</svg>")
+        assert sync_markdown_file(src, "essays", manifest, output_dir=tmp_path / "out") == (out, UPDATED)
+        assert len(list((tmp_path / "assets").iterdir())) == 2
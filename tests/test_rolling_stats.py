@@ -0,0 +1,133 @@
+"""rolling_stats.py 테스트"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from post_generator import PostGenerator
+from price_history import PriceHistory
+from rolling_stats import (EWMA_LAMBDA, EXTREME_WINDOW, LONG_WINDOW, ROLLING_VERSION, SHORT_WINDOW,
+                           TRADING_DAYS, RollingStatsCache)
+
+KEY = "us_indices/S&P 500"
+
+
+def _prices(days: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end="2026-01-28", periods=days, freq="D", name="date")
+    return pd.Series(5000 * np.cumprod(1 + rng.normal(0, 0.01, days)), index=index)
+
+
+def _expected(prices: pd.Series) -> dict:
+    """전체 시리즈로 다시 계산한 지표"""
+    returns = prices.pct_change().dropna()
+    ewma_var = returns.iloc[0] ** 2
+    for ret in returns.iloc[1:]:
+        ewma_var = EWMA_LAMBDA * ewma_var + (1 - EWMA_LAMBDA) * ret ** 2
+    return {
+        "ma_short": prices.iloc[-SHORT_WINDOW:].mean(),
+        "ma_long": prices.iloc[-LONG_WINDOW:].mean(),
+        "high": prices.iloc[-EXTREME_WINDOW:].max(),
+        "low": prices.iloc[-EXTREME_WINDOW:].min(),
+        "ema": prices.ewm(span=20, adjust=False).mean().iloc[-1],
+        "volatility": returns.iloc[-SHORT_WINDOW:].std() * np.sqrt(TRADING_DAYS) * 100,
+        "ewma_volatility": np.sqrt(ewma_var * TRADING_DAYS) * 100,
+    }
+
+
+class TestRollingStats:
+    """증분 갱신 테스트"""
+
+    def test_incremental_matches_full(self, tmp_path):
+        """하루씩 저장/로드하며 반영한 값이 전체 재계산과 같음 (히스토리는 최근 120일만 보관)"""
+        prices = _prices(400)
+        path = tmp_path / "rolling.json"
+        for day in range(300, 401):
+            cache = RollingStatsCache.load(path)
+            cache.update(PriceHistory(prices.iloc[max(day - 120, 0):day].to_frame(KEY)))
+            cache.save()
+
+        # 첫 실행에서 보관된 120일을 재생한 뒤로는 하루씩 누적 (히스토리보다 긴 220봉)
+        stats = RollingStatsCache.load(path).indicators()[KEY]
+        assert stats["bars"] == 220
+        assert stats["date"] == "2026-01-28"
+        for name, value in _expected(prices.iloc[180:]).items():
+            # 변동성은 소수 둘째 자리로 반올림
+            assert stats[name] == pytest.approx(value, rel=1e-6, abs=0.005), name
+
+    def test_only_new_bars(self):
+        """이미 반영한 날짜는 다시 읽지 않고, 같은 값이 이어진 봉도 그대로 반영"""
+        prices = _prices(30)
+        cache = RollingStatsCache()
+        assert cache.update(PriceHistory(prices.to_frame(KEY))) == 30
+        assert cache.update(PriceHistory(prices.to_frame(KEY))) == 0
+
+        unchanged = pd.concat([prices, pd.Series([prices.iloc[-1]], index=[prices.index[-1] + pd.Timedelta(days=1)])])
+        assert cache.update(PriceHistory(unchanged.to_frame(KEY))) == 1
+        assert cache.states[KEY].returns[-1] == 0
+
+    def test_weekend_runs(self):
+        """주말 포함 매일 실행(종가 병합 + 현재가 기록 + 갱신)해도 거래일만 봉으로 반영"""
+        closes = _prices(90).rename(None)
+        closes = closes[closes.index.dayofweek < 5]
+        runs = pd.date_range("2026-01-05", "2026-01-29", freq="D")
+        history, cache = PriceHistory(), RollingStatsCache()
+        for run in runs:
+            # 실행일(KST 아침)에는 전 거래일까지의 한 달치 종가를 받음
+            fetched = closes[(closes.index < run) & (closes.index >= run - pd.Timedelta(days=30))]
+            history.merge_closes({KEY: fetched})
+            history.record({"us_indices": {"S&P 500": {"price": fetched.iloc[-1]}},
+                            "crypto": {"BTC": {"price_usd": 90000.0 + run.day}}},
+                           run.to_pydatetime(), skip=[KEY])
+            cache.update(history)
+
+        trading = closes[closes.index >= runs[0] - pd.Timedelta(days=30)]
+        state = cache.states[KEY]
+        assert state.bars == len(trading) and state.last_date == "2026-01-28"
+        assert 0 not in state.returns
+        assert cache.states["crypto/BTC"].bars == len(runs)
+
+    def test_version_mismatch_rebuilds(self, tmp_path):
+        """버전이 다른 캐시 파일은 버리고 히스토리로 다시 채움"""
+        path = tmp_path / "rolling.json"
+        path.write_text(json.dumps({"version": ROLLING_VERSION + 1, "series": {KEY: {"old": "layout"}}}),
+                        encoding="utf-8")
+
+        cache = RollingStatsCache.load(path)
+        assert len(cache) == 0
+        assert cache.update(PriceHistory(_prices(30).to_frame(KEY))) == 30
+        assert cache.save() == path
+        assert RollingStatsCache.load(path).states[KEY].bars == 30
+
+    def test_short_history(self):
+        """봉이 모자란 지표는 None, 새 시리즈는 히스토리 전체를 재생"""
+        cache = RollingStatsCache()
+        cache.update(PriceHistory(_prices(5).to_frame(KEY)))
+        frame = pd.concat([_prices(5).rename(KEY), _prices(25, seed=1).rename("us_indices/NASDAQ")], axis=1)
+        assert cache.update(PriceHistory(frame)) == 25
+
+        stats = cache.indicators([KEY, "us_indices/NASDAQ", "없음"])
+        assert list(stats) == [KEY, "us_indices/NASDAQ"]
+        assert stats[KEY]["ma_short"] is None and stats[KEY]["volatility"] is not None
+        assert stats["us_indices/NASDAQ"]["ma_short"] is not None and stats["us_indices/NASDAQ"]["ma_long"] is None
+
+
+class TestTrendOutput:
+    """포스트 출력 테스트"""
+
+    def test_rendered_after_europe(self, sample_market_data):
+        """유럽 표 아래에 지수 추세 표, 데이터가 없으면 출력 그대로"""
+        cache = RollingStatsCache()
+        cache.update(PriceHistory(_prices(80).to_frame(KEY)))
+        trend = cache.indicators()
+
+        generator = PostGenerator()
+        now = pd.Timestamp("2026-01-29 06:00").to_pydatetime()
+        without = generator._build_post_content(sample_market_data, "요약", now)
+        content = generator._build_post_content(dict(sample_market_data, trend=trend), "요약", now)
+
+        section = generator._format_trend(dict(sample_market_data, trend=trend))
+        assert content.replace(section, "", 1) == without
+        assert "| S&P 500 |" in section and "52주 고점 대비" in section
+        assert content.index("### 유럽") < content.index("지수 추세") < content.index("## 🪙 암호화폐")
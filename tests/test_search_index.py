@@ -0,0 +1,91 @@
+"""search_index.py 테스트"""
+import json
+
+from pathlib import Path
+from search_index import build_index, build_search_index, fnv1a, parse_post, shard_of, tokenize
+
+
+def _post(path: Path, title: str, body: str, categories: str = "[market, briefing]") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f'---\nlayout: post\ntitle: "{title}"\ndate: 2026-01-28 06:00:00 +0900\n'
+        f"categories: {categories}\ntags: [시황]\n---\n\n{body}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestTokenize:
+    """토큰화 테스트"""
+
+    def test_korean_bigrams(self):
+        """한글은 2-gram, 1글자는 그대로"""
+        assert tokenize("시황 금") == ["시황", "금"]
+        assert tokenize("브리핑") == ["브리", "리핑"]
+
+    def test_index_unigrams(self):
+        """색인할 때는 한글 글자 하나씩도 넣어 1글자 검색어가 긴 단어 안에서도 일치"""
+        assert tokenize("금리", unigrams=True) == ["금리", "금", "리"]
+        assert tokenize("금", unigrams=True) == ["금"]
+        _, shards = build_index([{"url": "/a", "title": "황금", "date": "2026-01-28", "categories": [],
+                                  "tags": [], "body": "금리 동결"}])
+        assert shards[shard_of("금")]["금"] == [0]
+
+    def test_latin_words(self):
+        """영문은 소문자 단어, 숫자만/1글자 제외"""
+        assert tokenize("S&P 500 FOMC a") == ["fomc"]
+
+    def test_fnv1a_reference(self):
+        """JS 구현과 맞춘 FNV-1a 기준값"""
+        assert fnv1a("") == 0x811C9DC5
+        assert fnv1a("a") == 0xE40C292C
+        assert 0 <= shard_of("시황") < 16
+
+
+class TestParsePost:
+    """포스트 파싱 테스트"""
+
+    def test_url_and_metadata(self, tmp_path):
+        """Jekyll 기본 permalink로 URL 계산"""
+        post = parse_post(_post(tmp_path / "2026-01-28-daily-market-briefing.md", "3분 시황", "본문 {{ x }}"))
+        assert post["url"] == "/market/briefing/2026/01/28/daily-market-briefing"
+        assert post["date"] == "2026-01-28"
+        assert post["title"] == "3분 시황"
+        assert "{{" not in post["body"]
+
+    def test_non_post_filename_skipped(self, tmp_path):
+        """날짜 없는 파일명은 무시"""
+        assert parse_post(_post(tmp_path / "README.md", "x", "y")) is None
+
+
+class TestBuildIndex:
+    """인덱스 빌드 테스트"""
+
+    def test_postings_delta_encoded(self):
+        """최신순 문서 ID, 차분 인코딩"""
+        posts = [
+            {"url": f"/p{i}", "title": "t", "date": "d", "categories": [], "tags": [], "body": body}
+            for i, body in enumerate(["fomc 회의", "금리", "fomc 금리"])
+        ]
+        meta, shards = build_index(posts, shard_count=4)
+
+        assert len(meta["docs"]) == 3
+        assert shards[shard_of("fomc", 4)]["fomc"] == [0, 2]
+        assert shards[shard_of("금리", 4)]["금리"] == [1, 1]
+
+    def test_writes_only_changes(self, tmp_path):
+        """두 번째 빌드는 아무것도 다시 쓰지 않음, 남은 샤드 삭제"""
+        _post(tmp_path / "posts" / "market" / "2026-01-28-a.md", "연준 회의", "FOMC 금리 동결")
+        _post(tmp_path / "posts" / "essays" / "2026-01-27-b.md", "에세이", "투자 일기", "[essays]")
+        out = tmp_path / "search"
+        (out).mkdir()
+        (out / "shard-99.json").write_text("{}", encoding="utf-8")
+
+        stats = build_search_index(tmp_path / "posts", out, shard_count=4)
+        assert stats["docs"] == 2
+        assert stats["written"] == 5
+        assert not (out / "shard-99.json").exists()
+        assert build_search_index(tmp_path / "posts", out, shard_count=4)["written"] == 0
+
+        meta = json.loads((out / "meta.json").read_text(encoding="utf-8"))
+        assert meta["docs"][0][0] == "/market/briefing/2026/01/28/a"
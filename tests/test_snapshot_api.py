@@ -0,0 +1,67 @@
+"""snapshot_api.py 테스트"""
+import json
+from datetime import datetime
+
+from snapshot_api import SnapshotAPI, dumps, symbol_id
+
+
+def _data(price: float) -> dict:
+    return {
+        "timestamp": "2026-01-28 06:00:00",
+        "us_indices": {"S&P 500": {"price": price, "change": 0.5}},
+        "crypto": {"BTC": {"price_usd": 100000.0, "change_24h": float("nan")}},
+        "fear_greed": {"value": 55},
+    }
+
+
+class TestSnapshotAPI:
+    """정적 API 발행 테스트"""
+
+    def test_dumps_compact_and_nan_safe(self):
+        """키 정렬, 공백 없음, NaN → null"""
+        assert dumps({"b": float("nan"), "a": 1}) == '{"a":1,"b":null}'
+
+    def test_symbol_id(self):
+        """티커 → 파일명"""
+        assert symbol_id("^GSPC") == "gspc"
+        assert symbol_id("KRW=X") == "krw-x"
+
+    def test_publish_layout(self, tmp_path):
+        """일별/latest/심볼/index 파일 생성"""
+        api = SnapshotAPI(tmp_path)
+        stats = api.publish(_data(6000.0), datetime(2026, 1, 28, 6))
+
+        assert stats == {"symbols": 2, "written": 5}
+        latest = json.loads((tmp_path / "latest.json").read_text(encoding="utf-8"))
+        assert latest["date"] == "2026-01-28"
+        assert "timestamp" not in latest["data"]
+        assert latest["data"]["crypto"]["BTC"]["change_24h"] is None
+        assert (tmp_path / "daily" / "2026-01-28.json").read_text(encoding="utf-8") == \
+            (tmp_path / "latest.json").read_text(encoding="utf-8")
+
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert index["days"] == ["2026-01-28"]
+        assert index["symbols"]["us_indices/S&P 500"] == "symbols/us_indices/gspc.json"
+
+    def test_series_accumulates_and_skips_unchanged(self, tmp_path):
+        """날짜별 값이 누적되고, 같은 데이터 재발행 시 파일을 다시 쓰지 않음"""
+        api = SnapshotAPI(tmp_path)
+        api.publish(_data(6000.0), datetime(2026, 1, 27, 6))
+        api.publish(_data(6100.0), datetime(2026, 1, 28, 6))
+        assert api.publish(_data(6100.0), datetime(2026, 1, 28, 6))["written"] == 0
+
+        series = json.loads((tmp_path / "symbols" / "us_indices" / "gspc.json").read_text(encoding="utf-8"))
+        assert series["ticker"] == "^GSPC"
+        assert series["points"] == [["2026-01-27", 6000.0, 0.5], ["2026-01-28", 6100.0, 0.5]]
+
+    def test_backfill_keeps_latest(self, tmp_path):
+        """과거 날짜를 발행해도 latest.json은 최신 날짜 유지"""
+        api = SnapshotAPI(tmp_path)
+        api.publish(_data(6100.0), datetime(2026, 1, 28, 6))
+        api.publish(_data(6000.0), datetime(2026, 1, 27, 6))
+
+        latest = json.loads((tmp_path / "latest.json").read_text(encoding="utf-8"))
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert latest["date"] == "2026-01-28"
+        assert index["latest"] == "2026-01-28"
+        assert index["days"] == ["2026-01-27", "2026-01-28"]
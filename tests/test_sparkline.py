@@ -0,0 +1,45 @@
+"""sparkline.py 테스트"""
+import numpy as np
+
+from sparkline import HEIGHT, PADDING, WIDTH, render_sparklines, simplify, to_coordinates
+
+
+class TestSparkline:
+    """스파크라인 생성 테스트"""
+
+    def test_coordinates_normalized_per_row(self):
+        """행별 min-max 정규화, 큰 값이 위(작은 y)"""
+        ys = to_coordinates(np.array([[1.0, 2.0, 3.0], [100.0, 50.0, 0.0]]))
+        assert ys[0, 0] == HEIGHT - PADDING and ys[0, -1] == PADDING
+        assert ys[1, 0] == PADDING and ys[1, -1] == HEIGHT - PADDING
+
+    def test_simplify_collinear(self):
+        """일직선 위의 점은 양 끝만 남김"""
+        points = np.column_stack((np.arange(10.0), np.arange(10.0) * 0.5))
+        assert simplify(points).tolist() == [[0.0, 0.0], [9.0, 4.5]]
+
+    def test_simplify_keeps_peak(self):
+        """허용 오차보다 큰 꼭짓점은 유지"""
+        points = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 5.0], [3.0, 0.0], [4.0, 0.0]])
+        assert [2.0, 5.0] in simplify(points).tolist()
+
+    def test_render_batch(self):
+        """행마다 SVG, 점이 부족하면 None, 추세 클래스"""
+        matrix = np.array([
+            np.linspace(1, 2, 30),
+            [np.nan] * 29 + [1.0],
+            np.linspace(2, 1, 30),
+        ])
+        up, missing, down = render_sparklines(matrix)
+
+        assert missing is None
+        assert 'class="spark chg-up"' in up and f'viewBox="0 0 {WIDTH} {HEIGHT}"' in up
+        assert 'class="spark chg-down"' in down
+        # 직선은 두 점으로 단순화
+        assert up.count(" ") < 15
+
+    def test_render_handles_leading_gaps(self):
+        """앞쪽 NaN(히스토리 부족)은 건너뛰고 그림"""
+        matrix = np.array([[np.nan] * 27 + [1.0, 3.0, 2.0]])
+        (svg,) = render_sparklines(matrix)
+        assert svg is not None and "nan" not in svg
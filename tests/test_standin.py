@@ -0,0 +1,91 @@
+"""benchmarks/standin.py 스탠드인 서버로 provider 전 구간 테스트"""
+import pytest
+import requests
+
+from benchmarks.standin import StandinServer
+from config import config
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """스탠드인 서버 시작 + config를 서버 주소로 변경"""
+    with StandinServer() as server:
+        for name, value in server.env().items():
+            monkeypatch.setattr(config, name, value)
+        monkeypatch.setattr(config, "TELEGRAM_MESSAGE_DELAY", 0)
+        yield server
+
+
+class TestStandinServer:
+    """스탠드인 응답/주입 테스트"""
+
+    def test_deterministic_responses(self, standin):
+        """같은 요청은 같은 응답"""
+        url = f"{standin.url}/coingecko/simple/price"
+        first = requests.get(url, params={"ids": "bitcoin"}, timeout=5).json()
+        assert first == requests.get(url, params={"ids": "bitcoin"}, timeout=5).json()
+        assert set(first["bitcoin"]) == {"usd", "krw", "usd_24h_change"}
+
+    def test_error_injection(self):
+        """error_rate=1이면 모두 500"""
+        with StandinServer(error_rate=1.0) as server:
+            response = requests.get(f"{server.url}/fng/", timeout=5)
+            assert response.status_code == 500
+            assert server.stats[("alternative_me", 500)] == 1
+
+    def test_rate_limit(self):
+        """초당 한도를 넘으면 429 + Retry-After"""
+        with StandinServer(rate_limit=2) as server:
+            codes = [requests.get(f"{server.url}/fng/", timeout=5).status_code for _ in range(4)]
+            assert codes[:2] == [200, 200]
+            assert 429 in codes[2:]
+
+
+class TestPipelineOffline:
+    """실제 수집기/알림기를 스탠드인에 연결"""
+
+    def test_fetch_all(self, standin):
+        """모든 provider 데이터가 채워짐"""
+        from data_fetcher import DataFetcher
+
+        fetcher = DataFetcher()
+        data = fetcher.fetch_all()
+
+        assert len(data["crypto"]) == len(config.universe.crypto)
+        assert data["us_indices"]["S&P 500"].price > 0
+        assert data["crypto"]["BTC"].price_krw is not None
+        assert len(fetcher.closes) == len(config.universe.all_symbols)
+        snapshot = fetcher.snapshot
+        assert len(snapshot) == len(config.universe.all_symbols) + len(config.universe.crypto)
+        assert (snapshot.volumes[snapshot.rows("us_indices")] > 0).all()
+        assert data["economic_indicators"]["monthly"]["CPI (YoY)"]["value"] is not None
+        assert data["fear_greed"]["crypto"]["value"] is not None
+        assert standin.stats[("yahoo_chart", 200)] == len(config.universe.all_symbols)
+
+    def test_telegram_send(self, standin, sample_market_data):
+        """Bot API 호출이 스탠드인으로 전달됨"""
+        from telegram_notifier import TelegramNotifier
+
+        notifier = TelegramNotifier()
+        assert notifier.send_sync(sample_market_data, "https://example.com/post")
+        assert len(standin.messages) == len(notifier._build_full_briefing(sample_market_data, "https://example.com/post"))
+        assert "찬희의 투자노트" in standin.messages[0]
+
+    def test_breadth_history(self, standin, tmp_path, monkeypatch):
+        """BREADTH_FILE 구성 종목을 1년치 받아 지수별 시장 폭 계산"""
+        from breadth import compute_market_breadth
+        from data_fetcher import DataFetcher
+
+        path = tmp_path / "breadth.yaml"
+        path.write_text("indices:\n  a:\n    name: A\n    symbols: [AAA, BBB, CCC]\n"
+                        "  b:\n    symbols: [CCC, DDD]\n", encoding="utf-8")
+        monkeypatch.setattr(config, "BREADTH_FILE", str(path))
+
+        fetcher = DataFetcher()
+        fetcher._fetch_breadth_history()
+
+        assert fetcher.breadth_closes.shape == (252, 4)
+        breadth = compute_market_breadth(fetcher.breadth_closes, fetcher.breadth_indices)
+        assert [index["count"] for index in breadth["indices"]] == [3, 2]
+        index = breadth["indices"][0]
+        assert index["advancers"] + index["decliners"] + index["unchanged"] == 3
@@ -0,0 +1,101 @@
+"""universe.py 테스트"""
+import os
+import pytest
+from universe import UniverseError, compile_universe, load_universe
+
+
+def _write_universe(path, extra=""):
+    path.write_text(
+        """
+crypto:
+  bitcoin: BTC
+categories:
+  us_indices:
+    config_key: US_INDICES
+    symbols:
+      S&P 500: "^GSPC"
+      NASDAQ: "^IXIC"
+  global_indices:
+    config_key: GLOBAL_INDICES
+    symbols:
+      KOSPI: "^KS11"
+      DAX: "^GDAXI"
+display_groups:
+  global_indices:
+    아시아: [KOSPI]
+    유럽: [DAX]
+""" + extra,
+        encoding="utf-8",
+    )
+
+
+class TestUniverse:
+    """유니버스 로드/컴파일 테스트"""
+
+    def test_default_universe_matches_config(self):
+        """기본 universe.yml이 Config 속성과 일치"""
+        from config import config
+        universe = load_universe()
+        assert universe.symbol_map["^GSPC"] == ("us_indices", "S&P 500")
+        assert dict(universe.symbols["mag7"]) == config.MAG7_STOCKS
+        assert list(universe.crypto) == config.CRYPTO_IDS
+        assert universe.group("global_indices", "유럽") == ("DAX", "FTSE 100")
+
+    def test_compiled_tables(self, tmp_path):
+        """조회 테이블 컴파일 결과"""
+        path = tmp_path / "universe.yml"
+        _write_universe(path)
+        universe = load_universe(str(path))
+
+        assert universe.categories == ("us_indices", "global_indices")
+        assert universe.all_symbols == ("^GSPC", "^IXIC", "^KS11", "^GDAXI")
+        assert universe.category_symbols["global_indices"] == ("^KS11", "^GDAXI")
+        assert universe.config_keys["us_indices"] == "US_INDICES"
+        assert universe.group("global_indices", "아시아") == ("KOSPI",)
+        assert universe.group("global_indices", "없음") == ()
+
+    def test_tables_are_immutable(self, tmp_path):
+        """컴파일 결과는 수정 불가"""
+        path = tmp_path / "universe.yml"
+        _write_universe(path)
+        universe = load_universe(str(path))
+
+        with pytest.raises(TypeError):
+            universe.symbol_map["AAPL"] = ("mag7", "애플")
+
+    def test_cached_until_mtime_changes(self, tmp_path):
+        """mtime이 같으면 캐시, 바뀌면 재컴파일"""
+        path = tmp_path / "universe.yml"
+        _write_universe(path)
+        first = load_universe(str(path))
+        assert load_universe(str(path)) is first
+
+        _write_universe(path, "\n# changed\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_universe(str(path)) is not first
+
+    def test_duplicate_symbol_rejected(self):
+        """카테고리 간 심볼 중복은 오류"""
+        raw = {
+            "categories": {
+                "a": {"symbols": {"x": "AAPL"}},
+                "b": {"symbols": {"y": "AAPL"}},
+            }
+        }
+        with pytest.raises(UniverseError, match="심볼 중복"):
+            compile_universe(raw)
+
+    def test_unknown_group_member_rejected(self):
+        """표시 그룹에 없는 이름은 오류"""
+        raw = {
+            "categories": {"a": {"symbols": {"x": "AAPL"}}},
+            "display_groups": {"a": {"g": ["y"]}},
+        }
+        with pytest.raises(UniverseError):
+            compile_universe(raw)
+
+    def test_missing_file(self, tmp_path):
+        """파일이 없으면 UniverseError"""
+        with pytest.raises(UniverseError):
+            load_universe(str(tmp_path / "none.yml"))